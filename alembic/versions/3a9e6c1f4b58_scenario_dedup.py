@@ -0,0 +1,140 @@
+"""scenario dedup
+
+Revision ID: 3a9e6c1f4b58
+Revises: b7d41e0c9a25
+Create Date: 2026-10-18 13:00:00.000000
+
+scenarios に内容のハッシュ(content_hash)と近似重複の参照先(near_duplicate_of)を追加し、
+MinHash LSHのバンドを保持する scenario_lsh_bands を作成する。
+既存の行は作成順に1000件ずつハッシュとバンドを計算して埋める。内容が同じ2件目以降の行は削除せず、
+content_hashをNULLのままにしてnear_duplicate_ofに最初の行のIDを記録する。
+"""
+from typing import Dict, List, Sequence, Set, Tuple, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from domain.scenario_fingerprint import NearDuplicateIndex, ScenarioBandKeys, ScenarioContentHash, ScenarioMinHash
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a9e6c1f4b58'
+down_revision: Union[str, Sequence[str], None] = 'b7d41e0c9a25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BACKFILL_BATCH_SIZE = 1000
+NEAR_DUPLICATE_FK = 'fk_scenarios_near_duplicate_of'
+
+
+def _id_type() -> sa.types.TypeEngine:
+    """scenarios.id と同じ型 (DB_UUID_STORAGEに応じてVARCHAR(36)またはBINARY(16)) を返す"""
+    data_type = op.get_bind().execute(sa.text(
+        "SELECT DATA_TYPE FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'scenarios' AND COLUMN_NAME = 'id'"
+    )).scalar()
+    return sa.BINARY(16) if data_type == 'binary' else sa.String(length=36)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    id_type = _id_type()
+    op.add_column('scenarios', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.add_column('scenarios', sa.Column('near_duplicate_of', id_type, nullable=True))
+    op.create_table('scenario_lsh_bands',
+    sa.Column('band', sa.SmallInteger(), autoincrement=False, nullable=False),
+    sa.Column('band_key', sa.BigInteger(), autoincrement=False, nullable=False),
+    sa.Column('scenario_id', id_type, nullable=False),
+    sa.ForeignKeyConstraint(['scenario_id'], ['scenarios.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('band', 'band_key', 'scenario_id')
+    )
+    op.create_index('ix_scenario_lsh_bands_scenario_id', 'scenario_lsh_bands', ['scenario_id'], unique=False)
+
+    _backfill()
+
+    # 重複を解消した後でユニークインデックスを作る
+    op.create_index('ux_scenarios_content_hash', 'scenarios', ['content_hash'], unique=True)
+    op.create_index('ix_scenarios_near_duplicate_of', 'scenarios', ['near_duplicate_of'], unique=False)
+    op.create_foreign_key(NEAR_DUPLICATE_FK, 'scenarios', 'scenarios', ['near_duplicate_of'], ['id'], ondelete='SET NULL')
+
+
+def _backfill() -> None:
+    conn = op.get_bind()
+    select_batch = sa.text(
+        "SELECT id, state, method_group, target_method, created_at FROM scenarios "
+        "WHERE (created_at, id) > (:created_at, :id) "
+        "ORDER BY created_at, id LIMIT :limit"
+    )
+    find_hashes = sa.text(
+        "SELECT content_hash, id FROM scenarios WHERE content_hash IN :hashes"
+    ).bindparams(sa.bindparam('hashes', expanding=True))
+    update_row = sa.text(
+        "UPDATE scenarios SET content_hash = :content_hash, near_duplicate_of = :near_duplicate_of WHERE id = :id"
+    )
+    insert_band = sa.text(
+        "INSERT INTO scenario_lsh_bands (band, band_key, scenario_id) VALUES (:band, :band_key, :scenario_id)"
+    )
+
+    # 作成順のキーセットで読み進める。初期値はどの行よりも前に並ぶ値
+    last = {'created_at': '1000-01-01 00:00:00', 'id': ''}
+    while True:
+        rows = conn.execute(select_batch, {**last, 'limit': BACKFILL_BATCH_SIZE}).fetchall()
+        if not rows:
+            break
+        last = {'created_at': rows[-1].created_at, 'id': rows[-1].id}
+
+        hashes = [ScenarioContentHash(r.state, r.method_group, r.target_method) for r in rows]
+        first_by_hash: Dict[str, object] = {
+            h: scenario_id for h, scenario_id in conn.execute(find_hashes, {'hashes': list(set(hashes))})
+        }
+
+        updates: List[dict] = []
+        canonical = []
+        for row, content_hash in zip(rows, hashes):
+            if content_hash in first_by_hash:
+                updates.append({'content_hash': None, 'near_duplicate_of': first_by_hash[content_hash], 'id': row.id})
+            else:
+                first_by_hash[content_hash] = row.id
+                keys = ScenarioBandKeys(ScenarioMinHash(row.state, row.method_group, row.target_method))
+                canonical.append((row, content_hash, keys))
+
+        index = _load_band_index(conn, {key for _, _, keys in canonical for key in keys})
+        bands: List[dict] = []
+        for row, content_hash, keys in canonical:
+            near = index.find(keys)
+            updates.append({'content_hash': content_hash, 'near_duplicate_of': near, 'id': row.id})
+            if near is None:
+                index.add(row.id, keys)
+                bands.extend({'band': band, 'band_key': band_key, 'scenario_id': row.id} for band, band_key in keys)
+
+        conn.execute(update_row, updates)
+        if bands:
+            conn.execute(insert_band, bands)
+
+
+def _load_band_index(conn, keys: Set[Tuple[int, int]]) -> NearDuplicateIndex:
+    """指定したバンドのうち、scenario_lsh_bandsに登録済みのものを読み込む"""
+    index = NearDuplicateIndex()
+    keys = list(keys)
+    for start in range(0, len(keys), BACKFILL_BATCH_SIZE):
+        chunk = keys[start:start + BACKFILL_BATCH_SIZE]
+        pairs = ", ".join(f"(:band_{i}, :key_{i})" for i in range(len(chunk)))
+        params = {}
+        for i, (band, band_key) in enumerate(chunk):
+            params[f'band_{i}'] = band
+            params[f'key_{i}'] = band_key
+        query = sa.text(f"SELECT band, band_key, scenario_id FROM scenario_lsh_bands WHERE (band, band_key) IN ({pairs})")
+        for band, band_key, scenario_id in conn.execute(query, params):
+            index.add(scenario_id, [(band, band_key)])
+    return index
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(NEAR_DUPLICATE_FK, 'scenarios', type_='foreignkey')
+    op.drop_index('ix_scenarios_near_duplicate_of', table_name='scenarios')
+    op.drop_index('ux_scenarios_content_hash', table_name='scenarios')
+    op.drop_table('scenario_lsh_bands')
+    op.drop_column('scenarios', 'near_duplicate_of')
+    op.drop_column('scenarios', 'content_hash')
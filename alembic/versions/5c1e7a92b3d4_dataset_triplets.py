@@ -0,0 +1,72 @@
+"""dataset_triplets
+
+Revision ID: 5c1e7a92b3d4
+Revises: d98ec53b546c
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e7a92b3d4'
+down_revision: Union[str, Sequence[str], None] = 'd98ec53b546c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('dataset_triplets',
+    sa.Column('dataset_id', sa.String(length=36), nullable=False),
+    sa.Column('triplet_id', sa.String(length=36), nullable=False),
+    sa.Column('position', sa.Integer(), autoincrement=False, nullable=False),
+    sa.ForeignKeyConstraint(['dataset_id'], ['datasets.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('dataset_id', 'position')
+    )
+    op.create_index('ix_dataset_triplets_triplet_id', 'dataset_triplets', ['triplet_id'], unique=False)
+    op.add_column('datasets', sa.Column('triplet_count', sa.Integer(), server_default='0', nullable=False))
+
+    # 既存のJSON配列を1要素1行に展開して移行する (MySQL 8.0のJSON_TABLEを使用)
+    op.execute("""
+        INSERT INTO dataset_triplets (dataset_id, triplet_id, position)
+        SELECT d.id, jt.triplet_id, jt.ord - 1
+        FROM datasets d,
+             JSON_TABLE(
+                 d.triplet_ids, '$[*]'
+                 COLUMNS (ord FOR ORDINALITY, triplet_id VARCHAR(36) PATH '$')
+             ) AS jt
+        WHERE d.triplet_ids IS NOT NULL
+    """)
+    op.execute("""
+        UPDATE datasets
+        SET triplet_count = COALESCE(JSON_LENGTH(triplet_ids), 0)
+    """)
+
+    op.drop_column('datasets', 'triplet_ids')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('datasets', sa.Column('triplet_ids', sa.JSON(), nullable=True))
+
+    # positionの順にJSON配列へ戻す。GROUP_CONCATの既定の上限(1024バイト)で切り詰められないよう広げておく
+    op.execute("SET SESSION group_concat_max_len = 4294967295")
+    op.execute("""
+        UPDATE datasets d
+        SET d.triplet_ids = COALESCE(
+            (
+                SELECT CAST(CONCAT('[', GROUP_CONCAT(JSON_QUOTE(dt.triplet_id) ORDER BY dt.position SEPARATOR ','), ']') AS JSON)
+                FROM dataset_triplets dt
+                WHERE dt.dataset_id = d.id
+            ),
+            JSON_ARRAY()
+        )
+    """)
+
+    op.drop_column('datasets', 'triplet_count')
+    op.drop_index('ix_dataset_triplets_triplet_id', table_name='dataset_triplets')
+    op.drop_table('dataset_triplets')
@@ -0,0 +1,70 @@
+"""query indexes
+
+Revision ID: 8f3b2d6e1a07
+Revises: 5c1e7a92b3d4
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3b2d6e1a07'
+down_revision: Union[str, Sequence[str], None] = '5c1e7a92b3d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 一覧APIのキーセットページネーション (ORDER BY created_at DESC, id DESC と
+# WHERE (created_at, id) < (%s, %s)) をインデックスの範囲スキャンで処理するためのインデックス
+CREATED_AT_INDEXES = [
+    ('ix_scenarios_created_at_id', 'scenarios'),
+    ('ix_training_ready_scenarios_created_at_id', 'training_ready_scenarios'),
+    ('ix_triplets_created_at_id', 'triplets'),
+    ('ix_trained_models_created_at_id', 'trained_models'),
+    ('ix_datasets_created_at_id', 'datasets'),
+]
+
+# 外部キー列のインデックス。(インデックス名, テーブル, 列, 最初のリビジョンで作られた外部キー制約名)
+# MySQLは外部キー用のインデックスを暗黙に作るが、名前と構成を明示しておく。
+# - triplets.training_ready_scenario_id: find_unformedのNOT EXISTSが参照するカバリングインデックス
+# - individual_evaluation_results.model_evaluation_session_id: find_by_session_id
+FOREIGN_KEY_INDEXES = [
+    ('ix_training_ready_scenarios_scenario_id', 'training_ready_scenarios', 'scenario_id',
+     'training_ready_scenarios_ibfk_1', 'scenarios'),
+    ('ix_triplets_training_ready_scenario_id', 'triplets', 'training_ready_scenario_id',
+     'triplets_ibfk_1', 'training_ready_scenarios'),
+    ('ix_trained_models_dataset_id', 'trained_models', 'dataset_id',
+     'trained_models_ibfk_1', 'datasets'),
+    ('ix_model_evaluation_sessions_dataset_id', 'model_evaluation_sessions', 'dataset_id',
+     'model_evaluation_sessions_ibfk_1', 'datasets'),
+    ('ix_model_evaluation_sessions_trained_model_id', 'model_evaluation_sessions', 'trained_model_id',
+     'model_evaluation_sessions_ibfk_2', 'trained_models'),
+    ('ix_individual_evaluation_results_session_id', 'individual_evaluation_results', 'model_evaluation_session_id',
+     'individual_evaluation_results_ibfk_1', 'model_evaluation_sessions'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for index_name, table in CREATED_AT_INDEXES:
+        op.create_index(index_name, table, ['created_at', 'id'], unique=False)
+
+    for index_name, table, column, _, _ in FOREIGN_KEY_INDEXES:
+        op.create_index(index_name, table, [column], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for index_name, table, column, fk_name, referent in reversed(FOREIGN_KEY_INDEXES):
+        # 明示したインデックスが外部キーを支えている場合は削除できないため、
+        # 外部キー制約を一度外してから作り直し、暗黙のインデックスに戻す
+        op.drop_constraint(fk_name, table, type_='foreignkey')
+        op.drop_index(index_name, table_name=table)
+        op.create_foreign_key(fk_name, table, referent, [column], ['id'])
+
+    for index_name, table in reversed(CREATED_AT_INDEXES):
+        op.drop_index(index_name, table_name=table)
@@ -0,0 +1,101 @@
+"""binary uuid storage
+
+Revision ID: b7d41e0c9a25
+Revises: 8f3b2d6e1a07
+Create Date: 2026-10-18 12:00:00.000000
+
+DB_UUID_STORAGE=binary16 の場合だけ、すべてのID列を VARCHAR(36) から BINARY(16) に変換する。
+それ以外の場合は何もしないため、既定の char36 の環境では適用しても影響はない。
+列の変換は MODIFY で行うため、主キーとインデックスは作り直さずにそのまま引き継がれる。
+"""
+import os
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d41e0c9a25'
+down_revision: Union[str, Sequence[str], None] = '8f3b2d6e1a07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 変換対象のID列 (テーブル, 列)。いずれもNOT NULL
+ID_COLUMNS = [
+    ('datasets', 'id'),
+    ('dataset_triplets', 'dataset_id'),
+    ('dataset_triplets', 'triplet_id'),
+    ('scenarios', 'id'),
+    ('training_ready_scenarios', 'id'),
+    ('training_ready_scenarios', 'scenario_id'),
+    ('triplets', 'id'),
+    ('triplets', 'training_ready_scenario_id'),
+    ('trained_models', 'id'),
+    ('trained_models', 'dataset_id'),
+    ('model_evaluation_sessions', 'id'),
+    ('model_evaluation_sessions', 'trained_model_id'),
+    ('model_evaluation_sessions', 'dataset_id'),
+    ('individual_evaluation_results', 'id'),
+    ('individual_evaluation_results', 'model_evaluation_session_id'),
+    ('individual_evaluation_results', 'test_data_id'),
+]
+
+# 列の型を変える間は外す必要がある外部キー制約 (制約名, テーブル, 列, 参照先, ON DELETE)
+FOREIGN_KEYS = [
+    ('dataset_triplets_ibfk_1', 'dataset_triplets', 'dataset_id', 'datasets', 'CASCADE'),
+    ('training_ready_scenarios_ibfk_1', 'training_ready_scenarios', 'scenario_id', 'scenarios', None),
+    ('triplets_ibfk_1', 'triplets', 'training_ready_scenario_id', 'training_ready_scenarios', None),
+    ('trained_models_ibfk_1', 'trained_models', 'dataset_id', 'datasets', None),
+    ('model_evaluation_sessions_ibfk_1', 'model_evaluation_sessions', 'dataset_id', 'datasets', None),
+    ('model_evaluation_sessions_ibfk_2', 'model_evaluation_sessions', 'trained_model_id', 'trained_models', None),
+    ('individual_evaluation_results_ibfk_1', 'individual_evaluation_results', 'model_evaluation_session_id',
+     'model_evaluation_sessions', None),
+]
+
+
+def _is_binary() -> bool:
+    """scenarios.id の現在の型から、すでにBINARY(16)に変換済みかを判定する"""
+    data_type = op.get_bind().execute(sa.text(
+        "SELECT DATA_TYPE FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'scenarios' AND COLUMN_NAME = 'id'"
+    )).scalar()
+    return data_type == 'binary'
+
+
+def _drop_foreign_keys() -> None:
+    for name, table, _, _, _ in FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_='foreignkey')
+
+
+def _create_foreign_keys() -> None:
+    for name, table, column, referent, ondelete in FOREIGN_KEYS:
+        op.create_foreign_key(name, table, referent, [column], ['id'], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if os.getenv('DB_UUID_STORAGE', 'char36') != 'binary16' or _is_binary():
+        return
+
+    _drop_foreign_keys()
+    for table, column in ID_COLUMNS:
+        # 文字列をバイト列として扱える型に移してから16バイトに詰め直し、最後にBINARY(16)にする
+        op.execute(f"ALTER TABLE {table} MODIFY {column} VARBINARY(36) NOT NULL")
+        op.execute(f"UPDATE {table} SET {column} = UUID_TO_BIN({column})")
+        op.execute(f"ALTER TABLE {table} MODIFY {column} BINARY(16) NOT NULL")
+    _create_foreign_keys()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not _is_binary():
+        return
+
+    _drop_foreign_keys()
+    for table, column in ID_COLUMNS:
+        op.execute(f"ALTER TABLE {table} MODIFY {column} VARBINARY(36) NOT NULL")
+        op.execute(f"UPDATE {table} SET {column} = BIN_TO_UUID({column})")
+        op.execute(f"ALTER TABLE {table} MODIFY {column} VARCHAR(36) NOT NULL")
+    _create_foreign_keys()
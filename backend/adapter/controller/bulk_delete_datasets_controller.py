@@ -0,0 +1,26 @@
+from typing import Dict, Union
+from usecase.bulk_delete_datasets import (
+    BulkDeleteDatasetsUseCase,
+    BulkDeleteDatasetsInput,
+    BulkDeleteDatasetsOutput,
+)
+
+
+class BulkDeleteDatasetsController:
+    def __init__(self, uc: BulkDeleteDatasetsUseCase):
+        self.uc = uc
+
+    def execute(
+        self, input_data: BulkDeleteDatasetsInput
+    ) -> Dict[str, Union[int, BulkDeleteDatasetsOutput, Dict[str, str]]]:
+        try:
+            output, err = self.uc.execute(input_data)
+            if isinstance(err, ValueError):
+                return {"status": 400, "data": {"error": str(err)}}
+            if err:
+                return {"status": 500, "data": {"error": str(err)}}
+
+            return {"status": 200, "data": output}
+
+        except Exception as e:
+            return {"status": 500, "data": {"error": "An unexpected error occurred"}}
@@ -0,0 +1,26 @@
+from typing import Dict, Union
+from usecase.bulk_delete_triplets import (
+    BulkDeleteTripletsUseCase,
+    BulkDeleteTripletsInput,
+    BulkDeleteTripletsOutput,
+)
+
+
+class BulkDeleteTripletsController:
+    def __init__(self, uc: BulkDeleteTripletsUseCase):
+        self.uc = uc
+
+    def execute(
+        self, input_data: BulkDeleteTripletsInput
+    ) -> Dict[str, Union[int, BulkDeleteTripletsOutput, Dict[str, str]]]:
+        try:
+            output, err = self.uc.execute(input_data)
+            if isinstance(err, ValueError):
+                return {"status": 400, "data": {"error": str(err)}}
+            if err:
+                return {"status": 500, "data": {"error": str(err)}}
+
+            return {"status": 200, "data": output}
+
+        except Exception as e:
+            return {"status": 500, "data": {"error": "An unexpected error occurred"}}
@@ -1,6 +1,7 @@
 from typing import Dict, Union
 from usecase.find_all_dataset import (
     FindAllDatasetUseCase,
+    FindAllDatasetInput,
     FindAllDatasetOutput,
 )
 
@@ -9,13 +10,18 @@ class FindAllDatasetController:
     def __init__(self, uc: FindAllDatasetUseCase):
         self.uc = uc
 
-    def execute(self) -> Dict[str, Union[int, FindAllDatasetOutput, Dict[str, str]]]:
+    def execute(
+        self, input_data: FindAllDatasetInput
+    ) -> Dict[str, Union[int, FindAllDatasetOutput, Dict[str, str]]]:
         """
         Usecaseを実行し、結果を辞書形式で返す。
         """
         try:
             # Usecaseを実行して、出力とエラーを受け取る
-            output, err = self.uc.execute()
+            output, err = self.uc.execute(input_data)
+            if isinstance(err, ValueError):
+                # limitやcursorが不正な場合は、ステータス400を返す
+                return {"status": 400, "data": {"error": str(err)}}
             if err:
                 # エラーがあれば、ステータス500とエラーメッセージを返す
                 return {"status": 500, "data": {"error": str(err)}}
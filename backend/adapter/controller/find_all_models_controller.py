@@ -1,7 +1,8 @@
-from typing import Dict, Union, List
+from typing import Dict, Union
 from usecase.find_all_models import (
     FindAllModelsUseCase,
-    FindAllModelsOutput,
+    FindAllModelsInput,
+    FindAllModelsPageOutput,
 )
 
 
@@ -10,10 +11,12 @@ class FindAllModelsController:
         self.uc = uc
 
     def execute(
-        self,
-    ) -> Dict[str, Union[int, List[FindAllModelsOutput], Dict[str, str]]]:
+        self, input_data: FindAllModelsInput
+    ) -> Dict[str, Union[int, FindAllModelsPageOutput, Dict[str, str]]]:
         try:
-            output, err = self.uc.execute()
+            output, err = self.uc.execute(input_data)
+            if isinstance(err, ValueError):
+                return {"status": 400, "data": {"error": str(err)}}
             if err:
                 return {"status": 500, "data": {"error": str(err)}}
 
@@ -1,7 +1,8 @@
-from typing import Dict, Union, List
+from typing import Dict, Union
 from usecase.find_all_triplets import (
     FindAllTripletsUseCase,
-    FindAllTripletsOutput,
+    FindAllTripletsInput,
+    FindAllTripletsPageOutput,
 )
 
 
@@ -10,10 +11,12 @@ class FindAllTripletsController:
         self.uc = uc
 
     def execute(
-        self,
-    ) -> Dict[str, Union[int, List[FindAllTripletsOutput], Dict[str, str]]]:
+        self, input_data: FindAllTripletsInput
+    ) -> Dict[str, Union[int, FindAllTripletsPageOutput, Dict[str, str]]]:
         try:
-            output, err = self.uc.execute()
+            output, err = self.uc.execute(input_data)
+            if isinstance(err, ValueError):
+                return {"status": 400, "data": {"error": str(err)}}
             if err:
                 return {"status": 500, "data": {"error": str(err)}}
 
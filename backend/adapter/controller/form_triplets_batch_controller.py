@@ -0,0 +1,26 @@
+from typing import Dict, Union
+from usecase.form_triplets_batch import (
+    FormTripletsBatchUseCase,
+    FormTripletsBatchInput,
+    FormTripletsBatchOutput,
+)
+
+
+class FormTripletsBatchController:
+    def __init__(self, uc: FormTripletsBatchUseCase):
+        self.uc = uc
+
+    def execute(
+        self, input_data: FormTripletsBatchInput
+    ) -> Dict[str, Union[int, FormTripletsBatchOutput, Dict[str, str]]]:
+        try:
+            output, err = self.uc.execute(input_data)
+            if isinstance(err, ValueError):
+                return {"status": 400, "data": {"error": str(err)}}
+            if err:
+                return {"status": 500, "data": {"error": str(err)}}
+
+            return {"status": 201, "data": output}
+
+        except Exception as e:
+            return {"status": 500, "data": {"error": "An unexpected error occurred"}}
@@ -15,6 +15,8 @@ class GenerateScenariosController:
     ) -> Dict[str, Union[int, List[GenerateScenariosOutput], Dict[str, str]]]:
         try:
             output, err = self.uc.execute(input_data)
+            if isinstance(err, ValueError):
+                return {"status": 400, "data": {"error": str(err)}}
             if err:
                 return {"status": 500, "data": {"error": str(err)}}
 
@@ -0,0 +1,25 @@
+from typing import Any, Dict, Iterator, Union
+from usecase.generate_scenarios_stream import (
+    GenerateScenariosStreamUseCase,
+    GenerateScenariosStreamInput,
+)
+
+
+class GenerateScenariosStreamController:
+    def __init__(self, uc: GenerateScenariosStreamUseCase):
+        self.uc = uc
+
+    def execute(
+        self, input_data: GenerateScenariosStreamInput
+    ) -> Dict[str, Union[int, Iterator[Dict[str, Any]], Dict[str, str]]]:
+        try:
+            stream, err = self.uc.execute(input_data)
+            if isinstance(err, ValueError):
+                return {"status": 400, "data": {"error": str(err)}}
+            if err:
+                return {"status": 500, "data": {"error": str(err)}}
+
+            return {"status": 200, "data": stream}
+
+        except Exception as e:
+            return {"status": 500, "data": {"error": "An unexpected error occurred"}}
@@ -0,0 +1,27 @@
+from typing import Dict, Any, List
+from usecase.bulk_delete_datasets import BulkDeleteDatasetsPresenter
+from domain import UUID
+
+class BulkDeleteDatasetsPresenterImpl(BulkDeleteDatasetsPresenter):
+    def output(self, requested_ids: List[UUID], deleted_ids: List[UUID]) -> Dict[str, Any]:
+        """
+        リクエストされたIDごとの削除結果を、
+        JSONシリアライズ可能な辞書に変換して返す。
+        """
+        deleted = {uid.value for uid in deleted_ids}
+        # 重複したIDは最初の1件だけを結果に含める
+        unique_ids = list(dict.fromkeys(uid.value for uid in requested_ids))
+        return {
+            "results": [
+                {"ID": id_value, "status": "deleted" if id_value in deleted else "not_found"}
+                for id_value in unique_ids
+            ],
+            "deleted_count": len(deleted),
+            "message": f"{len(deleted)} dataset(s) deleted successfully.",
+        }
+
+def new_bulk_delete_datasets_presenter() -> BulkDeleteDatasetsPresenter:
+    """
+    BulkDeleteDatasetsPresenterImplのインスタンスを生成するファクトリ関数。
+    """
+    return BulkDeleteDatasetsPresenterImpl()
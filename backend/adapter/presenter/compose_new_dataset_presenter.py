@@ -16,6 +16,7 @@ class ComposeNewDatasetPresenterImpl(ComposeNewDatasetPresenter):
             "description": dataset.description,
             "type": dataset.type,
             "Triplet_ids": [tid.value for tid in dataset.Triplet_ids], # UUIDのリストを文字列のリストに変換
+            "triplet_count": dataset.triplet_count,
             "created_at": dataset.created_at.isoformat() # datetimeをISO形式の文字列に変換
         }
 
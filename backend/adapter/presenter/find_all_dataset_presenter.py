@@ -1,24 +1,27 @@
 from typing import List, Dict, Any
 from usecase.find_all_dataset import FindAllDatasetPresenter
-from domain import Dataset
+from domain import Dataset, Page
 
 class FindAllDatasetPresenterImpl(FindAllDatasetPresenter):
-    def output(self, datasets: List[Dataset]) -> List[Dict[str, Any]]:
+    def output(self, page: Page[Dataset]) -> Dict[str, Any]:
         """
-        Datasetドメインオブジェクトのリストを、
-        JSONシリアライズ可能な辞書のリストに変換して返す。
+        Datasetドメインオブジェクトの1ページ分を、
+        JSONシリアライズ可能な辞書 (items, next_cursor) に変換して返す。
         """
-        return [
-            {
-                "ID": d.ID.value,
-                "name": d.name,
-                "description": d.description,
-                "type": d.type,
-                "Triplet_ids": [tid.value for tid in d.Triplet_ids],
-                "created_at": d.created_at.isoformat()
-            }
-            for d in datasets
-        ]
+        return {
+            "items": [
+                {
+                    "ID": d.ID.value,
+                    "name": d.name,
+                    "description": d.description,
+                    "type": d.type,
+                    "triplet_count": d.triplet_count,
+                    "created_at": d.created_at.isoformat()
+                }
+                for d in page.items
+            ],
+            "next_cursor": page.next_cursor,
+        }
 
 def new_find_all_dataset_presenter() -> FindAllDatasetPresenter:
     """
@@ -0,0 +1,30 @@
+from typing import Dict, Any, List
+from usecase.form_triplets_batch import FormTripletsBatchPresenter
+from domain import Triplet, UUID
+
+class FormTripletsBatchPresenterImpl(FormTripletsBatchPresenter):
+    def output(self, triplets: List[Triplet], skipped_ids: List[UUID]) -> Dict[str, Any]:
+        """
+        生成したTripletのリストとスキップしたIDを、
+        JSONシリアライズ可能な辞書に変換して返す。
+        """
+        return {
+            "triplets": [
+                {
+                    "ID": t.ID.value,
+                    "TrainingReadyScenario_ID": t.TrainingReadyScenario_ID.value,
+                    "anchor": t.anchor,
+                    "positive": t.positive,
+                    "negative": t.negative,
+                    "created_at": t.created_at.isoformat(),
+                }
+                for t in triplets
+            ],
+            "skipped_ids": [sid.value for sid in skipped_ids],
+        }
+
+def new_form_triplets_batch_presenter() -> FormTripletsBatchPresenter:
+    """
+    FormTripletsBatchPresenterImplのインスタンスを生成するファクトリ関数。
+    """
+    return FormTripletsBatchPresenterImpl()
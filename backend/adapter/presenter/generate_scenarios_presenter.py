@@ -17,6 +17,7 @@ class GenerateScenariosPresenterImpl(GenerateScenariosPresenter):
             # 文字列をカンマで分割して配列に変換
             "negative_method_group": [method.strip() for method in scenario.negative_method_group.split(',')],
             "created_at": scenario.created_at.isoformat(), # created_atを追加
+            "near_duplicate_of": scenario.near_duplicate_of.value if scenario.near_duplicate_of else None,
         }
 
 def new_generate_scenarios_presenter() -> GenerateScenariosPresenter:
@@ -0,0 +1,31 @@
+from typing import Any, Dict
+from usecase.generate_scenarios_stream import GenerateScenariosStreamPresenter
+from domain import Scenario
+
+class GenerateScenariosStreamPresenterImpl(GenerateScenariosStreamPresenter):
+    """
+    NDJSONの1行になる辞書を返す。どの行も種類を表す "type" を持つ。
+    """
+    def scenario(self, scenario: Scenario) -> Dict[str, Any]:
+        return {
+            "type": "scenario",
+            "ID": scenario.ID.value,
+            "state": scenario.state,
+            "method_group": [method.strip() for method in scenario.method_group.split(',')],
+            "target_method": scenario.target_method,
+            "negative_method_group": [method.strip() for method in scenario.negative_method_group.split(',')],
+            "created_at": scenario.created_at.isoformat(),
+            "near_duplicate_of": scenario.near_duplicate_of.value if scenario.near_duplicate_of else None,
+        }
+
+    def progress(self, batch: int, persisted: int, total: int) -> Dict[str, Any]:
+        return {"type": "progress", "batch": batch, "persisted": persisted, "total": total}
+
+    def done(self, persisted: int) -> Dict[str, Any]:
+        return {"type": "done", "persisted": persisted}
+
+    def error(self, err: Exception, persisted: int) -> Dict[str, Any]:
+        return {"type": "error", "error": str(err), "persisted": persisted}
+
+def new_generate_scenarios_stream_presenter() -> GenerateScenariosStreamPresenter:
+    return GenerateScenariosStreamPresenterImpl()
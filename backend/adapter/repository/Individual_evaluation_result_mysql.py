@@ -23,9 +23,9 @@ class IndividualEvaluationResultMySQL(IndividualEvaluationResultRepository):
         try:
             self.db.execute(
                 query,
-                result.ID.value,
-                result.ModelEvaluationSession_ID.value,
-                result.test_data_id.value,
+                result.ID,
+                result.ModelEvaluationSession_ID,
+                result.test_data_id,
                 result.inference_time_ms,
                 result.power_consumption_mw,
                 result.llm_judge_score,
@@ -38,7 +38,7 @@ class IndividualEvaluationResultMySQL(IndividualEvaluationResultRepository):
     def find_by_id(self, result_id: UUID) -> Optional[IndividualEvaluationResult]:
         query = "SELECT * FROM individual_evaluation_results WHERE id = %s LIMIT 1"
         try:
-            row = self.db.query_row(query, result_id.value)
+            row = self.db.query_row(query, result_id)
             return self._scan_row_data(row.get_values())
         except Exception:
             return None
@@ -49,11 +49,11 @@ class IndividualEvaluationResultMySQL(IndividualEvaluationResultRepository):
         query = "SELECT * FROM individual_evaluation_results WHERE model_evaluation_session_id = %s"
         results = []
         try:
-            rows = self.db.query(query, session_id.value)
-            for row_data in rows:
-                result = self._scan_row_data(row_data)
-                if result:
-                    results.append(result)
+            with self.db.query_stream(query, session_id) as rows:
+                for row_data in rows:
+                    result = self._scan_row_data(row_data)
+                    if result:
+                        results.append(result)
             return results
         except Exception as e:
             raise RuntimeError(
@@ -74,13 +74,13 @@ class IndividualEvaluationResultMySQL(IndividualEvaluationResultRepository):
         try:
             self.db.execute(
                 query,
-                result.ModelEvaluationSession_ID.value,
-                result.test_data_id.value,
+                result.ModelEvaluationSession_ID,
+                result.test_data_id,
                 result.inference_time_ms,
                 result.power_consumption_mw,
                 result.llm_judge_score,
                 result.llm_judge_reasoning,
-                result.ID.value,
+                result.ID,
             )
         except Exception as e:
             raise RuntimeError(f"error updating individual evaluation result: {e}")
@@ -88,7 +88,7 @@ class IndividualEvaluationResultMySQL(IndividualEvaluationResultRepository):
     def delete(self, result_id: UUID) -> None:
         query = "DELETE FROM individual_evaluation_results WHERE id = %s"
         try:
-            self.db.execute(query, result_id.value)
+            self.db.execute(query, result_id)
         except Exception as e:
             raise RuntimeError(f"error deleting individual evaluation result: {e}")
 
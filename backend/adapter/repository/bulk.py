@@ -0,0 +1,126 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, TypeVar
+from domain import UUID
+from adapter.repository.sql import SQL, Tx, RowData
+
+T = TypeVar("T")
+
+# 1つのINSERT文にまとめる行数の既定値
+DEFAULT_CHUNK_SIZE = 500
+
+
+def chunked(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """シーケンスを最大size件ずつのチャンクに分割して返す。"""
+    if size < 1:
+        raise ValueError("chunk size must be at least 1")
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def build_multi_row_insert(table: str, columns: Sequence[str], row_count: int) -> str:
+    """INSERT ... VALUES (...), (...) 形式の複数行INSERT文を組み立てる。"""
+    placeholder = "(" + ", ".join(["%s"] * len(columns)) + ")"
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+        + ", ".join([placeholder] * row_count)
+    )
+
+
+def insert_many(
+    db: SQL,
+    table: str,
+    columns: Sequence[str],
+    rows: Sequence[Sequence[Any]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """
+    1つのトランザクション内で、chunk_size行ずつ複数行INSERTを発行する。
+    途中で失敗した場合はロールバックし、1行も書き込まない。
+    """
+    if not rows:
+        return
+
+    tx = db.begin_tx()
+    try:
+        insert_many_tx(tx, table, columns, rows, chunk_size)
+        tx.commit()
+    except Exception:
+        tx.rollback()
+        raise
+
+
+def insert_many_tx(
+    tx: Tx,
+    table: str,
+    columns: Sequence[str],
+    rows: Sequence[Sequence[Any]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """
+    呼び出し側が開始したトランザクション内で、chunk_size行ずつ複数行INSERTを発行する。
+    コミットとロールバックは呼び出し側の責務とする。
+    """
+    for chunk in chunked(rows, chunk_size):
+        query = build_multi_row_insert(table, columns, len(chunk))
+        params: List[Any] = [value for row in chunk for value in row]
+        tx.execute(query, *params)
+
+
+def find_by_id_values(
+    db: SQL,
+    table: str,
+    ids: Sequence[UUID],
+    scan: Callable[[RowData], Optional[T]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    select_columns: str = "*",
+) -> List[T]:
+    """
+    WHERE id IN (...) をchunk_size件ずつ発行して、複数の行をまとめて取得する。
+    結果は引数のID順に並べ、存在しないIDは結果に含めない。
+    """
+    # 重複を除きつつ、呼び出し側が渡した順序を保つ
+    unique_ids = list({uid.value: uid for uid in ids}.values())
+    found: Dict[str, T] = {}
+    for chunk in chunked(unique_ids, chunk_size):
+        placeholders = ", ".join(["%s"] * len(chunk))
+        query = f"SELECT {select_columns} FROM {table} WHERE id IN ({placeholders})"
+        for row_data in db.query(query, *chunk):
+            item = scan(row_data)
+            if item:
+                found[item.ID.value] = item
+    return [found[uid.value] for uid in unique_ids if uid.value in found]
+
+
+def delete_many(
+    db: SQL,
+    table: str,
+    ids: Sequence[UUID],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> List[UUID]:
+    """
+    1つのトランザクション内で、DELETE ... WHERE id IN (...) をchunk_size件ずつ発行する。
+    実際に削除されたIDを引数の順序で返し、存在しなかったIDは結果に含めない。
+    途中で失敗した場合はロールバックし、1行も削除しない。
+    """
+    unique_ids = list({uid.value: uid for uid in ids}.values())
+    if not unique_ids:
+        return []
+
+    deleted = set()
+    tx = db.begin_tx()
+    try:
+        for chunk in chunked(unique_ids, chunk_size):
+            placeholders = ", ".join(["%s"] * len(chunk))
+            # 削除対象の行をロックしつつ、存在するIDを確定させる
+            rows = tx.query(f"SELECT id FROM {table} WHERE id IN ({placeholders}) FOR UPDATE", *chunk)
+            found = {row_data[0] for row_data in rows}
+            targets = [uid for uid in chunk if uid.value in found]
+            if not targets:
+                continue
+            placeholders = ", ".join(["%s"] * len(targets))
+            tx.execute(f"DELETE FROM {table} WHERE id IN ({placeholders})", *targets)
+            deleted.update(found)
+        tx.commit()
+    except Exception:
+        tx.rollback()
+        raise
+    return [uid for uid in unique_ids if uid.value in deleted]
@@ -0,0 +1,94 @@
+import unittest
+from datetime import datetime
+
+from domain import Triplet, UUID
+from adapter.repository.bulk import build_multi_row_insert, chunked, delete_many, find_by_id_values
+
+
+class FakeSQL:
+    """IN句に含まれるIDに一致する行だけを返すモック"""
+    def __init__(self, rows):
+        self.rows = {row[0]: row for row in rows}
+        self.calls = []
+        self.committed = False
+
+    def query(self, query, *params):
+        self.calls.append((query, params))
+        # SQLアダプタと同様に、UUIDパラメータは文字列として比較する
+        return [self.rows[p.value] for p in params if p.value in self.rows]
+
+    def execute(self, query, *params):
+        self.calls.append((query, params))
+        if query.startswith("DELETE"):
+            for p in params:
+                self.rows.pop(p.value, None)
+
+    def begin_tx(self):
+        return self
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        pass
+
+
+def scan(row_data):
+    id_str, anchor = row_data
+    return Triplet(
+        ID=UUID(value=id_str),
+        TrainingReadyScenario_ID=UUID(value="trs"),
+        anchor=anchor,
+        positive="",
+        negative="",
+        created_at=datetime.now(),
+    )
+
+
+class TestChunked(unittest.TestCase):
+    def test_splits_into_fixed_size_chunks(self):
+        self.assertEqual(list(chunked([1, 2, 3, 4, 5], 2)), [[1, 2], [3, 4], [5]])
+
+    def test_rejects_non_positive_size(self):
+        with self.assertRaises(ValueError):
+            list(chunked([1], 0))
+
+
+class TestBuildMultiRowInsert(unittest.TestCase):
+    def test_builds_one_placeholder_group_per_row(self):
+        query = build_multi_row_insert("triplets", ("id", "anchor"), 3)
+        self.assertEqual(
+            query,
+            "INSERT INTO triplets (id, anchor) VALUES (%s, %s), (%s, %s), (%s, %s)",
+        )
+
+
+class TestFindByIdValues(unittest.TestCase):
+    def test_queries_in_chunks_and_keeps_input_order(self):
+        db = FakeSQL([("a", "A"), ("b", "B"), ("c", "C")])
+
+        ids = [UUID(value=v) for v in ["c", "missing", "a", "c", "b"]]
+        results = find_by_id_values(db, "triplets", ids, scan, chunk_size=2)
+
+        self.assertEqual([t.anchor for t in results], ["C", "A", "B"])
+        # 重複を除いた4件のIDが2件ずつ2回のクエリに分割される
+        self.assertEqual(len(db.calls), 2)
+        self.assertIn("WHERE id IN (%s, %s)", db.calls[0][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+class TestDeleteMany(unittest.TestCase):
+    def test_deletes_existing_ids_in_one_transaction(self):
+        db = FakeSQL([("a", "A"), ("b", "B"), ("c", "C")])
+
+        ids = [UUID(value=v) for v in ["c", "missing", "a", "c"]]
+        deleted = delete_many(db, "triplets", ids, chunk_size=2)
+
+        self.assertEqual([uid.value for uid in deleted], ["c", "a"])
+        self.assertEqual(list(db.rows), ["b"])
+        self.assertTrue(db.committed)
+        deletes = [q for q, _ in db.calls if q.startswith("DELETE")]
+        self.assertEqual(len(deletes), 2)
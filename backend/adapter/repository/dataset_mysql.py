@@ -1,95 +1,212 @@
-import json
 from datetime import datetime
-from typing import List, Optional
-from domain import Dataset, DatasetRepository, UUID
-from adapter.repository.sql import SQL, Row, Rows, RowData
+from typing import List, Optional, Sequence
+from domain import Dataset, Page, DatasetRepository, UUID
+from adapter.repository.bulk import DEFAULT_CHUNK_SIZE, delete_many, find_by_id_values, insert_many_tx
+from adapter.repository.pagination import find_keyset_page
+from adapter.repository.sql import SQL, Tx, Row, Rows, RowData
+
+# _scan_row_dataが期待する列の並び。メンバーのIDはdataset_tripletsに分離しているため含めない
+DATASET_COLUMNS = "id, name, description, type, triplet_count, created_at"
+
+# dataset_tripletsへ書き込む列
+DATASET_TRIPLET_COLUMNS = ("dataset_id", "triplet_id", "position")
 
 
 class DatasetMySQL(DatasetRepository):
     """
     DatasetRepositoryのMySQL実装。
     SQLインターフェースを介してデータベースと対話する。
+    メンバーのTriplet IDはdataset_tripletsテーブルに1行ずつ保持し、
+    datasetsテーブルには件数(triplet_count)だけを持たせる。
     """
 
-    def __init__(self, db: SQL):
+    def __init__(self, db: SQL, chunk_size: int = DEFAULT_CHUNK_SIZE):
         self.db = db
+        self.chunk_size = chunk_size
 
     def create(self, dataset: Dataset) -> Dataset:
         query = """
             INSERT INTO datasets (
-                id, name, description, type, triplet_ids, created_at
+                id, name, description, type, triplet_count, created_at
             ) VALUES (%s, %s, %s, %s, %s, %s)
         """
-        triplet_ids_json = json.dumps([tid.value for tid in dataset.Triplet_ids])
+        triplet_ids = dataset.Triplet_ids or []
 
+        tx = self.db.begin_tx()
         try:
-            self.db.execute(
+            tx.execute(
                 query,
-                dataset.ID.value,
+                dataset.ID,
                 dataset.name,
                 dataset.description,
                 dataset.type,
-                triplet_ids_json,
+                len(triplet_ids),
                 dataset.created_at,
             )
+            self._insert_members(tx, dataset.ID, triplet_ids)
+            tx.commit()
+            dataset.triplet_count = len(triplet_ids)
             return dataset
         except Exception as e:
+            tx.rollback()
             raise RuntimeError(f"error creating dataset: {e}")
 
     def find_by_id(self, dataset_id: UUID) -> Optional[Dataset]:
-        query = "SELECT * FROM datasets WHERE id = %s LIMIT 1"
+        query = f"SELECT {DATASET_COLUMNS} FROM datasets WHERE id = %s LIMIT 1"
         try:
-            row = self.db.query_row(query, dataset_id.value)
+            row = self.db.query_row(query, dataset_id)
             return self._scan_row_data(row.get_values())
         except Exception:
             return None
 
+    def find_by_ids(self, dataset_ids: List[UUID]) -> List[Dataset]:
+        """
+        WHERE id IN (...) をチャンク単位で発行し、複数のDatasetをまとめて取得する。
+        """
+        try:
+            return find_by_id_values(
+                self.db, "datasets", dataset_ids, self._scan_row_data, self.chunk_size,
+                select_columns=DATASET_COLUMNS,
+            )
+        except Exception as e:
+            raise RuntimeError(f"error finding datasets by ids: {e}")
+
     def find_all(self) -> List[Dataset]:
-        query = "SELECT * FROM datasets"
+        query = f"SELECT {DATASET_COLUMNS} FROM datasets"
         results = []
         try:
-            rows = self.db.query(query)
-            for row_data in rows:
-                result = self._scan_row_data(row_data)
-                if result:
-                    results.append(result)
+            with self.db.query_stream(query) as rows:
+                for row_data in rows:
+                    result = self._scan_row_data(row_data)
+                    if result:
+                        results.append(result)
             return results
         except Exception as e:
             raise RuntimeError(f"error finding all datasets: {e}")
 
+    def find_page(self, limit: int, cursor: Optional[str] = None) -> Page[Dataset]:
+        try:
+            return find_keyset_page(
+                self.db, "datasets", limit, cursor, self._scan_row_data, select_columns=DATASET_COLUMNS
+            )
+        except ValueError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"error finding datasets page: {e}")
+
     def update(self, dataset: Dataset) -> None:
-        query = """
-            UPDATE datasets SET
-                name = %s,
-                description = %s,
-                type = %s,
-                triplet_ids = %s,
-                created_at = %s
-            WHERE id = %s
         """
-        triplet_ids_json = json.dumps([tid.value for tid in dataset.Triplet_ids])
+        Datasetを更新する。Triplet_idsがNone(メンバー未読込)の場合は、
+        メンバーには触れずに属性だけを更新する。
+        """
+        tx = self.db.begin_tx()
         try:
-            self.db.execute(
-                query,
-                dataset.name,
-                dataset.description,
-                dataset.type,
-                triplet_ids_json,
-                dataset.created_at,
-                dataset.ID.value,
-            )
+            if dataset.Triplet_ids is None:
+                tx.execute(
+                    """
+                    UPDATE datasets SET
+                        name = %s,
+                        description = %s,
+                        type = %s,
+                        created_at = %s
+                    WHERE id = %s
+                    """,
+                    dataset.name,
+                    dataset.description,
+                    dataset.type,
+                    dataset.created_at,
+                    dataset.ID,
+                )
+            else:
+                tx.execute(
+                    """
+                    UPDATE datasets SET
+                        name = %s,
+                        description = %s,
+                        type = %s,
+                        triplet_count = %s,
+                        created_at = %s
+                    WHERE id = %s
+                    """,
+                    dataset.name,
+                    dataset.description,
+                    dataset.type,
+                    len(dataset.Triplet_ids),
+                    dataset.created_at,
+                    dataset.ID,
+                )
+                tx.execute("DELETE FROM dataset_triplets WHERE dataset_id = %s", dataset.ID)
+                self._insert_members(tx, dataset.ID, dataset.Triplet_ids)
+            tx.commit()
         except Exception as e:
+            tx.rollback()
             raise RuntimeError(f"error updating dataset: {e}")
 
     def delete(self, dataset_id: UUID) -> None:
+        # dataset_tripletsの行は外部キーのON DELETE CASCADEで削除される
         query = "DELETE FROM datasets WHERE id = %s"
         try:
-            self.db.execute(query, dataset_id.value)
+            self.db.execute(query, dataset_id)
         except Exception as e:
             raise RuntimeError(f"error deleting dataset: {e}")
 
+    def delete_many(self, dataset_ids: List[UUID]) -> List[UUID]:
+        """
+        DELETE ... WHERE id IN (...) をチャンク単位で1つのトランザクション内で発行し、
+        実際に削除できたIDを返す。
+        """
+        try:
+            return delete_many(self.db, "datasets", dataset_ids, self.chunk_size)
+        except Exception as e:
+            raise RuntimeError(f"error deleting datasets: {e}")
+
+    def find_triplet_ids(self, dataset_id: UUID) -> List[UUID]:
+        """
+        Datasetのメンバーを、構成時の順序(position)で取得する。
+        メンバーが必要になった時点で呼び出す遅延読み込み用のメソッド。
+        """
+        query = """
+            SELECT triplet_id FROM dataset_triplets
+            WHERE dataset_id = %s
+            ORDER BY position
+        """
+        try:
+            with self.db.query_stream(query, dataset_id) as rows:
+                return [UUID(value=row_data[0]) for row_data in rows]
+        except Exception as e:
+            raise RuntimeError(f"error finding triplet ids of dataset: {e}")
+
+    def count_triplets(self, dataset_id: UUID) -> int:
+        query = "SELECT triplet_count FROM datasets WHERE id = %s LIMIT 1"
+        try:
+            row_data = self.db.query_row(query, dataset_id).get_values()
+            return int(row_data[0]) if row_data else 0
+        except Exception as e:
+            raise RuntimeError(f"error counting triplets of dataset: {e}")
+
+    def find_ids_by_triplet_id(self, triplet_id: UUID) -> List[UUID]:
+        """
+        指定したTripletを含むDatasetのIDを、triplet_idのインデックスを使って取得する。
+        """
+        query = "SELECT DISTINCT dataset_id FROM dataset_triplets WHERE triplet_id = %s"
+        try:
+            return [UUID(value=row_data[0]) for row_data in self.db.query(query, triplet_id)]
+        except Exception as e:
+            raise RuntimeError(f"error finding datasets by triplet id: {e}")
+
+    def _insert_members(self, tx: Tx, dataset_id: UUID, triplet_ids: Sequence[UUID]) -> None:
+        """メンバーを構成順のpositionと共にdataset_tripletsへまとめて書き込む"""
+        rows = [
+            (dataset_id, tid, position)
+            for position, tid in enumerate(triplet_ids)
+        ]
+        insert_many_tx(tx, "dataset_triplets", DATASET_TRIPLET_COLUMNS, rows, self.chunk_size)
+
     def _scan_row_data(self, row_data: Optional[RowData]) -> Optional[Dataset]:
-        """単一のRowData(タプル)からDatasetを構築するヘルパー"""
+        """
+        単一のRowData(タプル)からDatasetを構築するヘルパー。
+        メンバーは読み込まず、Triplet_idsはNoneのままにする。
+        """
         if not row_data:
             return None
         try:
@@ -98,26 +215,26 @@ class DatasetMySQL(DatasetRepository):
                 name,
                 description,
                 type,
-                triplet_ids_json,
+                triplet_count,
                 created_at,
             ) = row_data
-            
-            triplet_ids = [UUID(value=tid) for tid in json.loads(triplet_ids_json)]
+
             return Dataset(
                 ID=UUID(value=id_str),
                 name=name,
                 description=description,
                 type=type,
-                Triplet_ids=triplet_ids,
+                Triplet_ids=None,
                 created_at=created_at,
+                triplet_count=int(triplet_count or 0),
             )
         except Exception as e:
             print(f"Error scanning row data: {e}")
             return None
 
 
-def NewDatasetMySQL(db: SQL) -> DatasetMySQL:
+def NewDatasetMySQL(db: SQL, chunk_size: int = DEFAULT_CHUNK_SIZE) -> DatasetMySQL:
     """
     DatasetMySQLのインスタンスを生成するファクトリ関数。
     """
-    return DatasetMySQL(db)
+    return DatasetMySQL(db, chunk_size)
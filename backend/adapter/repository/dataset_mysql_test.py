@@ -0,0 +1,83 @@
+import unittest
+from datetime import datetime
+
+from domain import NewDataset, UUID
+from adapter.repository.dataset_mysql import DatasetMySQL
+
+
+class FakeTx:
+    def __init__(self, db):
+        self.db = db
+
+    def execute(self, query, *params):
+        self.db.executed.append((" ".join(query.split()), params))
+
+    def commit(self):
+        self.db.committed = True
+
+    def rollback(self):
+        self.db.rolled_back = True
+
+
+class FakeRow:
+    def __init__(self, values):
+        self.values = values
+
+    def get_values(self):
+        return self.values
+
+
+class FakeSQL:
+    def __init__(self, row=None):
+        self.row = row
+        self.executed = []
+        self.committed = False
+        self.rolled_back = False
+
+    def begin_tx(self):
+        return FakeTx(self)
+
+    def query_row(self, query, *params):
+        self.executed.append((" ".join(query.split()), params))
+        return FakeRow(self.row)
+
+
+class TestDatasetMySQL(unittest.TestCase):
+    def test_create_writes_members_to_dataset_triplets(self):
+        db = FakeSQL()
+        repo = DatasetMySQL(db, chunk_size=2)
+        dataset = NewDataset(
+            ID=UUID(value="d1"),
+            name="name",
+            description="",
+            type="training",
+            Triplet_ids=[UUID(value="t1"), UUID(value="t2"), UUID(value="t3")],
+            created_at=datetime.now(),
+        )
+
+        repo.create(dataset)
+
+        self.assertTrue(db.committed)
+        dataset_insert, *member_inserts = db.executed
+        self.assertIn("INSERT INTO datasets", dataset_insert[0])
+        self.assertEqual(dataset_insert[1][4], 3)
+        # 3件のメンバーが2件ずつのチャンクに分割され、構成順のpositionを持つ
+        self.assertEqual(len(member_inserts), 2)
+        d1, t1, t2, t3 = (UUID(value=v) for v in ("d1", "t1", "t2", "t3"))
+        self.assertEqual(member_inserts[0][1], (d1, t1, 0, d1, t2, 1))
+        self.assertEqual(member_inserts[1][1], (d1, t3, 2))
+
+    def test_find_by_id_reads_count_without_members(self):
+        created_at = datetime.now()
+        db = FakeSQL(row=("d1", "name", "", "training", 3, created_at))
+        repo = DatasetMySQL(db)
+
+        dataset = repo.find_by_id(UUID(value="d1"))
+
+        self.assertIsNone(dataset.Triplet_ids)
+        self.assertEqual(dataset.triplet_count, 3)
+        self.assertNotIn("SELECT *", db.executed[0][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -26,9 +26,9 @@ class ModelEvaluationSessionMySQL(ModelEvaluationSessionRepository):
         try:
             self.db.execute(
                 query,
-                session.ID.value,
-                session.TrainedModel_ID.value,
-                session.Dataset_ID.value,
+                session.ID,
+                session.TrainedModel_ID,
+                session.Dataset_ID,
                 summary_metrics_json,
                 session.created_at,
             )
@@ -39,7 +39,7 @@ class ModelEvaluationSessionMySQL(ModelEvaluationSessionRepository):
     def find_by_id(self, session_id: UUID) -> Optional[ModelEvaluationSession]:
         query = "SELECT * FROM model_evaluation_sessions WHERE id = %s LIMIT 1"
         try:
-            row = self.db.query_row(query, session_id.value)
+            row = self.db.query_row(query, session_id)
             return self._scan_row_data(row.get_values())
         except Exception:
             return None
@@ -48,11 +48,11 @@ class ModelEvaluationSessionMySQL(ModelEvaluationSessionRepository):
         query = "SELECT * FROM model_evaluation_sessions"
         results = []
         try:
-            rows = self.db.query(query)
-            for row_data in rows:
-                result = self._scan_row_data(row_data)
-                if result:
-                    results.append(result)
+            with self.db.query_stream(query) as rows:
+                for row_data in rows:
+                    result = self._scan_row_data(row_data)
+                    if result:
+                        results.append(result)
             return results
         except Exception as e:
             raise RuntimeError(f"error finding all model evaluation sessions: {e}")
@@ -70,11 +70,11 @@ class ModelEvaluationSessionMySQL(ModelEvaluationSessionRepository):
         try:
             self.db.execute(
                 query,
-                session.TrainedModel_ID.value,
-                session.Dataset_ID.value,
+                session.TrainedModel_ID,
+                session.Dataset_ID,
                 summary_metrics_json,
                 session.created_at,
-                session.ID.value,
+                session.ID,
             )
         except Exception as e:
             raise RuntimeError(f"error updating model evaluation session: {e}")
@@ -82,7 +82,7 @@ class ModelEvaluationSessionMySQL(ModelEvaluationSessionRepository):
     def delete(self, session_id: UUID) -> None:
         query = "DELETE FROM model_evaluation_sessions WHERE id = %s"
         try:
-            self.db.execute(query, session_id.value)
+            self.db.execute(query, session_id)
         except Exception as e:
             raise RuntimeError(f"error deleting model evaluation session: {e}")
 
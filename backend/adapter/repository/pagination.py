@@ -0,0 +1,79 @@
+import base64
+import json
+from datetime import datetime
+from typing import Callable, Optional, Tuple, TypeVar
+from domain import Page, NewPage, UUID
+from adapter.repository.sql import SQL, RowData
+
+T = TypeVar("T")
+
+# 1ページあたりの件数の既定値と上限
+DEFAULT_PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 1000
+
+
+def encode_cursor(created_at: datetime, id_value: str) -> str:
+    """
+    (created_at, id) のキーセットを、URLに載せられる不透明なカーソル文字列に変換する。
+    """
+    payload = json.dumps([created_at.isoformat(), id_value])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    encode_cursorで生成したカーソル文字列を (created_at, id) に戻す。
+    不正なカーソルの場合はValueErrorを送出する。
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at_str, id_value = json.loads(payload)
+        return datetime.fromisoformat(created_at_str), str(id_value)
+    except Exception:
+        raise ValueError(f"invalid cursor: {cursor}")
+
+
+def find_keyset_page(
+    db: SQL,
+    table: str,
+    limit: int,
+    cursor: Optional[str],
+    scan: Callable[[RowData], Optional[T]],
+    select_columns: str = "*",
+) -> Page[T]:
+    """
+    (created_at, id) の降順でキーセットページネーションを行う共通ヘルパー。
+    OFFSETを使わないため、何ページ目であっても読み込む行数はlimit+1行で済む。
+    select_columnsにはscanが期待する列の並びをSELECT句として渡す。
+    """
+    if limit < 1 or limit > MAX_PAGE_LIMIT:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_LIMIT}")
+
+    if cursor:
+        created_at, id_value = decode_cursor(cursor)
+        # 行コンストラクタで比較すると、(created_at, id) インデックスの範囲スキャンになる
+        query = f"""
+            SELECT {select_columns} FROM {table}
+            WHERE (created_at, id) < (%s, %s)
+            ORDER BY created_at DESC, id DESC
+            LIMIT %s
+        """
+        params = (created_at, UUID(value=id_value), limit + 1)
+    else:
+        query = f"SELECT {select_columns} FROM {table} ORDER BY created_at DESC, id DESC LIMIT %s"
+        params = (limit + 1,)
+
+    # 次ページの有無を判定するため、1行余分に取得する
+    items = []
+    for row_data in db.query(query, *params):
+        item = scan(row_data)
+        if item:
+            items.append(item)
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        next_cursor = encode_cursor(last.created_at, last.ID.value)
+
+    return NewPage(items=items, next_cursor=next_cursor)
@@ -0,0 +1,71 @@
+import unittest
+from datetime import datetime, timedelta
+
+from domain import Scenario, UUID
+from adapter.repository.pagination import encode_cursor, decode_cursor, find_keyset_page
+
+
+class FakeSQL:
+    """queryに渡されたSQLとパラメータを記録し、用意した行を返すだけのモック"""
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def query(self, query, *params):
+        self.calls.append((query, params))
+        return iter(self.rows)
+
+
+def scan(row_data):
+    id_str, created_at = row_data
+    return Scenario(
+        ID=UUID(value=id_str),
+        state="",
+        method_group="",
+        target_method="",
+        negative_method_group="",
+        created_at=created_at,
+    )
+
+
+class TestCursor(unittest.TestCase):
+    def test_round_trip(self):
+        now = datetime(2025, 7, 25, 17, 42, 21)
+        cursor = encode_cursor(now, "abc")
+        self.assertEqual(decode_cursor(cursor), (now, "abc"))
+
+    def test_invalid_cursor_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            decode_cursor("not-a-cursor")
+
+
+class TestFindKeysetPage(unittest.TestCase):
+    def setUp(self):
+        base = datetime(2025, 7, 25)
+        self.rows = [(f"id-{i}", base - timedelta(seconds=i)) for i in range(3)]
+
+    def test_first_page_has_next_cursor(self):
+        db = FakeSQL(self.rows)
+        page = find_keyset_page(db, "scenarios", 2, None, scan)
+
+        self.assertEqual([s.ID.value for s in page.items], ["id-0", "id-1"])
+        self.assertEqual(decode_cursor(page.next_cursor), (self.rows[1][1], "id-1"))
+        # 次ページ判定のため limit + 1 行を要求していること
+        self.assertEqual(db.calls[0][1], (3,))
+
+    def test_last_page_has_no_next_cursor(self):
+        db = FakeSQL(self.rows[:2])
+        cursor = encode_cursor(self.rows[0][1], "id-0")
+        page = find_keyset_page(db, "scenarios", 2, cursor, scan)
+
+        self.assertEqual(len(page.items), 2)
+        self.assertIsNone(page.next_cursor)
+        self.assertIn("(created_at, id) < (%s, %s)", db.calls[0][0])
+
+    def test_limit_out_of_range_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            find_keyset_page(FakeSQL([]), "scenarios", 0, None, scan)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,79 +1,205 @@
-from typing import List, Optional
-from domain import Scenario, ScenarioRepository, UUID
-from adapter.repository.sql import SQL, Row, Rows, RowData
+from typing import Dict, List, Optional, Tuple
+from domain import Scenario, Page, ScenarioRepository, UUID
+from domain.scenario_fingerprint import NearDuplicateIndex, ScenarioBandKeys, ScenarioMinHash, ScenarioContentHash
+from adapter.repository.bulk import DEFAULT_CHUNK_SIZE, chunked, delete_many, find_by_id_values, insert_many_tx
+from adapter.repository.pagination import find_keyset_page
+from adapter.repository.sql import SQL, Tx, Row, Rows, RowData
 from datetime import datetime # datetimeをインポート
 
+# _scan_row_dataが期待する列の並び
+SCENARIO_COLUMNS = (
+    "id, state, method_group, target_method, negative_method_group, created_at, "
+    "content_hash, near_duplicate_of"
+)
+SCENARIO_INSERT_COLUMNS = (
+    "id", "state", "method_group", "target_method", "negative_method_group", "created_at",
+    "content_hash", "near_duplicate_of",
+)
+LSH_BAND_COLUMNS = ("band", "band_key", "scenario_id")
+
 
 class ScenarioMySQL(ScenarioRepository):
     """
     ScenarioRepositoryのMySQL実装。
     SQLインターフェースを介してデータベースと対話する。
+    内容の完全一致はcontent_hashのユニークインデックスで、近似重複はscenario_lsh_bandsで検出する。
     """
 
-    def __init__(self, db: SQL):
+    def __init__(self, db: SQL, chunk_size: int = DEFAULT_CHUNK_SIZE):
         self.db = db
+        self.chunk_size = chunk_size
 
     def create(self, scenario: Scenario) -> Scenario:
-        query = """
-            INSERT INTO scenarios (
-                id, state, method_group, target_method, negative_method_group, created_at
-            ) VALUES (%s, %s, %s, %s, %s, %s)
         """
+        Scenarioを1件保存する。内容が同じScenarioがすでにある場合は保存せず、既存のものを返す。
+        """
+        created = self.create_many([scenario])
+        if created:
+            return created[0]
+        existing = self.find_by_content_hash(scenario.ensure_content_hash())
+        if existing is None:
+            raise RuntimeError("error creating scenario: duplicate scenario not found")
+        return existing
+
+    def create_many(self, scenarios: List[Scenario]) -> List[Scenario]:
+        """
+        1つのトランザクションで、複数行INSERTをchunk_size行ずつ発行してまとめて保存する。
+        - content_hashが既存の行(またはバッチ内の先の行)と同じScenarioは保存しない
+        - MinHashのバンドがscenario_lsh_bands(またはバッチ内の先の行)と一致したScenarioは、
+          near_duplicate_ofに一致した相手のIDを記録して保存する
+        実際に保存したScenarioだけを返す。
+        """
+        tx = self.db.begin_tx()
         try:
-            self.db.execute(
-                query,
-                scenario.ID.value,
-                scenario.state,
-                scenario.method_group,
-                scenario.target_method,
-                scenario.negative_method_group,
-                scenario.created_at, # created_atを追加
-            )
-            return scenario
+            candidates = self._drop_exact_duplicates(tx, scenarios)
+            band_rows = self._flag_near_duplicates(tx, candidates)
+
+            rows = [
+                (
+                    s.ID,
+                    s.state,
+                    s.method_group,
+                    s.target_method,
+                    s.negative_method_group,
+                    s.created_at,
+                    s.content_hash,
+                    s.near_duplicate_of,
+                )
+                for s in candidates
+            ]
+            insert_many_tx(tx, "scenarios", SCENARIO_INSERT_COLUMNS, rows, self.chunk_size)
+            insert_many_tx(tx, "scenario_lsh_bands", LSH_BAND_COLUMNS, band_rows, self.chunk_size)
+            tx.commit()
+            return candidates
         except Exception as e:
-            raise RuntimeError(f"error creating scenario: {e}")
+            tx.rollback()
+            raise RuntimeError(f"error creating scenarios: {e}")
+
+    def _drop_exact_duplicates(self, tx: Tx, scenarios: List[Scenario]) -> List[Scenario]:
+        """content_hashがバッチ内で重複するもの、保存済みの行と一致するものを取り除く"""
+        unique: Dict[str, Scenario] = {}
+        for s in scenarios:
+            unique.setdefault(s.ensure_content_hash(), s)
+
+        existing = set()
+        hashes = list(unique)
+        for chunk in chunked(hashes, self.chunk_size):
+            placeholders = ", ".join(["%s"] * len(chunk))
+            query = f"SELECT content_hash FROM scenarios WHERE content_hash IN ({placeholders})"
+            existing.update(row_data[0] for row_data in tx.query(query, *chunk))
+        return [s for h, s in unique.items() if h not in existing]
+
+    def _flag_near_duplicates(self, tx: Tx, scenarios: List[Scenario]) -> List[Tuple[int, int, UUID]]:
+        """
+        各ScenarioのLSHバンドを既存のバンドとバッチ内の先のScenarioに照合し、
+        近似重複ならnear_duplicate_ofを設定する。
+        近似重複でないScenarioのバンドを、scenario_lsh_bandsに書き込む行として返す。
+        """
+        band_keys = [
+            ScenarioBandKeys(ScenarioMinHash(s.state, s.method_group, s.target_method))
+            for s in scenarios
+        ]
+
+        stored = NearDuplicateIndex()
+        all_keys = list({key for keys in band_keys for key in keys})
+        for chunk in chunked(all_keys, self.chunk_size):
+            pair_placeholders = ", ".join(["(%s, %s)"] * len(chunk))
+            query = (
+                "SELECT band, band_key, scenario_id FROM scenario_lsh_bands "
+                f"WHERE (band, band_key) IN ({pair_placeholders})"
+            )
+            params = [value for key in chunk for value in key]
+            for band, band_key, scenario_id in tx.query(query, *params):
+                stored.add(UUID(value=scenario_id), [(int(band), int(band_key))])
+
+        batch = NearDuplicateIndex()
+        band_rows = []
+        for s, keys in zip(scenarios, band_keys):
+            if s.near_duplicate_of is None:
+                s.near_duplicate_of = stored.find(keys) or batch.find(keys)
+            if s.near_duplicate_of is None:
+                # 近似重複の元になりうるのは、どれにも似ていないScenarioだけにする
+                batch.add(s.ID, keys)
+                band_rows.extend((band, band_key, s.ID) for band, band_key in keys)
+        return band_rows
 
     def find_by_id(self, scenario_id: UUID) -> Optional[Scenario]:
-        query = "SELECT * FROM scenarios WHERE id = %s LIMIT 1"
+        query = f"SELECT {SCENARIO_COLUMNS} FROM scenarios WHERE id = %s LIMIT 1"
         try:
-            row = self.db.query_row(query, scenario_id.value)
+            row = self.db.query_row(query, scenario_id)
             # 修正: _scan_row_data を使い、Rowオブジェクトから直接値を取得する
             return self._scan_row_data(row.get_values())
         except Exception:
             return None
 
+    def find_by_ids(self, scenario_ids: List[UUID]) -> List[Scenario]:
+        """
+        WHERE id IN (...) をチャンク単位で発行し、複数のScenarioをまとめて取得する。
+        """
+        try:
+            return find_by_id_values(
+                self.db, "scenarios", scenario_ids, self._scan_row_data, self.chunk_size,
+                select_columns=SCENARIO_COLUMNS,
+            )
+        except Exception as e:
+            raise RuntimeError(f"error finding scenarios by ids: {e}")
+
+    def find_by_content_hash(self, content_hash: str) -> Optional[Scenario]:
+        query = f"SELECT {SCENARIO_COLUMNS} FROM scenarios WHERE content_hash = %s LIMIT 1"
+        try:
+            row = self.db.query_row(query, content_hash)
+            return self._scan_row_data(row.get_values())
+        except Exception:
+            return None
+
     def find_all(self) -> List[Scenario]:
-        query = "SELECT * FROM scenarios"
+        query = f"SELECT {SCENARIO_COLUMNS} FROM scenarios"
         results = []
         try:
-            # 修正: rowsはイテラブルなオブジェクト(データのリスト)になった
-            rows = self.db.query(query)
-            # 修正: 単純なforループで処理する
-            for row_data in rows:
-                result = self._scan_row_data(row_data)
-                if result:
-                    results.append(result)
+            # rowsはサーバー側カーソルから少しずつ行を読み出すイテラブル
+            with self.db.query_stream(query) as rows:
+                # 修正: 単純なforループで処理する
+                for row_data in rows:
+                    result = self._scan_row_data(row_data)
+                    if result:
+                        results.append(result)
             return results
         except Exception as e:
             raise RuntimeError(f"error finding all scenarios: {e}")
 
+    def find_page(self, limit: int, cursor: Optional[str] = None) -> Page[Scenario]:
+        try:
+            return find_keyset_page(
+                self.db, "scenarios", limit, cursor, self._scan_row_data, select_columns=SCENARIO_COLUMNS
+            )
+        except ValueError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"error finding scenarios page: {e}")
+
     def update(self, scenario: Scenario) -> None:
         query = """
             UPDATE scenarios SET
                 state = %s,
                 method_group = %s,
                 target_method = %s,
-                negative_method_group = %s
+                negative_method_group = %s,
+                content_hash = %s
             WHERE id = %s
         """
         try:
+            # 内容が変わるとハッシュも変わるため、更新後の内容から計算し直す
+            scenario.content_hash = ScenarioContentHash(
+                scenario.state, scenario.method_group, scenario.target_method
+            )
             self.db.execute(
                 query,
                 scenario.state,
                 scenario.method_group,
                 scenario.target_method,
                 scenario.negative_method_group,
-                scenario.ID.value,
+                scenario.content_hash,
+                scenario.ID,
             )
         except Exception as e:
             raise RuntimeError(f"error updating scenario: {e}")
@@ -81,10 +207,20 @@ class ScenarioMySQL(ScenarioRepository):
     def delete(self, scenario_id: UUID) -> None:
         query = "DELETE FROM scenarios WHERE id = %s"
         try:
-            self.db.execute(query, scenario_id.value)
+            self.db.execute(query, scenario_id)
         except Exception as e:
             raise RuntimeError(f"error deleting scenario: {e}")
 
+    def delete_many(self, scenario_ids: List[UUID]) -> List[UUID]:
+        """
+        DELETE ... WHERE id IN (...) をチャンク単位で1つのトランザクション内で発行し、
+        実際に削除できたIDを返す。
+        """
+        try:
+            return delete_many(self.db, "scenarios", scenario_ids, self.chunk_size)
+        except Exception as e:
+            raise RuntimeError(f"error deleting scenarios: {e}")
+
     # 修正: _scan_row / _scan_rows は RowData を直接受け取るヘルパーに統一
     def _scan_row_data(self, row_data: Optional[RowData]) -> Optional[Scenario]:
         """
@@ -101,6 +237,8 @@ class ScenarioMySQL(ScenarioRepository):
                 target_method,
                 negative_method_group,
                 created_at, # created_atを追加
+                content_hash,
+                near_duplicate_of,
             ) = row_data
             return Scenario(
                 ID=UUID(value=id_str),
@@ -109,6 +247,8 @@ class ScenarioMySQL(ScenarioRepository):
                 target_method=target_method,
                 negative_method_group=negative_method_group,
                 created_at=created_at, # created_atを追加
+                content_hash=content_hash,
+                near_duplicate_of=UUID(value=near_duplicate_of) if near_duplicate_of else None,
             )
         except Exception as e:
             # エラーが発生した場合はログに出力するとデバッグしやすい
@@ -116,8 +256,8 @@ class ScenarioMySQL(ScenarioRepository):
             return None
 
 
-def NewScenarioMySQL(db: SQL) -> ScenarioMySQL:
+def NewScenarioMySQL(db: SQL, chunk_size: int = DEFAULT_CHUNK_SIZE) -> ScenarioMySQL:
     """
     ScenarioMySQLのインスタンスを生成するファクトリ関数。
     """
-    return ScenarioMySQL(db)
+    return ScenarioMySQL(db, chunk_size)
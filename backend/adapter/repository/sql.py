@@ -1,5 +1,5 @@
 import abc
-from typing import Any, Iterable, List, Optional, Protocol, Sequence, Tuple, TypeVar
+from typing import Any, Iterable, Iterator, List, Optional, Protocol, Sequence, Tuple, TypeVar
 
 # --- 基本的な型定義 ---
 
@@ -9,6 +9,9 @@ Primitive = Optional[str | int | float | bool | bytes]
 # 1行のデータを表す型。タプルやシーケンスを想定。
 RowData = Sequence[Primitive]
 
+# ストリーミングクエリで一度に取得する行数の既定値
+DEFAULT_STREAM_BATCH_SIZE = 1000
+
 # --- Rows / Row インターフェース ---
 
 class Rows(Protocol):
@@ -41,10 +44,26 @@ class Rows(Protocol):
         """残りのすべての行を取得する。"""
         ...
 
+    def fetchmany(self, size: Optional[int] = None) -> List[RowData]:
+        """次の最大size行を取得する。行がなければ空のリストを返す。"""
+        ...
+
+    def iter_batches(self, size: Optional[int] = None) -> Iterator[List[RowData]]:
+        """fetchmanyを繰り返し、最大size行ずつのバッチを順に返す。"""
+        ...
+
     def __iter__(self) -> Iterable[RowData]:
         """イテレータとして自身を返す。"""
         ...
 
+    def __enter__(self) -> "Rows":
+        """with文で使えるように自身を返す。"""
+        ...
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        """with文を抜ける際に結果セットを閉じる。"""
+        ...
+
 class Row(Protocol):
     """
     単一の結果行を扱うためのインターフェース。
@@ -81,6 +100,14 @@ class Tx(abc.ABC):
         """最大で1行を返すクエリを実行する。"""
         pass
 
+    @abc.abstractmethod
+    def query_stream(self, query: str, *params: Any, batch_size: int = DEFAULT_STREAM_BATCH_SIZE) -> Rows:
+        """
+        複数の行を返すクエリを実行し、結果をサーバー側から少しずつ読み出すRowsを返す。
+        Rowsを読み切るかcloseするまで、このトランザクションで他のクエリは実行できない。
+        """
+        pass
+
     @abc.abstractmethod
     def commit(self) -> None:
         """トランザクションをコミットする。"""
@@ -114,6 +141,14 @@ class SQL(abc.ABC):
         """最大で1行を返すクエリを実行する。"""
         pass
 
+    @abc.abstractmethod
+    def query_stream(self, query: str, *params: Any, batch_size: int = DEFAULT_STREAM_BATCH_SIZE) -> Rows:
+        """
+        複数の行を返すクエリを実行し、結果をサーバー側から少しずつ読み出すRowsを返す。
+        接続はRowsを読み切るかcloseするまで占有されるため、with文で使うこと。
+        """
+        pass
+
     @abc.abstractmethod
     def begin_tx(self) -> Tx:
         """トランザクションを開始する。"""
@@ -1,6 +1,8 @@
 from datetime import datetime
 from typing import List, Optional
-from domain import TrainedModel, TrainedModelRepository, UUID
+from domain import TrainedModel, Page, TrainedModelRepository, UUID
+from adapter.repository.bulk import DEFAULT_CHUNK_SIZE, delete_many
+from adapter.repository.pagination import find_keyset_page
 from adapter.repository.sql import SQL, Row, Rows, RowData
 
 
@@ -10,8 +12,9 @@ class TrainedModelMySQL(TrainedModelRepository):
     SQLインターフェースを介してデータベースと対話する。
     """
 
-    def __init__(self, db: SQL):
+    def __init__(self, db: SQL, chunk_size: int = DEFAULT_CHUNK_SIZE):
         self.db = db
+        self.chunk_size = chunk_size
 
     def create(self, model: TrainedModel) -> TrainedModel:
         query = """
@@ -22,9 +25,9 @@ class TrainedModelMySQL(TrainedModelRepository):
         try:
             self.db.execute(
                 query,
-                model.ID.value,
+                model.ID,
                 model.name,
-                model.Dataset_ID.value,
+                model.Dataset_ID,
                 model.description,
                 model.file_path,
                 model.created_at,
@@ -36,7 +39,7 @@ class TrainedModelMySQL(TrainedModelRepository):
     def find_by_id(self, model_id: UUID) -> Optional[TrainedModel]:
         query = "SELECT * FROM trained_models WHERE id = %s LIMIT 1"
         try:
-            row = self.db.query_row(query, model_id.value)
+            row = self.db.query_row(query, model_id)
             return self._scan_row_data(row.get_values())
         except Exception:
             return None
@@ -45,15 +48,23 @@ class TrainedModelMySQL(TrainedModelRepository):
         query = "SELECT * FROM trained_models"
         results = []
         try:
-            rows = self.db.query(query)
-            for row_data in rows:
-                result = self._scan_row_data(row_data)
-                if result:
-                    results.append(result)
+            with self.db.query_stream(query) as rows:
+                for row_data in rows:
+                    result = self._scan_row_data(row_data)
+                    if result:
+                        results.append(result)
             return results
         except Exception as e:
             raise RuntimeError(f"error finding all trained models: {e}")
 
+    def find_page(self, limit: int, cursor: Optional[str] = None) -> Page[TrainedModel]:
+        try:
+            return find_keyset_page(self.db, "trained_models", limit, cursor, self._scan_row_data)
+        except ValueError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"error finding trained_models page: {e}")
+
     def update(self, model: TrainedModel) -> None:
         query = """
             UPDATE trained_models SET
@@ -68,11 +79,11 @@ class TrainedModelMySQL(TrainedModelRepository):
             self.db.execute(
                 query,
                 model.name,
-                model.Dataset_ID.value,
+                model.Dataset_ID,
                 model.description,
                 model.file_path,
                 model.created_at,
-                model.ID.value,
+                model.ID,
             )
         except Exception as e:
             raise RuntimeError(f"error updating trained model: {e}")
@@ -80,10 +91,20 @@ class TrainedModelMySQL(TrainedModelRepository):
     def delete(self, model_id: UUID) -> None:
         query = "DELETE FROM trained_models WHERE id = %s"
         try:
-            self.db.execute(query, model_id.value)
+            self.db.execute(query, model_id)
         except Exception as e:
             raise RuntimeError(f"error deleting trained model: {e}")
 
+    def delete_many(self, model_ids: List[UUID]) -> List[UUID]:
+        """
+        DELETE ... WHERE id IN (...) をチャンク単位で1つのトランザクション内で発行し、
+        実際に削除できたIDを返す。
+        """
+        try:
+            return delete_many(self.db, "trained_models", model_ids, self.chunk_size)
+        except Exception as e:
+            raise RuntimeError(f"error deleting trained models: {e}")
+
     def _scan_row_data(self, row_data: Optional[RowData]) -> Optional[TrainedModel]:
         """単一のRowData(タプル)からTrainedModelを構築するヘルパー"""
         if not row_data:
@@ -110,8 +131,8 @@ class TrainedModelMySQL(TrainedModelRepository):
             return None
 
 
-def NewTrainedModelMySQL(db: SQL) -> TrainedModelMySQL:
+def NewTrainedModelMySQL(db: SQL, chunk_size: int = DEFAULT_CHUNK_SIZE) -> TrainedModelMySQL:
     """
     TrainedModelMySQLのインスタンスを生成するファクトリ関数。
     """
-    return TrainedModelMySQL(db)
\ No newline at end of file
+    return TrainedModelMySQL(db, chunk_size)
\ No newline at end of file
@@ -1,5 +1,7 @@
 from typing import List, Optional
-from domain import TrainingReadyScenario, TrainingReadyScenarioRepository, UUID
+from domain import TrainingReadyScenario, Page, TrainingReadyScenarioRepository, UUID
+from adapter.repository.bulk import DEFAULT_CHUNK_SIZE, delete_many, find_by_id_values, insert_many
+from adapter.repository.pagination import find_keyset_page
 from adapter.repository.sql import SQL, Row, Rows, RowData
 from datetime import datetime # datetimeをインポート
 
@@ -10,8 +12,9 @@ class TrainingReadyScenarioMySQL(TrainingReadyScenarioRepository):
     SQLインターフェースを介してデータベースと対話する。
     """
 
-    def __init__(self, db: SQL):
+    def __init__(self, db: SQL, chunk_size: int = DEFAULT_CHUNK_SIZE):
         self.db = db
+        self.chunk_size = chunk_size
 
     def create(self, scenario: TrainingReadyScenario) -> TrainingReadyScenario:
         query = """
@@ -22,8 +25,8 @@ class TrainingReadyScenarioMySQL(TrainingReadyScenarioRepository):
         try:
             self.db.execute(
                 query,
-                scenario.ID.value,
-                scenario.Scenario_ID.value,
+                scenario.ID,
+                scenario.Scenario_ID,
                 scenario.state,
                 scenario.method_group,
                 scenario.negative_method_group,
@@ -33,30 +36,96 @@ class TrainingReadyScenarioMySQL(TrainingReadyScenarioRepository):
         except Exception as e:
             raise RuntimeError(f"error creating training_ready_scenario: {e}")
 
+    def create_many(self, scenarios: List[TrainingReadyScenario]) -> List[TrainingReadyScenario]:
+        """
+        複数行INSERTをchunk_size行ずつ発行し、1つのトランザクションでまとめて保存する。
+        """
+        columns = ("id", "scenario_id", "state", "method_group", "negative_method_group", "created_at")
+        rows = [
+            (
+                s.ID,
+                s.Scenario_ID,
+                s.state,
+                s.method_group,
+                s.negative_method_group,
+                s.created_at,
+            )
+            for s in scenarios
+        ]
+        try:
+            insert_many(self.db, "training_ready_scenarios", columns, rows, self.chunk_size)
+            return scenarios
+        except Exception as e:
+            raise RuntimeError(f"error creating training_ready_scenarios: {e}")
+
     def find_by_id(self, scenario_id: UUID) -> Optional[TrainingReadyScenario]:
         query = "SELECT * FROM training_ready_scenarios WHERE id = %s LIMIT 1"
         try:
-            row = self.db.query_row(query, scenario_id.value)
+            row = self.db.query_row(query, scenario_id)
             # 修正: _scan_row_data を使い、Rowオブジェクトから直接値を取得する
             return self._scan_row_data(row.get_values())
         except Exception:
             return None
 
-    def find_all(self) -> List[TrainingReadyScenario]:
-        query = "SELECT * FROM training_ready_scenarios"
+    def find_by_ids(self, scenario_ids: List[UUID]) -> List[TrainingReadyScenario]:
+        """
+        WHERE id IN (...) をチャンク単位で発行し、複数のTrainingReadyScenarioをまとめて取得する。
+        """
+        try:
+            return find_by_id_values(
+                self.db, "training_ready_scenarios", scenario_ids, self._scan_row_data, self.chunk_size
+            )
+        except Exception as e:
+            raise RuntimeError(f"error finding training_ready_scenarios by ids: {e}")
+
+    def find_unformed(self, limit: int, after_id: Optional[UUID] = None) -> List[TrainingReadyScenario]:
+        """
+        まだTripletが1件も作られていないTrainingReadyScenarioを、ID順に最大limit件取得する。
+        after_idを渡すと、そのIDより後ろから取得する（キーセット方式の続き読み）。
+        """
+        query = """
+            SELECT trs.* FROM training_ready_scenarios trs
+            WHERE trs.id > %s
+              AND NOT EXISTS (
+                  SELECT 1 FROM triplets t WHERE t.training_ready_scenario_id = trs.id
+              )
+            ORDER BY trs.id
+            LIMIT %s
+        """
         results = []
         try:
-            # 修正: rowsはイテラブルなオブジェクト(データのリスト)になった
-            rows = self.db.query(query)
-            # 修正: 単純なforループで処理する
+            rows = self.db.query(query, after_id if after_id else "", limit)
             for row_data in rows:
                 result = self._scan_row_data(row_data)
                 if result:
                     results.append(result)
             return results
+        except Exception as e:
+            raise RuntimeError(f"error finding unformed training_ready_scenarios: {e}")
+
+    def find_all(self) -> List[TrainingReadyScenario]:
+        query = "SELECT * FROM training_ready_scenarios"
+        results = []
+        try:
+            # rowsはサーバー側カーソルから少しずつ行を読み出すイテラブル
+            with self.db.query_stream(query) as rows:
+                # 修正: 単純なforループで処理する
+                for row_data in rows:
+                    result = self._scan_row_data(row_data)
+                    if result:
+                        results.append(result)
+            return results
         except Exception as e:
             raise RuntimeError(f"error finding all training_ready_scenarios: {e}")
 
+    def find_page(self, limit: int, cursor: Optional[str] = None) -> Page[TrainingReadyScenario]:
+        try:
+            return find_keyset_page(self.db, "training_ready_scenarios", limit, cursor, self._scan_row_data)
+        except ValueError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"error finding training_ready_scenarios page: {e}")
+
     def update(self, scenario: TrainingReadyScenario) -> None:
         query = """
             UPDATE training_ready_scenarios SET
@@ -69,11 +138,11 @@ class TrainingReadyScenarioMySQL(TrainingReadyScenarioRepository):
         try:
             self.db.execute(
                 query,
-                scenario.Scenario_ID.value,
+                scenario.Scenario_ID,
                 scenario.state,
                 scenario.method_group,
                 scenario.negative_method_group,
-                scenario.ID.value,
+                scenario.ID,
             )
         except Exception as e:
             raise RuntimeError(f"error updating training_ready_scenario: {e}")
@@ -81,10 +150,20 @@ class TrainingReadyScenarioMySQL(TrainingReadyScenarioRepository):
     def delete(self, scenario_id: UUID) -> None:
         query = "DELETE FROM training_ready_scenarios WHERE id = %s"
         try:
-            self.db.execute(query, scenario_id.value)
+            self.db.execute(query, scenario_id)
         except Exception as e:
             raise RuntimeError(f"error deleting training_ready_scenario: {e}")
 
+    def delete_many(self, scenario_ids: List[UUID]) -> List[UUID]:
+        """
+        DELETE ... WHERE id IN (...) をチャンク単位で1つのトランザクション内で発行し、
+        実際に削除できたIDを返す。
+        """
+        try:
+            return delete_many(self.db, "training_ready_scenarios", scenario_ids, self.chunk_size)
+        except Exception as e:
+            raise RuntimeError(f"error deleting training_ready_scenarios: {e}")
+
     # 修正: _scan_row / _scan_rows は RowData を直接受け取るヘルパーに統一
     def _scan_row_data(self, row_data: Optional[RowData]) -> Optional[TrainingReadyScenario]:
         """
@@ -116,8 +195,8 @@ class TrainingReadyScenarioMySQL(TrainingReadyScenarioRepository):
             return None
 
 
-def NewTrainingReadyScenarioMySQL(db: SQL) -> TrainingReadyScenarioMySQL:
+def NewTrainingReadyScenarioMySQL(db: SQL, chunk_size: int = DEFAULT_CHUNK_SIZE) -> TrainingReadyScenarioMySQL:
     """
     TrainingReadyScenarioMySQLのインスタンスを生成するファクトリ関数。
     """
-    return TrainingReadyScenarioMySQL(db)
\ No newline at end of file
+    return TrainingReadyScenarioMySQL(db, chunk_size)
\ No newline at end of file
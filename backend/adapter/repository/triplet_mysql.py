@@ -1,5 +1,7 @@
 from typing import List, Optional
-from domain import Triplet, TripletRepository, UUID
+from domain import Triplet, Page, TripletRepository, UUID
+from adapter.repository.bulk import DEFAULT_CHUNK_SIZE, delete_many, find_by_id_values, insert_many
+from adapter.repository.pagination import find_keyset_page
 from adapter.repository.sql import SQL, RowData
 from datetime import datetime # datetimeをインポート
 
@@ -10,8 +12,9 @@ class TripletMySQL(TripletRepository):
     SQLインターフェースを介してデータベースと対話する。
     """
 
-    def __init__(self, db: SQL):
+    def __init__(self, db: SQL, chunk_size: int = DEFAULT_CHUNK_SIZE):
         self.db = db
+        self.chunk_size = chunk_size
 
     def create(self, triplet: Triplet) -> Triplet:
         query = """
@@ -22,8 +25,8 @@ class TripletMySQL(TripletRepository):
         try:
             self.db.execute(
                 query,
-                triplet.ID.value,
-                triplet.TrainingReadyScenario_ID.value,
+                triplet.ID,
+                triplet.TrainingReadyScenario_ID,
                 triplet.anchor,
                 triplet.positive,
                 triplet.negative,
@@ -33,27 +36,68 @@ class TripletMySQL(TripletRepository):
         except Exception as e:
             raise RuntimeError(f"error creating triplet: {e}")
 
+    def create_many(self, triplets: List[Triplet]) -> List[Triplet]:
+        """
+        複数行INSERTをchunk_size行ずつ発行し、1つのトランザクションでまとめて保存する。
+        """
+        columns = ("id", "training_ready_scenario_id", "anchor", "positive", "negative", "created_at")
+        rows = [
+            (
+                t.ID,
+                t.TrainingReadyScenario_ID,
+                t.anchor,
+                t.positive,
+                t.negative,
+                t.created_at,
+            )
+            for t in triplets
+        ]
+        try:
+            insert_many(self.db, "triplets", columns, rows, self.chunk_size)
+            return triplets
+        except Exception as e:
+            raise RuntimeError(f"error creating triplets: {e}")
+
     def find_by_id(self, triplet_id: UUID) -> Optional[Triplet]:
         query = "SELECT * FROM triplets WHERE id = %s LIMIT 1"
         try:
-            row = self.db.query_row(query, triplet_id.value)
+            row = self.db.query_row(query, triplet_id)
             return self._scan_row_data(row.get_values())
         except Exception:
             return None
 
+    def find_by_ids(self, triplet_ids: List[UUID]) -> List[Triplet]:
+        """
+        WHERE id IN (...) をチャンク単位で発行し、複数のTripletをまとめて取得する。
+        """
+        try:
+            return find_by_id_values(
+                self.db, "triplets", triplet_ids, self._scan_row_data, self.chunk_size
+            )
+        except Exception as e:
+            raise RuntimeError(f"error finding triplets by ids: {e}")
+
     def find_all(self) -> List[Triplet]:
         query = "SELECT * FROM triplets"
         results: List[Triplet] = []
         try:
-            rows = self.db.query(query)
-            for row_data in rows:
-                triplet = self._scan_row_data(row_data)
-                if triplet:
-                    results.append(triplet)
+            with self.db.query_stream(query) as rows:
+                for row_data in rows:
+                    triplet = self._scan_row_data(row_data)
+                    if triplet:
+                        results.append(triplet)
             return results
         except Exception as e:
             raise RuntimeError(f"error finding all triplets: {e}")
 
+    def find_page(self, limit: int, cursor: Optional[str] = None) -> Page[Triplet]:
+        try:
+            return find_keyset_page(self.db, "triplets", limit, cursor, self._scan_row_data)
+        except ValueError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"error finding triplets page: {e}")
+
     def update(self, triplet: Triplet) -> None:
         query = """
             UPDATE triplets SET
@@ -66,11 +110,11 @@ class TripletMySQL(TripletRepository):
         try:
             self.db.execute(
                 query,
-                triplet.TrainingReadyScenario_ID.value,
+                triplet.TrainingReadyScenario_ID,
                 triplet.anchor,
                 triplet.positive,
                 triplet.negative,
-                triplet.ID.value,
+                triplet.ID,
             )
         except Exception as e:
             raise RuntimeError(f"error updating triplet: {e}")
@@ -78,10 +122,20 @@ class TripletMySQL(TripletRepository):
     def delete(self, triplet_id: UUID) -> None:
         query = "DELETE FROM triplets WHERE id = %s"
         try:
-            self.db.execute(query, triplet_id.value)
+            self.db.execute(query, triplet_id)
         except Exception as e:
             raise RuntimeError(f"error deleting triplet: {e}")
 
+    def delete_many(self, triplet_ids: List[UUID]) -> List[UUID]:
+        """
+        DELETE ... WHERE id IN (...) をチャンク単位で1つのトランザクション内で発行し、
+        実際に削除できたIDを返す。
+        """
+        try:
+            return delete_many(self.db, "triplets", triplet_ids, self.chunk_size)
+        except Exception as e:
+            raise RuntimeError(f"error deleting triplets: {e}")
+
     def _scan_row_data(self, row_data: Optional[RowData]) -> Optional[Triplet]:
         if not row_data:
             return None
@@ -107,8 +161,8 @@ class TripletMySQL(TripletRepository):
             return None
 
 
-def NewTripletMySQL(db: SQL) -> TripletMySQL:
+def NewTripletMySQL(db: SQL, chunk_size: int = DEFAULT_CHUNK_SIZE) -> TripletMySQL:
     """
     TripletMySQLのインスタンスを生成するファクトリ関数。
     """
-    return TripletMySQL(db)
+    return TripletMySQL(db, chunk_size)
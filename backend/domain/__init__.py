@@ -2,19 +2,20 @@ from .scenario import Scenario, ScenarioRepository
 from .method_profile import MethodProfile
 from .situation import Situation
 from .scenario_generator_domain_service import ScenarioGeneratorDomainService
-from .log_generation_config import LogGenerationConfig
+from .log_generation_config import LogGenerationConfig, NewLogGenerationConfig
 from .training_ready_scenario import TrainingReadyScenario, TrainingReadyScenarioRepository
 from .preprocessor_domain_service import PreprocessorDomainService
 from .dataset import Dataset, DatasetRepository, NewDataset
 from .training_parameters import TrainingParameters, NewTrainingParameters
 from .trained_model import TrainedModel, TrainedModelRepository
 from .model_trainer_domain_service import ModelTrainerDomainService
-from .custom_uuid import UUID, NewUUID
+from .custom_uuid import UUID, NewUUID, SetUUIDVersion
 from .triplet import Triplet, TripletRepository
 from .triplet_former_domain_service import TripletFormerDomainService
 from .model_evaluation_session import ModelEvaluationSession, ModelEvaluationSessionRepository
 from .evaluation_summary import EvaluationSummary
 from .performance_evaluator_domain_service import PerformanceEvaluatorDomainService
+from .page import Page, NewPage
 
 __all__ = [
     "Scenario",
@@ -23,6 +24,7 @@ __all__ = [
     "Situation",
     "ScenarioGeneratorDomainService",
     "LogGenerationConfig",
+    "NewLogGenerationConfig",
     "TrainingReadyScenario",
     "TrainingReadyScenarioRepository",
     "PreprocessorDomainService",
@@ -36,6 +38,7 @@ __all__ = [
     "ModelTrainerDomainService",
     "UUID",
     "NewUUID",
+    "SetUUIDVersion",
     "Triplet",
     "TripletRepository",
     "TripletFormerDomainService",
@@ -43,4 +46,6 @@ __all__ = [
     "ModelEvaluationSessionRepository",
     "EvaluationSummary",
     "PerformanceEvaluatorDomainService",
+    "Page",
+    "NewPage",
 ] 
\ No newline at end of file
@@ -1,3 +1,6 @@
+import os
+import threading
+import time
 import uuid
 from dataclasses import dataclass
 
@@ -5,7 +8,79 @@ from dataclasses import dataclass
 class UUID:
     value: str
 
+# NewUUIDが生成するUUIDのバージョン
+UUID_VERSION_4 = 4  # ランダム
+UUID_VERSION_7 = 7  # 先頭48ビットがミリ秒のUnix時刻で、時刻順に並ぶ
+UUID_VERSIONS = (UUID_VERSION_4, UUID_VERSION_7)
+
+# UUIDv7のrand_a(12ビット)を同一ミリ秒内のカウンタとして使う
+_COUNTER_BITS = 12
+_COUNTER_MAX = (1 << _COUNTER_BITS) - 1
+
+
+class _UUIDv7Generator:
+    """
+    RFC 9562のUUIDv7を生成するクラス。
+    同一ミリ秒内ではrand_aをカウンタとして1ずつ増やすため、1プロセス内では生成順に単調増加する。
+    カウンタが溢れた場合や時計が戻った場合は、直前のタイムスタンプを引き継いで単調性を保つ。
+    rand_b(62ビット)は毎回ランダムなので、複数のプロセスが同じミリ秒に生成しても衝突しない。
+    """
+    def __init__(self):
+        self._reset()
+        # fork直後の子プロセスでは、親が保持していたロックと状態を作り直す
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self) -> None:
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._counter = 0
+
+    def generate(self) -> str:
+        with self._lock:
+            now_ms = time.time_ns() // 1_000_000
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                # 最上位ビットを0にしておき、同一ミリ秒内で増やせる余地を残す
+                self._counter = int.from_bytes(os.urandom(2), "big") & (_COUNTER_MAX >> 1)
+            else:
+                self._counter += 1
+                if self._counter > _COUNTER_MAX:
+                    self._last_ms += 1
+                    self._counter = 0
+            timestamp_ms, counter = self._last_ms, self._counter
+
+        rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+        value = (
+            (timestamp_ms & ((1 << 48) - 1)) << 80
+            | UUID_VERSION_7 << 76
+            | counter << 64
+            | 0b10 << 62
+            | rand_b
+        )
+        return str(uuid.UUID(int=value))
+
+
+_v7_generator = _UUIDv7Generator()
+_uuid_version = UUID_VERSION_7
+
+
+def SetUUIDVersion(version: int) -> None:
+    """NewUUIDが生成するUUIDのバージョン(4または7)を切り替えます。"""
+    global _uuid_version
+    if version not in UUID_VERSIONS:
+        raise ValueError(f"unsupported uuid version: {version}")
+    _uuid_version = version
+
+
+# 環境変数 UUID_VERSION=4 でランダムなUUIDv4に戻せる。子プロセスでも同じ設定になるよう環境変数から読む
+SetUUIDVersion(int(os.getenv("UUID_VERSION", str(UUID_VERSION_7))))
+
+
 def NewUUID() -> UUID:
     """新しいUUIDを生成し、UUIDオブジェクトとして返します。"""
+    if _uuid_version == UUID_VERSION_7:
+        # 時刻順のUUIDv7を使うと、InnoDBのクラスタ化主キーへの挿入が末尾に集まる
+        return UUID(value=_v7_generator.generate())
     # uuid.uuid4()で新しいUUIDを生成し、文字列に変換してvalueにセットします
-    return UUID(value=str(uuid.uuid4()))
\ No newline at end of file
+    return UUID(value=str(uuid.uuid4()))
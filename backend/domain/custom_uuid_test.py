@@ -3,7 +3,9 @@ import unittest
 import uuid as std_uuid  # 標準のuuidモジュールを別名でインポート
 
 # 変更後のファイル名 'custom_uuid' からインポートします
-from domain.custom_uuid import NewUUID, UUID
+import threading
+
+from domain.custom_uuid import NewUUID, SetUUIDVersion, UUID, UUID_VERSION_4, UUID_VERSION_7
 
 class TestCustomUUID(unittest.TestCase):
 
@@ -33,5 +35,46 @@ class TestCustomUUID(unittest.TestCase):
         id_2 = NewUUID()
         self.assertNotEqual(id_1.value, id_2.value, "2つのUUIDが同じ値です。")
 
+    def test_new_uuid_v7_is_time_ordered(self):
+        """
+        UUIDv7では、生成順に並べた値が文字列としても単調増加することをテストします。
+        """
+        ids = [NewUUID().value for _ in range(10000)]
+        self.assertEqual(std_uuid.UUID(ids[0]).version, 7)
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(len(set(ids)), len(ids))
+
+    def test_new_uuid_v7_is_unique_across_threads(self):
+        """
+        複数スレッドから同時に生成しても値が重複しないことをテストします。
+        """
+        results = [[] for _ in range(8)]
+
+        def generate(out):
+            out.extend(NewUUID().value for _ in range(2000))
+
+        threads = [threading.Thread(target=generate, args=(out,)) for out in results]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        all_ids = [v for out in results for v in out]
+        self.assertEqual(len(set(all_ids)), len(all_ids))
+        for out in results:
+            self.assertEqual(out, sorted(out))
+
+    def test_set_uuid_version_switches_to_v4(self):
+        """
+        SetUUIDVersion(4)でランダムなUUIDv4に切り替わることをテストします。
+        """
+        SetUUIDVersion(UUID_VERSION_4)
+        try:
+            self.assertEqual(std_uuid.UUID(NewUUID().value).version, 4)
+        finally:
+            SetUUIDVersion(UUID_VERSION_7)
+        with self.assertRaises(ValueError):
+            SetUUIDVersion(1)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -2,6 +2,7 @@ import abc
 from dataclasses import dataclass
 from typing import List, Optional
 from .custom_uuid import UUID
+from .page import Page
 
 @dataclass
 class Dataset:
@@ -9,8 +10,10 @@ class Dataset:
     name: str
     description: str
     type: str
-    Triplet_ids: List[UUID]
+    # メンバーのTriplet ID。一覧取得時などメンバーを読み込んでいない場合はNone
+    Triplet_ids: Optional[List[UUID]]
     created_at: str
+    triplet_count: int = 0
 
 class DatasetRepository(abc.ABC):
     @abc.abstractmethod
@@ -21,10 +24,18 @@ class DatasetRepository(abc.ABC):
     def find_by_id(self, dataset_id: UUID) -> Optional[Dataset]:
         pass
 
+    @abc.abstractmethod
+    def find_by_ids(self, dataset_ids: List[UUID]) -> List[Dataset]:
+        pass
+
     @abc.abstractmethod
     def find_all(self) -> List[Dataset]:
         pass
 
+    @abc.abstractmethod
+    def find_page(self, limit: int, cursor: Optional[str] = None) -> Page[Dataset]:
+        pass
+
     @abc.abstractmethod
     def update(self, dataset: Dataset) -> None:
         pass
@@ -33,6 +44,22 @@ class DatasetRepository(abc.ABC):
     def delete(self, dataset_id: UUID) -> None:
         pass
 
+    @abc.abstractmethod
+    def delete_many(self, dataset_ids: List[UUID]) -> List[UUID]:
+        pass
+
+    @abc.abstractmethod
+    def find_triplet_ids(self, dataset_id: UUID) -> List[UUID]:
+        pass
+
+    @abc.abstractmethod
+    def count_triplets(self, dataset_id: UUID) -> int:
+        pass
+
+    @abc.abstractmethod
+    def find_ids_by_triplet_id(self, triplet_id: UUID) -> List[UUID]:
+        pass
+
 def NewDataset(
     ID: UUID,
     name: str,
@@ -48,4 +75,5 @@ def NewDataset(
         type=type,
         Triplet_ids=Triplet_ids,
         created_at=created_at,
+        triplet_count=len(Triplet_ids),
     )
\ No newline at end of file
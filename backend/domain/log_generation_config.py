@@ -1,25 +1,43 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 from .method_profile import MethodProfile
 from .situation import Situation
 
+# 1つのシナリオに含めるメソッド数(正解1つ + ディストラクタ)の既定値
+DEFAULT_METHOD_GROUP_SIZE = 3
+
 @dataclass
 class LogGenerationConfig:
     output_count: int
     method_pool: List[MethodProfile]
     situations: List[Situation]
+    # 同じseedと入力からは同じ内容のシナリオ列が生成される。Noneの場合は毎回ランダム
+    seed: Optional[int] = None
+    method_group_size: int = DEFAULT_METHOD_GROUP_SIZE
+    # 同じ実行内で内容が同じシナリオを作り直さない。ハッシュを保持するため、メモリは生成件数に比例する
+    skip_duplicates: bool = True
 
 def NewLogGenerationConfig(
     output_count: int,
     method_pool: List[MethodProfile],
     situations: List[Situation],
+    seed: Optional[int] = None,
+    method_group_size: int = DEFAULT_METHOD_GROUP_SIZE,
+    skip_duplicates: bool = True,
 ) -> LogGenerationConfig:
     """
     LogGenerationConfigインスタンスを生成するファクトリ関数。
     """
+    if output_count < 0:
+        raise ValueError("output_count must not be negative")
+    if method_group_size < 2:
+        raise ValueError("method_group_size must be at least 2")
     return LogGenerationConfig(
         output_count=output_count,
         method_pool=method_pool,
         situations=situations,
+        seed=seed,
+        method_group_size=method_group_size,
+        skip_duplicates=skip_duplicates,
     )
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str]
+
+def NewPage(
+    items: List[T],
+    next_cursor: Optional[str],
+) -> Page[T]:
+    """
+    Pageインスタンスを生成するファクトリ関数。
+    next_cursorがNoneの場合、これ以上のページは存在しない。
+    """
+    return Page(
+        items=items,
+        next_cursor=next_cursor,
+    )
@@ -2,6 +2,8 @@ import abc
 from dataclasses import dataclass
 from typing import List, Optional
 from .custom_uuid import UUID
+from .page import Page
+from .scenario_fingerprint import ScenarioContentHash
 from datetime import datetime  # datetimeをインポート
 
 @dataclass
@@ -12,20 +14,50 @@ class Scenario:
     target_method: str
     negative_method_group: str
     created_at: datetime  # created_atフィールドを追加
+    # state / method_group / target_methodから求めるハッシュ。同じ内容のScenarioは1件しか保存しない
+    content_hash: Optional[str] = None
+    # 保存時に見つかった、内容がよく似た既存のScenarioのID
+    near_duplicate_of: Optional[UUID] = None
+
+    def ensure_content_hash(self) -> str:
+        if self.content_hash is None:
+            self.content_hash = ScenarioContentHash(self.state, self.method_group, self.target_method)
+        return self.content_hash
 
 class ScenarioRepository(abc.ABC):
     @abc.abstractmethod
     def create(self, scenario: Scenario) -> Scenario:
+        """内容が同じScenarioがすでにある場合は保存せず、既存のScenarioを返す"""
+        pass
+
+    @abc.abstractmethod
+    def create_many(self, scenarios: List[Scenario]) -> List[Scenario]:
+        """
+        Scenarioをまとめて保存し、実際に保存したものを返す。
+        内容が既存のScenario(または先に渡したScenario)と同じものは保存せず、結果にも含めない。
+        """
         pass
 
     @abc.abstractmethod
     def find_by_id(self, scenario_id: UUID) -> Optional[Scenario]:
         pass
 
+    @abc.abstractmethod
+    def find_by_ids(self, scenario_ids: List[UUID]) -> List[Scenario]:
+        pass
+
+    @abc.abstractmethod
+    def find_by_content_hash(self, content_hash: str) -> Optional[Scenario]:
+        pass
+
     @abc.abstractmethod
     def find_all(self) -> List[Scenario]:
         pass
 
+    @abc.abstractmethod
+    def find_page(self, limit: int, cursor: Optional[str] = None) -> Page[Scenario]:
+        pass
+
     @abc.abstractmethod
     def update(self, scenario: Scenario) -> None:
         pass
@@ -34,6 +66,10 @@ class ScenarioRepository(abc.ABC):
     def delete(self, scenario_id: UUID) -> None:
         pass
 
+    @abc.abstractmethod
+    def delete_many(self, scenario_ids: List[UUID]) -> List[UUID]:
+        pass
+
 def NewScenario(
     ID: UUID,  # IDを引数として受け取る
     state: str,
@@ -52,4 +88,5 @@ def NewScenario(
         target_method=target_method,
         negative_method_group=negative_method_group,
         created_at=created_at, # created_atを渡す
+        content_hash=ScenarioContentHash(state, method_group, target_method),
     )
\ No newline at end of file
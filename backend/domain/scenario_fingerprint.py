@@ -0,0 +1,114 @@
+import hashlib
+import re
+import struct
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .custom_uuid import UUID
+
+# MinHashの設定。BANDS × ROWS_PER_BAND = NUM_PERM
+# Jaccard類似度が (1 / BANDS) ** (1 / ROWS_PER_BAND) ≒ 0.71 を超えるあたりから候補として検出される
+NUM_PERM = 128
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+
+# stateを単語のn-gramに分割するときのn
+SHINGLE_SIZE = 3
+
+_MAX_HASH = (1 << 32) - 1
+# BIGINT(符号付き)の列に収まるようにバンドのキーを63ビットに切り詰める
+_BAND_KEY_MASK = (1 << 63) - 1
+
+# シングル1つにつきSHAKE-128でNUM_PERM個の32ビット値を一度に作り、それぞれを独立したハッシュ関数として扱う。
+# 係数を使った (a * h + b) mod p の置換をNUM_PERM回計算するより大幅に速い
+_DIGEST_SIZE = NUM_PERM * 4
+_UNPACK = struct.Struct(f">{NUM_PERM}I").unpack
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# (バンド番号, バンドのキー)
+BandKey = Tuple[int, int]
+
+
+def _split_methods(method_group: str) -> List[str]:
+    return [m.strip() for m in method_group.split(",") if m.strip()]
+
+
+def _target_name(target_method: str) -> str:
+    # target_methodは "addToCart - cart, product" のように説明が付くことがある
+    return target_method.split(" - ", 1)[0].strip()
+
+
+def ScenarioContentHash(state: str, method_group: str, target_method: str) -> str:
+    """
+    Scenarioの内容(state / method_group / target_method)を表すSHA-256のハッシュ(16進数)を返す。
+    method_groupは並び順の違いを同じ内容とみなすため、メソッド名を整列してから計算する。
+    """
+    normalized = "\x1f".join([
+        " ".join(state.split()),
+        ",".join(sorted(_split_methods(method_group))),
+        " ".join(target_method.split()),
+    ])
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def _shingles(state: str, method_group: str, target_method: str) -> set:
+    tokens = _TOKEN_PATTERN.findall(state.lower())
+    if len(tokens) < SHINGLE_SIZE:
+        shingles = {" ".join(tokens)} if tokens else set()
+    else:
+        shingles = {" ".join(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)}
+    shingles.update("m:" + m.lower() for m in _split_methods(method_group))
+    shingles.add("t:" + _target_name(target_method).lower())
+    return shingles
+
+
+def _hash_values(shingle: str) -> Tuple[int, ...]:
+    # 組み込みのhash()はPYTHONHASHSEEDで変わるため使わない
+    return _UNPACK(hashlib.shake_128(shingle.encode("utf-8")).digest(_DIGEST_SIZE))
+
+
+def ScenarioMinHash(state: str, method_group: str, target_method: str) -> List[int]:
+    """
+    Scenarioの内容のMinHash署名(NUM_PERM個の32ビット値)を返す。
+    stateの単語n-gramと、メソッド名・正解メソッド名をシングルとして使う。
+    """
+    values = [_hash_values(s) for s in _shingles(state, method_group, target_method)]
+    if not values:
+        return [_MAX_HASH] * NUM_PERM
+    return [min(column) for column in zip(*values)]
+
+
+def ScenarioBandKeys(signature: Sequence[int]) -> List[BandKey]:
+    """
+    MinHash署名をBANDS個のバンドに分け、それぞれのキーを返す。
+    2つのScenarioで1つでも同じキーを持つバンドがあれば、近似重複の候補になる。
+    """
+    keys = []
+    for band in range(BANDS):
+        rows = signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]
+        digest = hashlib.blake2b(struct.pack(f">{ROWS_PER_BAND}I", *rows), digest_size=8).digest()
+        keys.append((band, int.from_bytes(digest, "big") & _BAND_KEY_MASK))
+    return keys
+
+
+class NearDuplicateIndex:
+    """
+    バンドのキーから、最初にそのキーを登録したScenarioのIDを引くメモリ上のLSHインデックス。
+    1件の検索はBANDS回の辞書参照で済み、登録済みの件数に依存しない。
+    """
+    def __init__(self):
+        self._buckets: Dict[BandKey, UUID] = {}
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def add(self, scenario_id: UUID, band_keys: Iterable[BandKey]) -> None:
+        for key in band_keys:
+            self._buckets.setdefault(key, scenario_id)
+
+    def find(self, band_keys: Iterable[BandKey]) -> Optional[UUID]:
+        for key in band_keys:
+            found = self._buckets.get(key)
+            if found is not None:
+                return found
+        return None
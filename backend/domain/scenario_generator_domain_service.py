@@ -1,10 +1,14 @@
 import abc
-from typing import List
+from typing import Iterator
 
 from .log_generation_config import LogGenerationConfig
 from .scenario import Scenario
 
 class ScenarioGeneratorDomainService(abc.ABC):
     @abc.abstractmethod
-    def generate_scenarios(self, config: LogGenerationConfig) -> List[Scenario]:
-        pass
\ No newline at end of file
+    def generate_scenarios(self, config: LogGenerationConfig) -> Iterator[Scenario]:
+        """
+        設定に基づいてシナリオを1件ずつ生成する。
+        output_countが大きくてもメモリに全件を保持しないよう、イテレータとして返す。
+        """
+        pass
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional
 from .custom_uuid import UUID
+from .page import Page
 
 @dataclass
 class TrainedModel:
@@ -26,6 +27,10 @@ class TrainedModelRepository(abc.ABC):
     def find_all(self) -> List[TrainedModel]:
         pass
 
+    @abc.abstractmethod
+    def find_page(self, limit: int, cursor: Optional[str] = None) -> Page[TrainedModel]:
+        pass
+
     @abc.abstractmethod
     def update(self, model: TrainedModel) -> None:
         pass
@@ -34,6 +39,10 @@ class TrainedModelRepository(abc.ABC):
     def delete(self, model_id: UUID) -> None:
         pass
 
+    @abc.abstractmethod
+    def delete_many(self, model_ids: List[UUID]) -> List[UUID]:
+        pass
+
 def NewTrainedModel(
     ID: UUID,
     name: str,
@@ -2,6 +2,7 @@ import abc
 from dataclasses import dataclass
 from typing import List, Optional
 from .custom_uuid import UUID
+from .page import Page
 from datetime import datetime # datetimeをインポート
 
 @dataclass
@@ -18,14 +19,30 @@ class TrainingReadyScenarioRepository(abc.ABC):
     def create(self, scenario: TrainingReadyScenario) -> TrainingReadyScenario:
         pass
 
+    @abc.abstractmethod
+    def create_many(self, scenarios: List[TrainingReadyScenario]) -> List[TrainingReadyScenario]:
+        pass
+
     @abc.abstractmethod
     def find_by_id(self, scenario_id: UUID) -> Optional[TrainingReadyScenario]:
         pass
 
+    @abc.abstractmethod
+    def find_by_ids(self, scenario_ids: List[UUID]) -> List[TrainingReadyScenario]:
+        pass
+
+    @abc.abstractmethod
+    def find_unformed(self, limit: int, after_id: Optional[UUID] = None) -> List[TrainingReadyScenario]:
+        pass
+
     @abc.abstractmethod
     def find_all(self) -> List[TrainingReadyScenario]:
         pass
 
+    @abc.abstractmethod
+    def find_page(self, limit: int, cursor: Optional[str] = None) -> Page[TrainingReadyScenario]:
+        pass
+
     @abc.abstractmethod
     def update(self, scenario: TrainingReadyScenario) -> None:
         pass
@@ -34,6 +51,10 @@ class TrainingReadyScenarioRepository(abc.ABC):
     def delete(self, scenario_id: UUID) -> None:
         pass
 
+    @abc.abstractmethod
+    def delete_many(self, scenario_ids: List[UUID]) -> List[UUID]:
+        pass
+
 def NewTrainingReadyScenario(
     ID: UUID,
     Scenario_ID: UUID,
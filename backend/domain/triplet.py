@@ -2,6 +2,7 @@ import abc
 from dataclasses import dataclass
 from typing import List, Optional
 from .custom_uuid import UUID
+from .page import Page
 from datetime import datetime  # datetimeをインポート
 
 @dataclass
@@ -18,14 +19,26 @@ class TripletRepository(abc.ABC):
     def create(self, triplet: Triplet) -> Triplet:
         pass
 
+    @abc.abstractmethod
+    def create_many(self, triplets: List[Triplet]) -> List[Triplet]:
+        pass
+
     @abc.abstractmethod
     def find_by_id(self, triplet_id: UUID) -> Optional[Triplet]:
         pass
 
+    @abc.abstractmethod
+    def find_by_ids(self, triplet_ids: List[UUID]) -> List[Triplet]:
+        pass
+
     @abc.abstractmethod
     def find_all(self) -> List[Triplet]:
         pass
 
+    @abc.abstractmethod
+    def find_page(self, limit: int, cursor: Optional[str] = None) -> Page[Triplet]:
+        pass
+
     @abc.abstractmethod
     def update(self, triplet: Triplet) -> None:
         pass
@@ -34,6 +47,10 @@ class TripletRepository(abc.ABC):
     def delete(self, triplet_id: UUID) -> None:
         pass
 
+    @abc.abstractmethod
+    def delete_many(self, triplet_ids: List[UUID]) -> List[UUID]:
+        pass
+
 def NewTriplet(
     ID: UUID,
     TrainingReadyScenario_ID: UUID,
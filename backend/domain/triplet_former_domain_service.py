@@ -1,4 +1,5 @@
 import abc
+from typing import List
 
 from .training_ready_scenario import TrainingReadyScenario
 from .triplet import Triplet
@@ -6,4 +7,8 @@ from .triplet import Triplet
 class TripletFormerDomainService(abc.ABC):
     @abc.abstractmethod
     def form_triplets_from(self, scenario: TrainingReadyScenario) -> Triplet:
+        pass
+
+    @abc.abstractmethod
+    def form_triplets_from_many(self, scenarios: List[TrainingReadyScenario]) -> List[Triplet]:
         pass
\ No newline at end of file
@@ -12,6 +12,8 @@ class MySQLConfig:
     user: str
     password: str
     database: str
+    # IDの保存形式 ("char36" または "binary16")。binary16はマイグレーションの適用が必要
+    uuid_storage: str = "char36"
 
 def NewMySQLConfigFromEnv() -> MySQLConfig:
     """
@@ -23,6 +25,7 @@ def NewMySQLConfigFromEnv() -> MySQLConfig:
     DB_USER=root
     DB_PASSWORD=your_local_password
     DB_NAME=method_selector_db
+    DB_UUID_STORAGE=char36  # 省略可。BINARY(16)で保存する場合は binary16
     """
     load_dotenv()
 
@@ -31,6 +34,7 @@ def NewMySQLConfigFromEnv() -> MySQLConfig:
     user = os.getenv("DB_USER")
     password = os.getenv("DB_PASSWORD")
     database = os.getenv("DB_NAME")
+    uuid_storage = os.getenv("DB_UUID_STORAGE", "char36")
 
     if not all([host, port_str, user, password, database]):
         raise ValueError(".envファイルに必要なデータベース設定がすべて含まれていません。")
@@ -40,10 +44,14 @@ def NewMySQLConfigFromEnv() -> MySQLConfig:
     except ValueError:
         raise ValueError("DB_PORTは有効な整数である必要があります。")
 
+    if uuid_storage not in ("char36", "binary16"):
+        raise ValueError("DB_UUID_STORAGEは char36 または binary16 である必要があります。")
+
     return MySQLConfig(
         host=host,
         port=port,
         user=user,
         password=password,
         database=database,
+        uuid_storage=uuid_storage,
     )
\ No newline at end of file
@@ -1,77 +1,137 @@
 # backend/infrastructure/database/models.py
-from sqlalchemy import Column, String, Text, DateTime, JSON, Float, ForeignKey, func
+import os
+from dotenv import load_dotenv
+from sqlalchemy import Column, String, Text, DateTime, JSON, Float, Integer, BigInteger, SmallInteger, BINARY, ForeignKey, Index, func
 from sqlalchemy.orm import declarative_base
 import datetime
 
+load_dotenv()
+
+# IDを保持する列の型。DB_UUID_STORAGE=binary16 の場合は16バイトのバイナリで保存する
+IDType = BINARY(16) if os.getenv("DB_UUID_STORAGE", "char36") == "binary16" else String(36)
+
 # 全モデル共通の親クラス
 Base = declarative_base()
 
 # `datasets`テーブルの定義
 class Dataset(Base):
     __tablename__ = 'datasets'
-    id = Column(String(36), primary_key=True)
+    id = Column(IDType, primary_key=True)
     name = Column(String(255), nullable=False)
     description = Column(Text)
     type = Column(String(50))
-    triplet_ids = Column(JSON)
+    # メンバー数。メンバーのIDそのものはdataset_tripletsに保持する
+    triplet_count = Column(Integer, nullable=False, default=0, server_default='0')
     created_at = Column(DateTime, nullable=False, default=datetime.datetime.now, server_default=func.now())
+    __table_args__ = (
+        Index('ix_datasets_created_at_id', 'created_at', 'id'),
+    )
+
+# `dataset_triplets`テーブルの定義 (Datasetのメンバーを1行ずつ保持する)
+class DatasetTriplet(Base):
+    __tablename__ = 'dataset_triplets'
+    dataset_id = Column(IDType, ForeignKey('datasets.id', ondelete='CASCADE'), primary_key=True)
+    # Datasetは構成時点のスナップショットのため、Triplet側の削除には追従させない
+    triplet_id = Column(IDType, nullable=False)
+    position = Column(Integer, primary_key=True, autoincrement=False)
+    __table_args__ = (
+        Index('ix_dataset_triplets_triplet_id', 'triplet_id'),
+    )
 
 # `scenarios`テーブルの定義
 class Scenario(Base):
     __tablename__ = 'scenarios'
-    id = Column(String(36), primary_key=True)
+    id = Column(IDType, primary_key=True)
     state = Column(Text, nullable=False)
     method_group = Column(Text, nullable=False)
     target_method = Column(Text, nullable=False)
     negative_method_group = Column(Text, nullable=False)
     created_at = Column(DateTime, nullable=False, default=datetime.datetime.now, server_default=func.now())
+    # state / method_group / target_methodのSHA-256。同じ内容のシナリオは1件しか保存しない
+    content_hash = Column(String(64), nullable=True)
+    # 保存時にMinHashで見つかった、内容がよく似たシナリオ
+    near_duplicate_of = Column(IDType, ForeignKey('scenarios.id', ondelete='SET NULL', name='fk_scenarios_near_duplicate_of'), nullable=True)
+    __table_args__ = (
+        Index('ix_scenarios_created_at_id', 'created_at', 'id'),
+        Index('ux_scenarios_content_hash', 'content_hash', unique=True),
+        Index('ix_scenarios_near_duplicate_of', 'near_duplicate_of'),
+    )
+
+# `scenario_lsh_bands`テーブルの定義 (近似重複検出用のMinHash LSHインデックス)
+class ScenarioLSHBand(Base):
+    __tablename__ = 'scenario_lsh_bands'
+    band = Column(SmallInteger, primary_key=True, autoincrement=False)
+    band_key = Column(BigInteger, primary_key=True, autoincrement=False)
+    scenario_id = Column(IDType, ForeignKey('scenarios.id', ondelete='CASCADE'), primary_key=True)
+    __table_args__ = (
+        Index('ix_scenario_lsh_bands_scenario_id', 'scenario_id'),
+    )
 
 # `training_ready_scenarios`テーブルの定義
 class TrainingReadyScenario(Base):
     __tablename__ = 'training_ready_scenarios'
-    id = Column(String(36), primary_key=True)
-    scenario_id = Column(String(36), ForeignKey('scenarios.id'), nullable=False)
+    id = Column(IDType, primary_key=True)
+    scenario_id = Column(IDType, ForeignKey('scenarios.id'), nullable=False)
     state = Column(Text, nullable=False)
     method_group = Column(Text, nullable=False)
     negative_method_group = Column(Text, nullable=False)
     created_at = Column(DateTime, nullable=False, default=datetime.datetime.now, server_default=func.now())
+    __table_args__ = (
+        Index('ix_training_ready_scenarios_scenario_id', 'scenario_id'),
+        Index('ix_training_ready_scenarios_created_at_id', 'created_at', 'id'),
+    )
 
 # `triplets`テーブルの定義
 class Triplet(Base):
     __tablename__ = 'triplets'
-    id = Column(String(36), primary_key=True)
-    training_ready_scenario_id = Column(String(36), ForeignKey('training_ready_scenarios.id'), nullable=False)
+    id = Column(IDType, primary_key=True)
+    training_ready_scenario_id = Column(IDType, ForeignKey('training_ready_scenarios.id'), nullable=False)
     anchor = Column(Text, nullable=False)
     positive = Column(Text, nullable=False)
     negative = Column(Text, nullable=False)
     created_at = Column(DateTime, nullable=False, default=datetime.datetime.now, server_default=func.now())
+    __table_args__ = (
+        Index('ix_triplets_training_ready_scenario_id', 'training_ready_scenario_id'),
+        Index('ix_triplets_created_at_id', 'created_at', 'id'),
+    )
 
 # `trained_models`テーブルの定義
 class TrainedModel(Base):
     __tablename__ = 'trained_models'
-    id = Column(String(36), primary_key=True)
+    id = Column(IDType, primary_key=True)
     name = Column(String(255), nullable=False)
-    dataset_id = Column(String(36), ForeignKey('datasets.id'), nullable=False)
+    dataset_id = Column(IDType, ForeignKey('datasets.id'), nullable=False)
     description = Column(Text)
     file_path = Column(String(255))
     created_at = Column(DateTime, nullable=False, default=datetime.datetime.now, server_default=func.now())
+    __table_args__ = (
+        Index('ix_trained_models_dataset_id', 'dataset_id'),
+        Index('ix_trained_models_created_at_id', 'created_at', 'id'),
+    )
 
 # `model_evaluation_sessions`テーブルの定義
 class ModelEvaluationSession(Base):
     __tablename__ = 'model_evaluation_sessions'
-    id = Column(String(36), primary_key=True)
-    trained_model_id = Column(String(36), ForeignKey('trained_models.id'), nullable=False)
-    dataset_id = Column(String(36), ForeignKey('datasets.id'), nullable=False)
+    id = Column(IDType, primary_key=True)
+    trained_model_id = Column(IDType, ForeignKey('trained_models.id'), nullable=False)
+    dataset_id = Column(IDType, ForeignKey('datasets.id'), nullable=False)
     summary_metrics = Column(JSON)
     created_at = Column(DateTime, nullable=False, default=datetime.datetime.now, server_default=func.now())
+    __table_args__ = (
+        Index('ix_model_evaluation_sessions_trained_model_id', 'trained_model_id'),
+        Index('ix_model_evaluation_sessions_dataset_id', 'dataset_id'),
+    )
 
 # `individual_evaluation_results`テーブルの定義
 class IndividualEvaluationResult(Base):
     __tablename__ = 'individual_evaluation_results'
-    id = Column(String(36), primary_key=True)
-    model_evaluation_session_id = Column(String(36), ForeignKey('model_evaluation_sessions.id'), nullable=False)
-    test_data_id = Column(String(36), nullable=False)
+    id = Column(IDType, primary_key=True)
+    model_evaluation_session_id = Column(IDType, ForeignKey('model_evaluation_sessions.id'), nullable=False)
+    test_data_id = Column(IDType, nullable=False)
     inference_time_ms = Column(Float)
     power_consumption_mw = Column(Float)
     llm_judge_score = Column(Float)
-    llm_judge_reasoning = Column(Text)
\ No newline at end of file
+    llm_judge_reasoning = Column(Text)
+    __table_args__ = (
+        Index('ix_individual_evaluation_results_session_id', 'model_evaluation_session_id'),
+    )
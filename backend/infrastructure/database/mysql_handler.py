@@ -1,10 +1,11 @@
 import mysql.connector
 from mysql.connector import pooling
-from typing import Any, List, Optional
+from typing import Any, Callable, Iterator, List, Optional
 
 # --- 依存するインターフェースと設定クラスをインポート ---
-from adapter.repository.sql import SQL, Tx, Row, Rows, RowData
+from adapter.repository.sql import SQL, Tx, Row, Rows, RowData, DEFAULT_STREAM_BATCH_SIZE
 from infrastructure.database.config import MySQLConfig
+from infrastructure.database.uuid_codec import UUIDCodec, NewUUIDCodec
 
 
 # --- Rows / Row インターフェースのMySQL実装 ---
@@ -42,6 +43,12 @@ class MySQLRows(Rows):
     def __init__(self, rows_data: List[RowData]):
         self._rows_data = rows_data
 
+    def __enter__(self) -> "MySQLRows":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
     def __iter__(self):
         return iter(self._rows_data)
 
@@ -52,6 +59,94 @@ class MySQLRows(Rows):
     def close(self) -> None:
         pass
 
+    def fetchone(self) -> Optional[RowData]:
+        return self._rows_data[0] if self._rows_data else None
+
+    def fetchall(self) -> List[RowData]:
+        return self._rows_data
+
+    def fetchmany(self, size: Optional[int] = None) -> List[RowData]:
+        return self._rows_data[:size or DEFAULT_STREAM_BATCH_SIZE]
+
+    def iter_batches(self, size: Optional[int] = None) -> Iterator[List[RowData]]:
+        size = size or DEFAULT_STREAM_BATCH_SIZE
+        for i in range(0, len(self._rows_data), size):
+            yield self._rows_data[i:i + size]
+
+
+class MySQLStreamingRows(Rows):
+    """
+    非バッファカーソルをラップし、結果行をサーバーから少しずつ読み出すクラス。
+    結果セット全体をメモリに載せないため、大きなテーブルの全件読み込みやエクスポートに使う。
+    読み切った時点、またはclose()が呼ばれた時点でカーソルを閉じ、on_closeを呼び出す。
+    """
+    def __init__(self, conn, cursor, batch_size: int, on_close: Callable[[], None], codec: Optional[UUIDCodec] = None):
+        self._conn = conn
+        self._cursor = cursor
+        self._batch_size = batch_size
+        self._on_close = on_close
+        self._codec = codec or NewUUIDCodec()
+        self._closed = False
+        self._err: Optional[Exception] = None
+
+    def __enter__(self) -> "MySQLStreamingRows":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __iter__(self):
+        for batch in self.iter_batches():
+            yield from batch
+
+    def iter_batches(self, size: Optional[int] = None) -> Iterator[List[RowData]]:
+        try:
+            while True:
+                batch = self.fetchmany(size)
+                if not batch:
+                    return
+                yield batch
+        finally:
+            # ジェネレータが途中で破棄された場合も接続を返却する
+            self.close()
+
+    def fetchmany(self, size: Optional[int] = None) -> List[RowData]:
+        if self._closed:
+            return []
+        try:
+            rows = self._cursor.fetchmany(size or self._batch_size)
+        except Exception as e:
+            self._err = e
+            self.close()
+            raise
+        if not rows:
+            self.close()
+        return self._codec.decode_rows(rows)
+
+    def fetchone(self) -> Optional[RowData]:
+        rows = self.fetchmany(1)
+        return rows[0] if rows else None
+
+    def fetchall(self) -> List[RowData]:
+        return list(self)
+
+    def next(self) -> bool:
+        return not self._closed
+
+    def err(self) -> Optional[Exception]:
+        return self._err
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            # 非バッファカーソルは未読の行を読み捨てないと接続を再利用できない
+            self._conn.consume_results()
+            self._cursor.close()
+        finally:
+            self._on_close()
+
 
 # --- Transaction インターフェースのMySQL実装 ---
 
@@ -59,31 +154,49 @@ class MySQLTx(Tx):
     """
     トランザクションをラップするクラス。
     """
-    def __init__(self, connection):
+    def __init__(self, connection, codec: Optional[UUIDCodec] = None):
         self.conn = connection
+        self.codec = codec or NewUUIDCodec()
         self.conn.start_transaction()
         self.cursor = self.conn.cursor()
 
     def execute(self, query: str, *params: Any) -> None:
-        self.cursor.execute(query, params)
+        self.cursor.execute(query, self.codec.encode_params(params))
 
     def query(self, query: str, *params: Any) -> Rows:
-        self.cursor.execute(query, params)
+        self.cursor.execute(query, self.codec.encode_params(params))
         rows_data = self.cursor.fetchall()
-        return MySQLRows(rows_data)
+        return MySQLRows(self.codec.decode_rows(rows_data))
 
     def query_row(self, query: str, *params: Any) -> Row:
-        self.cursor.execute(query, params)
+        self.cursor.execute(query, self.codec.encode_params(params))
         row_data = self.cursor.fetchone()
-        return MySQLRow(row_data)
+        return MySQLRow(self.codec.decode_row(row_data))
+
+    def query_stream(self, query: str, *params: Any, batch_size: int = DEFAULT_STREAM_BATCH_SIZE) -> Rows:
+        # 接続はトランザクションが所有しているため、ここでは返却しない
+        cursor = self.conn.cursor(buffered=False)
+        cursor.execute(query, self.codec.encode_params(params))
+        return MySQLStreamingRows(self.conn, cursor, batch_size, on_close=lambda: None, codec=self.codec)
 
     def commit(self) -> None:
-        self.conn.commit()
-        self.cursor.close()
+        try:
+            self.conn.commit()
+        finally:
+            self._release()
 
     def rollback(self) -> None:
-        self.conn.rollback()
-        self.cursor.close()
+        try:
+            self.conn.rollback()
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        # カーソルを閉じ、プールから借りた接続を返却する
+        try:
+            self.cursor.close()
+        finally:
+            self.conn.close()
 
 
 # --- Main SQL インターフェースのMySQL実装 ---
@@ -91,8 +204,10 @@ class MySQLTx(Tx):
 class MySQLHandler(SQL):
     """
     データベース接続全体を管理するハンドラ。
+    パラメータのUUIDオブジェクトと結果行のIDは、config.uuid_storageに従ってここで変換する。
     """
     def __init__(self, config: MySQLConfig):
+        self.codec = NewUUIDCodec(config.uuid_storage)
         try:
             self.pool = mysql.connector.pooling.MySQLConnectionPool(
                 pool_name="mysql_pool",
@@ -118,7 +233,7 @@ class MySQLHandler(SQL):
         conn = self._get_connection()
         try:
             with conn.cursor() as cur:
-                cur.execute(query, params)
+                cur.execute(query, self.codec.encode_params(params))
             conn.commit()
         except Exception as e:
             conn.rollback()
@@ -131,26 +246,39 @@ class MySQLHandler(SQL):
         rows_data = []
         try:
             with conn.cursor() as cur:
-                cur.execute(query, params)
+                cur.execute(query, self.codec.encode_params(params))
                 rows_data = cur.fetchall()
         finally:
             self._put_connection(conn)
-        return MySQLRows(rows_data)
+        return MySQLRows(self.codec.decode_rows(rows_data))
 
     def query_row(self, query: str, *params: Any) -> Row:
         conn = self._get_connection()
         row_data = None
         try:
             with conn.cursor() as cur:
-                cur.execute(query, params)
+                cur.execute(query, self.codec.encode_params(params))
                 row_data = cur.fetchone()
         finally:
             self._put_connection(conn)
-        return MySQLRow(row_data)
+        return MySQLRow(self.codec.decode_row(row_data))
+
+    def query_stream(self, query: str, *params: Any, batch_size: int = DEFAULT_STREAM_BATCH_SIZE) -> Rows:
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor(buffered=False)
+            cursor.execute(query, self.codec.encode_params(params))
+        except Exception:
+            self._put_connection(conn)
+            raise
+        # 接続はイテレータが生きている間だけ占有し、読み切りかcloseでプールに返却する
+        return MySQLStreamingRows(
+            conn, cursor, batch_size, on_close=lambda: self._put_connection(conn), codec=self.codec
+        )
 
     def begin_tx(self) -> Tx:
         conn = self._get_connection()
-        return MySQLTx(conn)
+        return MySQLTx(conn, self.codec)
 
 
 def NewMySQLHandler(config: MySQLConfig) -> MySQLHandler:
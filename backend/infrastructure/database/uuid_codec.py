@@ -0,0 +1,57 @@
+import uuid
+from typing import Any, List, Optional, Sequence, Tuple
+
+from domain import UUID
+from adapter.repository.sql import RowData
+
+# IDの保存形式
+# - char36: 36文字の文字列 (VARCHAR(36))。既定値
+# - binary16: 16バイトのバイナリ (BINARY(16))。キーとインデックスが半分以下になる
+UUID_STORAGE_CHAR36 = "char36"
+UUID_STORAGE_BINARY16 = "binary16"
+UUID_STORAGES = (UUID_STORAGE_CHAR36, UUID_STORAGE_BINARY16)
+
+
+class UUIDCodec:
+    """
+    ドメインのUUIDとデータベース上のIDの表現を相互に変換するクラス。
+    リポジトリはパラメータとしてUUIDオブジェクトをそのまま渡し、結果行のIDは常に文字列で受け取る。
+    保存形式の違いはこのクラスに閉じ込め、ドメイン層とリポジトリからは見えないようにする。
+    """
+    def __init__(self, storage: str = UUID_STORAGE_CHAR36):
+        if storage not in UUID_STORAGES:
+            raise ValueError(f"unknown uuid storage: {storage}")
+        self.storage = storage
+        self.binary = storage == UUID_STORAGE_BINARY16
+
+    def encode_params(self, params: Sequence[Any]) -> Tuple[Any, ...]:
+        """パラメータに含まれるUUIDオブジェクトを保存形式に変換する"""
+        return tuple(self._encode(p) if isinstance(p, UUID) else p for p in params)
+
+    def decode_row(self, row_data: Optional[RowData]) -> Optional[RowData]:
+        """binary16の場合、結果行に含まれる16バイトのIDを文字列表現に戻す"""
+        if not self.binary or row_data is None:
+            return row_data
+        return tuple(self._decode(v) if isinstance(v, (bytes, bytearray)) and len(v) == 16 else v for v in row_data)
+
+    def decode_rows(self, rows_data: List[RowData]) -> List[RowData]:
+        if not self.binary:
+            return rows_data
+        return [self.decode_row(row_data) for row_data in rows_data]
+
+    def _encode(self, value: UUID) -> Any:
+        if self.binary:
+            # UUIDv7はバイト列の先頭がタイムスタンプのため、そのまま格納すれば時刻順に並ぶ
+            return uuid.UUID(value.value).bytes
+        return value.value
+
+    @staticmethod
+    def _decode(value: bytes) -> str:
+        return str(uuid.UUID(bytes=bytes(value)))
+
+
+def NewUUIDCodec(storage: str = UUID_STORAGE_CHAR36) -> UUIDCodec:
+    """
+    UUIDCodecのインスタンスを生成するファクトリ関数。
+    """
+    return UUIDCodec(storage)
@@ -0,0 +1,33 @@
+import unittest
+import uuid
+
+from domain import UUID
+from infrastructure.database.uuid_codec import UUIDCodec, UUID_STORAGE_BINARY16, UUID_STORAGE_CHAR36
+
+
+class TestUUIDCodec(unittest.TestCase):
+    def setUp(self):
+        self.value = "0190f5c2-7a1b-7c3d-8e4f-0123456789ab"
+
+    def test_char36_passes_strings_through(self):
+        codec = UUIDCodec(UUID_STORAGE_CHAR36)
+
+        self.assertEqual(codec.encode_params((UUID(value=self.value), 10)), (self.value, 10))
+        row = (self.value, b"0123456789abcdef")
+        self.assertIs(codec.decode_row(row), row)
+
+    def test_binary16_round_trips_ids(self):
+        codec = UUIDCodec(UUID_STORAGE_BINARY16)
+
+        encoded, limit = codec.encode_params((UUID(value=self.value), 10))
+        self.assertEqual(encoded, uuid.UUID(self.value).bytes)
+        self.assertEqual(limit, 10)
+        self.assertEqual(codec.decode_rows([(bytearray(encoded), "state")]), [(self.value, "state")])
+
+    def test_rejects_unknown_storage(self):
+        with self.assertRaises(ValueError):
+            UUIDCodec("binary32")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,58 +1,218 @@
+import heapq
+import multiprocessing
 import random
-from typing import List
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import count
+from typing import Deque, Iterable, Iterator, List, Optional, Set, Tuple
 from datetime import datetime  # datetimeをインポート
 
 from domain.log_generation_config import LogGenerationConfig
+from domain.method_profile import MethodProfile
+from domain.situation import Situation
 from domain.scenario import Scenario, NewScenario
+from domain.scenario_fingerprint import ScenarioContentHash
 from domain.custom_uuid import NewUUID  # 修正: 正しいファイルからインポート
 from domain.scenario_generator_domain_service import ScenarioGeneratorDomainService
 
+# 1つのワーカーにまとめて渡すシナリオ数の既定値
+DEFAULT_SHARD_SIZE = 10000
+
+# 重複を読み飛ばすとき、この回数続けて重複した場合は組み合わせを使い切ったとみなして終了する
+MAX_CONSECUTIVE_DUPLICATES = 10000
+
+# (state, method_group, target_method, negative_method_group)
+ScenarioContent = Tuple[str, str, str, str]
+
+
 class ScenarioGeneratorDomainServiceImpl(ScenarioGeneratorDomainService):
     """
     ScenarioGeneratorDomainServiceの具体的な実装クラス。
+    SituationとMethodProfile(正解メソッド)の直積を順に巡り、
+    context_keywordsが重なるメソッドを優先してディストラクタに選ぶ。
+    workersが2以上の場合は、インデックスの区間(シャード)ごとにプロセスプールで内容を作る。
     """
-    def generate_scenarios(self, config: LogGenerationConfig) -> List[Scenario]:
+    def __init__(self, workers: int = 1, shard_size: int = DEFAULT_SHARD_SIZE):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if shard_size < 1:
+            raise ValueError("shard_size must be at least 1")
+        self.workers = workers
+        self.shard_size = shard_size
+
+    def generate_scenarios(self, config: LogGenerationConfig) -> Iterator[Scenario]:
+        """
+        設定に基づいて、指定された数のシナリオを1件ずつ生成する。
+        k番目のシナリオは (seed, k) だけから決まる乱数で作るため、
+        seedを指定すれば何件目から読んでも、何プロセスで作っても同じ内容になり、
+        メモリ使用量は件数に依存しない。
+        """
+        if config.output_count <= 0:
+            return iter(())
+        if not config.situations:
+            raise ValueError("at least one situation is required")
+        if len(config.method_pool) < 2:
+            raise ValueError("method_pool must contain at least two methods")
+
+        seed = config.seed if config.seed is not None else random.getrandbits(64)
+        # 重複を読み飛ばす場合は、output_count件そろうまでインデックスを進める
+        end = None if config.skip_duplicates else config.output_count
+        if self.workers > 1 and config.output_count > self.shard_size:
+            contents = self._generate_parallel(config, seed, end)
+        else:
+            contents = _GenerationPlan.build(config, seed).contents(0, end)
+        return self._to_scenarios(contents, config)
+
+    def _to_scenarios(self, contents: Iterator[ScenarioContent], config: LogGenerationConfig) -> Iterator[Scenario]:
         """
-        設定に基づいて、指定された数のシナリオを生成する。
-        この実装では、あらかじめ用意された固定のモックシナリオを返す。
+        内容の列をScenarioに変換する。重複の判定はインデックス順に親プロセスで行うため、
+        結果は並列化の有無によらず同じになる。
         """
-        
-        # モックとして用意したシナリオのリスト (英語)
-        mock_scenarios = [
-            NewScenario(
-                ID=NewUUID(),
-                state="User is on the login page",
-                method_group="emailLogin, googleLogin, appleLogin",
-                target_method="emailLogin - Login with email and password",
-                negative_method_group="googleLogin, appleLogin",
-                created_at=datetime.now() # created_atを追加
-            ),
-            NewScenario(
-                ID=NewUUID(),
-                state="User pressed 'Add to Cart' on the product detail page",
-                method_group="addToCart, viewCart, checkout",
-                target_method="addToCart - Add product to the shopping cart",
-                negative_method_group="viewCart, checkout",
-                created_at=datetime.now() # created_atを追加
-            ),
-            NewScenario(
-                ID=NewUUID(),
-                state="User entered credit card information on the payment screen",
-                method_group="validateCard, processPayment, showReceipt",
-                target_method="processPayment - Execute the payment process",
-                negative_method_group="validateCard, showReceipt",
-                created_at=datetime.now() # created_atを追加
-            ),
-            NewScenario(
-                ID=NewUUID(),
-                state="User opened the profile edit page",
-                method_group="updateProfile, changePassword, uploadAvatar",
-                target_method="updateProfile - Update user information",
-                negative_method_group="changePassword, uploadAvatar",
-                created_at=datetime.now() # created_atを追加
+        # 内容のハッシュの先頭64ビットだけを保持してメモリを抑える
+        seen: Set[int] = set()
+        produced = 0
+        consecutive_duplicates = 0
+        try:
+            for state, method_group, target_method, negative_method_group in contents:
+                if produced >= config.output_count:
+                    break
+                if config.skip_duplicates:
+                    key = int(ScenarioContentHash(state, method_group, target_method)[:16], 16)
+                    if key in seen:
+                        consecutive_duplicates += 1
+                        if consecutive_duplicates > MAX_CONSECUTIVE_DUPLICATES:
+                            break
+                        continue
+                    seen.add(key)
+                    consecutive_duplicates = 0
+
+                # IDと作成日時は親プロセスで振り、UUIDv7の生成順を保つ
+                yield NewScenario(
+                    ID=NewUUID(),
+                    state=state,
+                    method_group=method_group,
+                    target_method=target_method,
+                    negative_method_group=negative_method_group,
+                    created_at=datetime.now() # created_atを追加
+                )
+                produced += 1
+        finally:
+            contents.close()
+
+    def _generate_parallel(self, config: LogGenerationConfig, seed: int, end: Optional[int]) -> Iterator[ScenarioContent]:
+        """
+        [start, start + shard_size) のシャードをワーカーに割り当て、投入した順に結果を取り出す。
+        先行して投入するシャードはworkersの2倍までに抑え、未読の結果を溜め込まない。
+        endがNoneの場合は、読み出し側が止めるまでシャードを作り続ける。
+        """
+        starts: Iterable[int] = count(0, self.shard_size) if end is None else range(0, end, self.shard_size)
+        shards = (
+            (start, start + self.shard_size if end is None else min(start + self.shard_size, end))
+            for start in starts
+        )
+        # リクエストを処理するスレッドからforkすると、ロックを持ったままの状態を複製しうるためspawnを使う
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(config, seed),
+        )
+        pending: Deque[Future] = deque()
+        try:
+            for start, end in shards:
+                pending.append(executor.submit(_generate_shard, start, end))
+                if len(pending) >= self.workers * 2:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+@dataclass
+class _GenerationPlan:
+    """
+    シナリオの内容を決めるために、全シナリオで共通して使う前計算の結果。
+    """
+    seed: int
+    methods: List[MethodProfile]
+    states: List[str]
+    # 正解メソッドごとの (ディストラクタ候補のインデックス, 重み)
+    candidates: List[List[Tuple[int, int]]]
+    distractor_count: int
+
+    @classmethod
+    def build(cls, config: LogGenerationConfig, seed: int) -> "_GenerationPlan":
+        methods = config.method_pool
+        keywords = [_normalize_keywords(m) for m in methods]
+        return cls(
+            seed=seed,
+            methods=methods,
+            states=[_format_state(s) for s in config.situations],
+            candidates=[
+                [(j, 1 + len(keywords[i] & keywords[j])) for j in range(len(methods)) if j != i]
+                for i in range(len(methods))
+            ],
+            distractor_count=min(config.method_group_size, len(methods)) - 1,
+        )
+
+    def contents(self, start: int, end: Optional[int]) -> Iterator[ScenarioContent]:
+        """インデックスが [start, end) のシナリオの内容を順に返す。endがNoneの場合は終わりなく返す"""
+        methods = self.methods
+        combinations = len(self.states) * len(methods)
+        for k in (count(start) if end is None else range(start, end)):
+            # 文字列のseedはプロセスやPYTHONHASHSEEDに依存せず、常に同じ乱数列になる
+            rng = random.Random(f"{self.seed}:{k}")
+            # 直積 situations × methods を一巡したら、ディストラクタの選び方を変えて繰り返す
+            situation_index, target_index = divmod(k % combinations, len(methods))
+
+            distractors = _sample_weighted(rng, self.candidates[target_index], self.distractor_count)
+            group = [target_index] + distractors
+            rng.shuffle(group)
+
+            yield (
+                self.states[situation_index],
+                ", ".join(methods[i].method_name for i in group),
+                _format_target(methods[target_index]),
+                ", ".join(methods[i].method_name for i in distractors),
             )
-        ]
 
-        # output_countの数だけモックシナリオを返す
-        # 要求された数が多い場合は、用意したモックをすべて返す
-        return mock_scenarios[:config.output_count]
+
+# ワーカープロセスごとに1度だけ作るGenerationPlan
+_worker_plan: Optional[_GenerationPlan] = None
+
+
+def _init_worker(config: LogGenerationConfig, seed: int) -> None:
+    global _worker_plan
+    _worker_plan = _GenerationPlan.build(config, seed)
+
+
+def _generate_shard(start: int, end: int) -> List[ScenarioContent]:
+    return list(_worker_plan.contents(start, end))
+
+
+def _normalize_keywords(method: MethodProfile) -> Set[str]:
+    return {kw.strip().lower() for kw in method.context_keywords if kw.strip()}
+
+
+def _sample_weighted(rng: random.Random, weighted: List[Tuple[int, int]], n: int) -> List[int]:
+    """
+    重み付きの非復元抽出 (Efraimidis-Spirakis法)。
+    キーワードの重なりが大きいメソッドほど選ばれやすく、紛らわしいディストラクタになる。
+    """
+    if n <= 0:
+        return []
+    keyed = ((rng.random() ** (1.0 / weight), index) for index, weight in weighted)
+    return [index for _, index in heapq.nlargest(n, keyed)]
+
+
+def _format_state(situation: Situation) -> str:
+    parts = [situation.user_information.strip(), situation.environmental_information.strip()]
+    return ". ".join(part.rstrip(".") for part in parts if part)
+
+
+def _format_target(method: MethodProfile) -> str:
+    # 例: "addToCart - cart, product"
+    description = ", ".join(kw for kw in method.context_keywords if kw.strip())
+    return f"{method.method_name} - {description}" if description else method.method_name
@@ -0,0 +1,145 @@
+import tracemalloc
+import types
+import unittest
+from itertools import islice
+
+from domain import MethodProfile, Situation, NewLogGenerationConfig
+from infrastructure.domain.scenario_generator_domain_service_impl import ScenarioGeneratorDomainServiceImpl
+
+
+def _methods():
+    return [
+        MethodProfile(method_name="addToCart", context_keywords=["cart", "product"]),
+        MethodProfile(method_name="viewCart", context_keywords=["cart"]),
+        MethodProfile(method_name="checkout", context_keywords=["payment", "cart"]),
+        MethodProfile(method_name="emailLogin", context_keywords=["login"]),
+        MethodProfile(method_name="updateProfile", context_keywords=["profile"]),
+    ]
+
+
+def _situations():
+    return [
+        Situation(user_information="User is on the product page", environmental_information="mobile"),
+        Situation(user_information="User opened the login page", environmental_information="desktop"),
+    ]
+
+
+def _contents(scenarios):
+    return [
+        (s.state, s.method_group, s.target_method, s.negative_method_group)
+        for s in scenarios
+    ]
+
+
+class TestScenarioGeneratorDomainServiceImpl(unittest.TestCase):
+    def setUp(self):
+        self.service = ScenarioGeneratorDomainServiceImpl()
+
+    def _config(self, output_count, seed=42, method_group_size=3, skip_duplicates=True):
+        return NewLogGenerationConfig(
+            output_count=output_count,
+            method_pool=_methods(),
+            situations=_situations(),
+            seed=seed,
+            method_group_size=method_group_size,
+            skip_duplicates=skip_duplicates,
+        )
+
+    def test_covers_cross_product_of_situations_and_methods(self):
+        scenarios = list(self.service.generate_scenarios(self._config(10)))
+
+        self.assertEqual(len(scenarios), 10)
+        pairs = {(s.state, s.target_method.split(" - ")[0]) for s in scenarios}
+        self.assertEqual(len(pairs), 10)
+
+    def test_method_group_contains_target_and_distractors(self):
+        for s in self.service.generate_scenarios(self._config(50)):
+            group = [m.strip() for m in s.method_group.split(",")]
+            negatives = [m.strip() for m in s.negative_method_group.split(",")]
+            target = s.target_method.split(" - ")[0]
+
+            self.assertEqual(len(group), 3)
+            self.assertEqual(len(set(group)), 3)
+            self.assertNotIn(target, negatives)
+            self.assertEqual(set(group) - set(negatives), {target})
+
+    def test_distractors_prefer_keyword_overlap(self):
+        counts = {}
+        for s in self.service.generate_scenarios(self._config(2000, method_group_size=2, skip_duplicates=False)):
+            if s.target_method.startswith("addToCart"):
+                counts[s.negative_method_group] = counts.get(s.negative_method_group, 0) + 1
+
+        # "cart"と"product"を共有するviewCart/checkoutは、共有しないメソッドより選ばれやすい
+        self.assertGreater(counts["viewCart"], counts["emailLogin"])
+        self.assertGreater(counts["checkout"], counts["updateProfile"])
+
+    def test_same_seed_is_deterministic(self):
+        first = _contents(self.service.generate_scenarios(self._config(30, seed=7)))
+        second = _contents(self.service.generate_scenarios(self._config(30, seed=7)))
+        other = _contents(self.service.generate_scenarios(self._config(30, seed=8)))
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+
+    def test_prefix_is_stable_regardless_of_output_count(self):
+        short = _contents(self.service.generate_scenarios(self._config(20, skip_duplicates=False)))
+        long = _contents(islice(self.service.generate_scenarios(self._config(1_000_000, skip_duplicates=False)), 20))
+
+        self.assertEqual(short, long)
+
+    def test_generates_lazily_with_flat_memory(self):
+        scenarios = self.service.generate_scenarios(self._config(5_000_000, skip_duplicates=False))
+        self.assertIsInstance(scenarios, types.GeneratorType)
+
+        tracemalloc.start()
+        try:
+            for _ in islice(scenarios, 500):
+                pass
+            _, after_small = tracemalloc.get_traced_memory()
+            for _ in islice(scenarios, 3000):
+                pass
+            _, after_large = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # 読み進めてもピークメモリはほとんど増えない
+        self.assertLess(after_large - after_small, 64 * 1024)
+
+    def test_skips_exact_duplicates_until_combinations_run_out(self):
+        config = NewLogGenerationConfig(
+            output_count=100,
+            method_pool=_methods()[:2],
+            situations=_situations(),
+            seed=1,
+            method_group_size=2,
+        )
+        scenarios = list(self.service.generate_scenarios(config))
+
+        # 2 situations × 2 targets で、ディストラクタは残りの1つに決まるため内容は4通りしかない
+        self.assertEqual(len(scenarios), 4)
+        self.assertEqual(len({s.content_hash for s in scenarios}), 4)
+
+    def test_parallel_output_matches_serial(self):
+        parallel = ScenarioGeneratorDomainServiceImpl(workers=2, shard_size=37)
+        config = self._config(500, seed=3)
+
+        serial_contents = _contents(self.service.generate_scenarios(config))
+        parallel_contents = _contents(parallel.generate_scenarios(config))
+
+        self.assertEqual(parallel_contents, serial_contents)
+
+    def test_rejects_too_small_method_pool(self):
+        config = NewLogGenerationConfig(
+            output_count=1,
+            method_pool=_methods()[:1],
+            situations=_situations(),
+        )
+        with self.assertRaises(ValueError):
+            self.service.generate_scenarios(config)
+
+    def test_zero_output_count_yields_nothing(self):
+        self.assertEqual(list(self.service.generate_scenarios(self._config(0))), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -50,3 +50,16 @@ class TripletFormerDomainServiceImpl(TripletFormerDomainService):
         )
 
         return new_triplet
+
+    def form_triplets_from_many(self, scenarios: List[TrainingReadyScenario]) -> List[Triplet]:
+        """
+        複数のTrainingReadyScenarioから、まとめてTripletを生成する。
+        正例・負例を特定できないシナリオは結果に含めず、スキップする。
+        """
+        triplets = []
+        for scenario in scenarios:
+            try:
+                triplets.append(self.form_triplets_from(scenario))
+            except ValueError:
+                continue
+        return triplets
@@ -1,19 +1,23 @@
 import json
-from fastapi import APIRouter, HTTPException
+import os
+from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from dataclasses import is_dataclass
 from fastapi.responses import Response 
+from fastapi.responses import StreamingResponse
 
 # --- Controller, Presenter, Repository, Usecase imports ---
 from adapter.controller.find_all_scenario_controller import FindAllScenarioController
 from adapter.controller.generate_scenarios_controller import GenerateScenariosController
+from adapter.controller.generate_scenarios_stream_controller import GenerateScenariosStreamController
 from adapter.controller.train_new_model_controller import TrainNewModelController
 from adapter.controller.evaluate_model_controller import EvaluateModelController
 from adapter.controller.find_all_models_controller import FindAllModelsController
 from adapter.controller.find_all_triplets_controller import FindAllTripletsController
 from adapter.controller.form_triplets_from_controller import FormTripletsFromController
+from adapter.controller.form_triplets_batch_controller import FormTripletsBatchController
 from adapter.controller.process_scenario_controller import ProcessScenarioController
 from adapter.controller.delete_scenario_controller import DeleteScenarioController
 from adapter.controller.delete_model_controller import DeleteModelController
@@ -21,16 +25,23 @@ from adapter.controller.delete_triplets_controller import DeleteTripletsControll
 from adapter.controller.delete_processed_scenario_controller import DeleteProcessedScenarioController
 from adapter.controller.compose_new_dataset_controller import ComposeNewDatasetController
 from adapter.controller.delete_dataset_controller import DeleteDatasetController
+from adapter.controller.bulk_delete_scenarios_controller import BulkDeleteScenariosController
+from adapter.controller.bulk_delete_processed_scenarios_controller import BulkDeleteProcessedScenariosController
+from adapter.controller.bulk_delete_triplets_controller import BulkDeleteTripletsController
+from adapter.controller.bulk_delete_models_controller import BulkDeleteModelsController
+from adapter.controller.bulk_delete_datasets_controller import BulkDeleteDatasetsController
 from adapter.controller.find_all_processed_scenarios_controller import FindAllProcessedScenariosController
 from adapter.controller.find_all_dataset_controller import FindAllDatasetController # 追加
 
 from adapter.presenter.find_all_scenario_presenter import new_find_all_scenario_presenter
 from adapter.presenter.generate_scenarios_presenter import new_generate_scenarios_presenter
+from adapter.presenter.generate_scenarios_stream_presenter import new_generate_scenarios_stream_presenter
 from adapter.presenter.train_new_model_presenter import new_train_new_model_presenter
 from adapter.presenter.evaluate_model_presenter import new_evaluate_model_presenter
 from adapter.presenter.find_all_models_presenter import new_find_all_models_presenter
 from adapter.presenter.find_all_triplets_presenter import new_find_all_triplets_presenter
 from adapter.presenter.form_triplets_from_presenter import new_form_triplets_from_presenter
+from adapter.presenter.form_triplets_batch_presenter import new_form_triplets_batch_presenter
 from adapter.presenter.process_scenario_presenter import new_process_scenario_presenter
 from adapter.presenter.delete_scenario_presenter import new_delete_scenario_presenter
 from adapter.presenter.delete_model_presenter import new_delete_model_presenter
@@ -38,6 +49,11 @@ from adapter.presenter.delete_triplets_presenter import new_delete_triplets_pres
 from adapter.presenter.delete_processed_scenario_presenter import new_delete_processed_scenario_presenter
 from adapter.presenter.compose_new_dataset_presenter import new_compose_new_dataset_presenter
 from adapter.presenter.delete_dataset_presenter import new_delete_dataset_presenter
+from adapter.presenter.bulk_delete_scenarios_presenter import new_bulk_delete_scenarios_presenter
+from adapter.presenter.bulk_delete_processed_scenarios_presenter import new_bulk_delete_processed_scenarios_presenter
+from adapter.presenter.bulk_delete_triplets_presenter import new_bulk_delete_triplets_presenter
+from adapter.presenter.bulk_delete_models_presenter import new_bulk_delete_models_presenter
+from adapter.presenter.bulk_delete_datasets_presenter import new_bulk_delete_datasets_presenter
 from adapter.presenter.find_all_processed_scenarios_presenter import new_find_all_processed_scenarios_presenter
 from adapter.presenter.find_all_dataset_presenter import new_find_all_dataset_presenter # 追加
 
@@ -48,14 +64,17 @@ from adapter.repository.triplet_mysql import TripletMySQL
 from adapter.repository.training_ready_scenario_mysql import TrainingReadyScenarioMySQL
 from adapter.repository.model_evaluation_session_mysql import ModelEvaluationSessionMySQL
 from adapter.repository.sql import SQL
+from adapter.repository.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
 
-from usecase.find_all_scenario import new_find_all_scenario_interactor
+from usecase.find_all_scenario import FindAllScenarioInput, new_find_all_scenario_interactor
 from usecase.generate_scenarios import GenerateScenariosInput, new_generate_scenarios_interactor
+from usecase.generate_scenarios_stream import GenerateScenariosStreamInput, new_generate_scenarios_stream_interactor, STREAM_MODE_RECORDS, DEFAULT_STREAM_BATCH_SIZE
 from usecase.train_new_model import TrainNewModelInput, new_train_new_model_interactor
 from usecase.evaluate_model import EvaluateModelInput, new_evaluate_model_interactor
-from usecase.find_all_models import new_find_all_models_interactor
-from usecase.find_all_triplets import new_find_all_triplets_interactor
+from usecase.find_all_models import FindAllModelsInput, new_find_all_models_interactor
+from usecase.find_all_triplets import FindAllTripletsInput, new_find_all_triplets_interactor
 from usecase.form_triplets_from import FormTripletsFromInput, new_form_triplets_from_interactor
+from usecase.form_triplets_batch import FormTripletsBatchInput, new_form_triplets_batch_interactor
 from usecase.process_scenario import ProcessScenarioInput, new_process_scenario_interactor
 from usecase.delete_scenario import DeleteScenarioInput, new_delete_scenario_interactor
 from usecase.delete_model import DeleteModelInput, new_delete_model_interactor
@@ -63,11 +82,17 @@ from usecase.delete_triplets import DeleteTripletsInput, new_delete_triplets_int
 from usecase.delete_processed_scenario import DeleteProcessedScenarioInput, new_delete_processed_scenario_interactor
 from usecase.compose_new_dataset import ComposeNewDatasetInput, new_compose_new_dataset_interactor
 from usecase.delete_dataset import DeleteDatasetInput, new_delete_dataset_interactor
-from usecase.find_all_processed_scenarios import new_find_all_processed_scenarios_interactor
-from usecase.find_all_dataset import new_find_all_dataset_interactor # 追加
+from usecase.bulk_delete_scenarios import BulkDeleteScenariosInput, new_bulk_delete_scenarios_interactor
+from usecase.bulk_delete_processed_scenarios import BulkDeleteProcessedScenariosInput, new_bulk_delete_processed_scenarios_interactor
+from usecase.bulk_delete_triplets import BulkDeleteTripletsInput, new_bulk_delete_triplets_interactor
+from usecase.bulk_delete_models import BulkDeleteModelsInput, new_bulk_delete_models_interactor
+from usecase.bulk_delete_datasets import BulkDeleteDatasetsInput, new_bulk_delete_datasets_interactor
+from usecase.find_all_processed_scenarios import FindAllProcessedScenariosInput, new_find_all_processed_scenarios_interactor
+from usecase.find_all_dataset import FindAllDatasetInput, new_find_all_dataset_interactor # 追加
 
 # --- Domain services ---
-from domain import UUID
+from domain import UUID, MethodProfile, Situation
+from domain.log_generation_config import DEFAULT_METHOD_GROUP_SIZE
 
 # --- Domain service implementations ---
 from infrastructure.domain.scenario_generator_domain_service_impl import ScenarioGeneratorDomainServiceImpl
@@ -83,12 +108,20 @@ from infrastructure.database.config import NewMySQLConfigFromEnv
 router = APIRouter()
 db_handler = MySQLHandler(NewMySQLConfigFromEnv())
 ctx_timeout = 10.0
+# シナリオ生成に使うプロセス数。1の場合はリクエストのスレッド内で生成する
+generator_workers = int(os.getenv("SCENARIO_GENERATOR_WORKERS", "1"))
 
 # --- Pydantic models for request validation ---
 class GenerateScenariosRequest(BaseModel):
     output_count: int
     method_pool: List[Dict[str, Any]]
     situations: List[Dict[str, Any]]
+    seed: Optional[int] = None
+    method_group_size: int = DEFAULT_METHOD_GROUP_SIZE
+
+class GenerateScenariosStreamRequest(GenerateScenariosRequest):
+    mode: str = STREAM_MODE_RECORDS  # "records" または "progress"
+    batch_size: int = DEFAULT_STREAM_BATCH_SIZE
 
 class TrainNewModelRequest(BaseModel):
     dataset_id: str
@@ -106,6 +139,13 @@ class EvaluateModelRequest(BaseModel):
 class FormTripletsFromRequest(BaseModel):
     training_ready_scenario_id: str
 
+class FormTripletsBatchRequest(BaseModel):
+    training_ready_scenario_ids: List[str] = []
+    all_unformed: bool = False
+
+class BulkDeleteRequest(BaseModel):
+    ids: List[str]
+
 class ProcessScenarioRequest(BaseModel):
     scenario_ids: List[str]
 
@@ -142,31 +182,98 @@ def handle_response(response_dict: Dict, success_code: int = 200):
     return JSONResponse(content=content_data, status_code=success_code if status_code < 400 else status_code)
 
 
+# --- Request conversion helpers ---
+def to_method_profile(item: Dict[str, Any]) -> MethodProfile:
+    """
+    method_poolの要素をMethodProfileに変換する。
+    フロントエンドが送る {name, description} 形式の場合は、descriptionの単語をキーワードとして使う。
+    """
+    name = item.get("method_name") or item.get("name") or ""
+    keywords = item.get("context_keywords")
+    if keywords is None:
+        keywords = str(item.get("description", "")).lower().split()
+    return MethodProfile(method_name=str(name).strip(), context_keywords=[str(kw) for kw in keywords])
+
+def to_situation(item: Dict[str, Any]) -> Situation:
+    """situationsの要素をSituationに変換する。{name, description} 形式も受け付ける"""
+    return Situation(
+        user_information=str(item.get("user_information", item.get("name", ""))),
+        environmental_information=str(item.get("environmental_information", item.get("description", ""))),
+    )
+
+def to_ndjson(records):
+    """辞書のイテレータを1行1レコードのNDJSONに変換する"""
+    for record in records:
+        yield json.dumps(record, default=str, ensure_ascii=False) + "\n"
+
 # --- Scenario endpoints ---
 @router.get("/v1/scenarios")
-def get_all_scenarios():
+def get_all_scenarios(
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = None,
+):
     repo = ScenarioMySQL(db_handler)
     presenter = new_find_all_scenario_presenter()
     usecase = new_find_all_scenario_interactor(presenter, repo, ctx_timeout)
     controller = FindAllScenarioController(usecase)
-    response_dict = controller.execute()
+    input_data = FindAllScenarioInput(limit=limit, cursor=cursor)
+    response_dict = controller.execute(input_data)
     return handle_response(response_dict)
 
 @router.post("/v1/scenarios/generate")
 def generate_scenarios(request: GenerateScenariosRequest):
     repo = ScenarioMySQL(db_handler)
     presenter = new_generate_scenarios_presenter()
-    domain_service = ScenarioGeneratorDomainServiceImpl() # 修正
+    domain_service = ScenarioGeneratorDomainServiceImpl(workers=generator_workers) # 修正
     usecase = new_generate_scenarios_interactor(repo, presenter, domain_service, ctx_timeout)
     controller = GenerateScenariosController(usecase)
     input_data = GenerateScenariosInput(
         output_count=request.output_count,
-        method_pool=request.method_pool,
-        situations=request.situations,
+        method_pool=[to_method_profile(item) for item in request.method_pool],
+        situations=[to_situation(item) for item in request.situations],
+        seed=request.seed,
+        method_group_size=request.method_group_size,
     )
     response_dict = controller.execute(input_data)
     return handle_response(response_dict, success_code=201)
 
+@router.post("/v1/scenarios/generate/stream")
+def generate_scenarios_stream(request: GenerateScenariosStreamRequest):
+    """
+    シナリオをbatch_size件ずつ保存しながら、コミットしたバッチの内容をNDJSONで順次返す。
+    """
+    repo = ScenarioMySQL(db_handler)
+    presenter = new_generate_scenarios_stream_presenter()
+    domain_service = ScenarioGeneratorDomainServiceImpl(workers=generator_workers)
+    usecase = new_generate_scenarios_stream_interactor(repo, presenter, domain_service, ctx_timeout)
+    controller = GenerateScenariosStreamController(usecase)
+    input_data = GenerateScenariosStreamInput(
+        output_count=request.output_count,
+        method_pool=[to_method_profile(item) for item in request.method_pool],
+        situations=[to_situation(item) for item in request.situations],
+        seed=request.seed,
+        method_group_size=request.method_group_size,
+        mode=request.mode,
+        batch_size=request.batch_size,
+    )
+    response_dict = controller.execute(input_data)
+    if response_dict["status"] >= 400:
+        return handle_response(response_dict)
+    return StreamingResponse(
+        to_ndjson(response_dict["data"]),
+        media_type="application/x-ndjson",
+    )
+
+@router.post("/v1/scenarios/bulk-delete")
+def bulk_delete_scenarios(request: BulkDeleteRequest):
+    repo = ScenarioMySQL(db_handler)
+    presenter = new_bulk_delete_scenarios_presenter()
+    usecase = new_bulk_delete_scenarios_interactor(presenter, repo, ctx_timeout)
+    controller = BulkDeleteScenariosController(usecase)
+    input_data = BulkDeleteScenariosInput(ids=[UUID(value=id_str) for id_str in request.ids])
+    response_dict = controller.execute(input_data)
+    return handle_response(response_dict)
+
 @router.delete("/v1/scenarios/{scenario_id}")
 def delete_scenario(scenario_id: str):
     repo = ScenarioMySQL(db_handler)
@@ -193,12 +300,26 @@ def process_scenario(request: ProcessScenarioRequest):
 
 # --- Processed scenarios endpoints ---
 @router.get("/v1/processed-scenarios")
-def get_all_processed_scenarios():
+def get_all_processed_scenarios(
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = None,
+):
     repo = TrainingReadyScenarioMySQL(db_handler)
     presenter = new_find_all_processed_scenarios_presenter()
     usecase = new_find_all_processed_scenarios_interactor(presenter, repo, ctx_timeout)
     controller = FindAllProcessedScenariosController(usecase)
-    response_dict = controller.execute()
+    input_data = FindAllProcessedScenariosInput(limit=limit, cursor=cursor)
+    response_dict = controller.execute(input_data)
+    return handle_response(response_dict)
+
+@router.post("/v1/processed-scenarios/bulk-delete")
+def bulk_delete_processed_scenarios(request: BulkDeleteRequest):
+    repo = TrainingReadyScenarioMySQL(db_handler)
+    presenter = new_bulk_delete_processed_scenarios_presenter()
+    usecase = new_bulk_delete_processed_scenarios_interactor(presenter, repo, ctx_timeout)
+    controller = BulkDeleteProcessedScenariosController(usecase)
+    input_data = BulkDeleteProcessedScenariosInput(ids=[UUID(value=id_str) for id_str in request.ids])
+    response_dict = controller.execute(input_data)
     return handle_response(response_dict)
 
 @router.delete("/v1/processed-scenarios/{scenario_id}")
@@ -213,12 +334,16 @@ def delete_processed_scenario(scenario_id: str):
 
 # --- Model endpoints ---
 @router.get("/v1/models")
-def get_all_models():
+def get_all_models(
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = None,
+):
     repo = TrainedModelMySQL(db_handler)
     presenter = new_find_all_models_presenter()
     usecase = new_find_all_models_interactor(presenter, repo, ctx_timeout)
     controller = FindAllModelsController(usecase)
-    response_dict = controller.execute()
+    input_data = FindAllModelsInput(limit=limit, cursor=cursor)
+    response_dict = controller.execute(input_data)
     return handle_response(response_dict)
 
 @router.post("/v1/models/train")
@@ -257,6 +382,16 @@ def evaluate_model(request: EvaluateModelRequest):
     response_dict = controller.execute(input_data)
     return handle_response(response_dict, success_code=201)
 
+@router.post("/v1/models/bulk-delete")
+def bulk_delete_models(request: BulkDeleteRequest):
+    repo = TrainedModelMySQL(db_handler)
+    presenter = new_bulk_delete_models_presenter()
+    usecase = new_bulk_delete_models_interactor(presenter, repo, ctx_timeout)
+    controller = BulkDeleteModelsController(usecase)
+    input_data = BulkDeleteModelsInput(ids=[UUID(value=id_str) for id_str in request.ids])
+    response_dict = controller.execute(input_data)
+    return handle_response(response_dict)
+
 @router.delete("/v1/models/{model_id}")
 def delete_model(model_id: str):
     repo = TrainedModelMySQL(db_handler)
@@ -269,12 +404,16 @@ def delete_model(model_id: str):
 
 # --- Dataset endpoints ---
 @router.get("/v1/datasets") # 追加
-def get_all_datasets():
+def get_all_datasets(
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = None,
+):
     repo = DatasetMySQL(db_handler)
     presenter = new_find_all_dataset_presenter()
     usecase = new_find_all_dataset_interactor(presenter, repo, ctx_timeout)
     controller = FindAllDatasetController(usecase)
-    response_dict = controller.execute()
+    input_data = FindAllDatasetInput(limit=limit, cursor=cursor)
+    response_dict = controller.execute(input_data)
     return handle_response(response_dict)
 
 @router.post("/v1/datasets")
@@ -291,6 +430,16 @@ def compose_new_dataset(request: ComposeNewDatasetRequest):
     response_dict = controller.execute(input_data)
     return handle_response(response_dict, success_code=201)
 
+@router.post("/v1/datasets/bulk-delete")
+def bulk_delete_datasets(request: BulkDeleteRequest):
+    repo = DatasetMySQL(db_handler)
+    presenter = new_bulk_delete_datasets_presenter()
+    usecase = new_bulk_delete_datasets_interactor(presenter, repo, ctx_timeout)
+    controller = BulkDeleteDatasetsController(usecase)
+    input_data = BulkDeleteDatasetsInput(ids=[UUID(value=id_str) for id_str in request.ids])
+    response_dict = controller.execute(input_data)
+    return handle_response(response_dict)
+
 @router.delete("/v1/datasets/{dataset_id}")
 def delete_dataset(dataset_id: str):
     repo = DatasetMySQL(db_handler)
@@ -303,12 +452,16 @@ def delete_dataset(dataset_id: str):
 
 # --- Triplet endpoints ---
 @router.get("/v1/triplets")
-def get_all_triplets():
+def get_all_triplets(
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = None,
+):
     repo = TripletMySQL(db_handler)
     presenter = new_find_all_triplets_presenter()
     usecase = new_find_all_triplets_interactor(presenter, repo, ctx_timeout)
     controller = FindAllTripletsController(usecase)
-    response_dict = controller.execute()
+    input_data = FindAllTripletsInput(limit=limit, cursor=cursor)
+    response_dict = controller.execute(input_data)
     return handle_response(response_dict)
 
 @router.post("/v1/triplets/form")
@@ -325,6 +478,31 @@ def form_triplets_from(request: FormTripletsFromRequest):
     response_dict = controller.execute(input_data)
     return handle_response(response_dict, success_code=201)
 
+@router.post("/v1/triplets/form-batch")
+def form_triplets_batch(request: FormTripletsBatchRequest):
+    trs_repo = TrainingReadyScenarioMySQL(db_handler)
+    triplet_repo = TripletMySQL(db_handler)
+    presenter = new_form_triplets_batch_presenter()
+    domain_service = TripletFormerDomainServiceImpl()
+    usecase = new_form_triplets_batch_interactor(trs_repo, triplet_repo, presenter, domain_service, ctx_timeout)
+    controller = FormTripletsBatchController(usecase)
+    input_data = FormTripletsBatchInput(
+        training_ready_scenario_ids=[UUID(value=tid) for tid in request.training_ready_scenario_ids],
+        all_unformed=request.all_unformed,
+    )
+    response_dict = controller.execute(input_data)
+    return handle_response(response_dict, success_code=201)
+
+@router.post("/v1/triplets/bulk-delete")
+def bulk_delete_triplets(request: BulkDeleteRequest):
+    repo = TripletMySQL(db_handler)
+    presenter = new_bulk_delete_triplets_presenter()
+    usecase = new_bulk_delete_triplets_interactor(presenter, repo, ctx_timeout)
+    controller = BulkDeleteTripletsController(usecase)
+    input_data = BulkDeleteTripletsInput(ids=[UUID(value=id_str) for id_str in request.ids])
+    response_dict = controller.execute(input_data)
+    return handle_response(response_dict)
+
 @router.delete("/v1/triplets/{triplet_id}")
 def delete_triplets(triplet_id: str):
     repo = TripletMySQL(db_handler)
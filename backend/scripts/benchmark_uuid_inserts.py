@@ -0,0 +1,71 @@
+"""
+UUIDv4とUUIDv7を主キーにした場合の挿入スループットを比較するベンチマーク。
+
+使い方 (backendディレクトリで実行):
+    python -m scripts.benchmark_uuid_inserts                # 各100万行
+    python -m scripts.benchmark_uuid_inserts --rows 200000 --chunk-size 1000
+
+DB_UUID_STORAGEの設定に従い、IDはVARCHAR(36)またはBINARY(16)で保存する。
+計測用のテーブル (uuid_bench_v4 / uuid_bench_v7) を作成し、終了時に削除する。
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Callable, List
+
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..')))
+
+from domain import UUID
+from domain.custom_uuid import SetUUIDVersion, NewUUID, UUID_VERSION_4, UUID_VERSION_7
+from adapter.repository.bulk import insert_many
+from adapter.repository.sql import SQL
+
+# 1回のトランザクションで挿入する行数。プロセスのメモリを抑えるため、この単位でIDを生成する
+BATCH_ROWS = 50_000
+
+
+def run(db: SQL, table: str, id_type: str, rows: int, chunk_size: int, new_id: Callable[[], UUID]) -> float:
+    """テーブルを作り直してrows行を挿入し、1秒あたりの挿入行数を返す"""
+    db.execute(f"DROP TABLE IF EXISTS {table}")
+    db.execute(f"CREATE TABLE {table} (id {id_type} NOT NULL PRIMARY KEY, payload VARCHAR(64) NOT NULL)")
+    try:
+        started = time.perf_counter()
+        inserted = 0
+        while inserted < rows:
+            n = min(BATCH_ROWS, rows - inserted)
+            batch: List[tuple] = [(new_id(), "payload") for _ in range(n)]
+            insert_many(db, table, ("id", "payload"), batch, chunk_size)
+            inserted += n
+        elapsed = time.perf_counter() - started
+    finally:
+        db.execute(f"DROP TABLE IF EXISTS {table}")
+    return rows / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="UUIDv4とUUIDv7の主キーで挿入スループットを比較する")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="各バージョンで挿入する行数")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="1つのINSERT文にまとめる行数")
+    args = parser.parse_args()
+
+    from infrastructure.database.config import NewMySQLConfigFromEnv
+    from infrastructure.database.mysql_handler import MySQLHandler
+
+    config = NewMySQLConfigFromEnv()
+    db = MySQLHandler(config)
+    id_type = "BINARY(16)" if config.uuid_storage == "binary16" else "VARCHAR(36)"
+
+    results = {}
+    for version in (UUID_VERSION_4, UUID_VERSION_7):
+        SetUUIDVersion(version)
+        rate = run(db, f"uuid_bench_v{version}", id_type, args.rows, args.chunk_size, NewUUID)
+        results[version] = rate
+        print(f"UUIDv{version}: {args.rows} rows, {rate:,.0f} rows/s ({id_type})")
+
+    print(f"UUIDv7 / UUIDv4: {results[UUID_VERSION_7] / results[UUID_VERSION_4]:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
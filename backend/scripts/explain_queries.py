@@ -0,0 +1,211 @@
+"""
+adapter/repository 内のSQL文字列をすべて抜き出し、EXPLAINを実行してフルスキャンを検出するスクリプト。
+
+使い方 (backendディレクトリで実行):
+    python -m scripts.explain_queries            # 既存のデータに対してEXPLAINする
+    python -m scripts.explain_queries --seed 5000  # 各テーブルに合成データを投入してからEXPLAINする
+
+WHERE句またはORDER BY句を持つクエリの実行計画に type=ALL (フルテーブルスキャン) が
+1つでも含まれていれば、終了コード1で終了する。
+--seed は実際に行を書き込むため、開発用の使い捨てデータベースに対してだけ使うこと。
+"""
+import argparse
+import ast
+import os
+import re
+import sys
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..')))
+
+from domain import UUID
+from adapter.repository.bulk import insert_many
+from adapter.repository.sql import SQL
+
+REPOSITORY_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', 'adapter', 'repository'))
+
+# 共通ヘルパー(pagination.py / bulk.py)の {table} を展開する対象のテーブル
+ENTITY_TABLES = ["scenarios", "training_ready_scenarios", "triplets", "trained_models", "datasets"]
+
+# f-string内のローカル変数に当てはめる値
+FORMAT_VALUES = {
+    "select_columns": "*",
+    "placeholders": "%s, %s",
+    "pair_placeholders": "(%s, %s), (%s, %s)",
+}
+
+# %s に当てはめるサンプル値。IDとの比較にもdatetimeとの比較にも使える文字列にしておく
+SAMPLE_PARAM = "'2000-01-01 00:00:00'"
+SAMPLE_LIMIT = "100"
+
+STATEMENT_PREFIXES = ("SELECT", "UPDATE", "DELETE")
+
+# EXPLAINの結果のうち、アクセス方法(type)の列位置
+EXPLAIN_TYPE_COLUMN = 4
+EXPLAIN_TABLE_COLUMN = 2
+
+
+@dataclass
+class Query:
+    location: str
+    sql: str
+
+
+def _module_constants(tree: ast.Module) -> Dict[str, str]:
+    """モジュール直下で文字列定数として定義された名前 (例: DATASET_COLUMNS) を集める"""
+    constants = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    constants[target.id] = node.value.value
+    return constants
+
+
+def _render(node: ast.AST, names: Dict[str, str]) -> Optional[str]:
+    """文字列定数またはf-stringをSQL文字列に戻す。展開できない式を含む場合はNone"""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.JoinedStr):
+        parts = []
+        for value in node.values:
+            if isinstance(value, ast.Constant):
+                parts.append(value.value)
+            elif isinstance(value, ast.FormattedValue) and isinstance(value.value, ast.Name) and value.value.id in names:
+                parts.append(names[value.value.id])
+            else:
+                return None
+        return "".join(parts)
+    return None
+
+
+def extract_queries(directory: str = REPOSITORY_DIR) -> List[Query]:
+    """ディレクトリ内の *.py (テストを除く) からSQL文字列を抜き出す。docstringは対象外"""
+    queries = []
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(".py") or filename.endswith("_test.py"):
+            continue
+        path = os.path.join(directory, filename)
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+        constants = _module_constants(tree)
+        skipped = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Expr) and isinstance(node.value, (ast.Constant, ast.JoinedStr)):
+                skipped.add(id(node.value))
+            # f-stringの中の定数部分は親のJoinedStrでまとめて扱う
+            if isinstance(node, ast.JoinedStr):
+                skipped.update(id(value) for value in node.values)
+
+        for node in ast.walk(tree):
+            if id(node) in skipped or not isinstance(node, (ast.Constant, ast.JoinedStr)):
+                continue
+
+            tables = ENTITY_TABLES if isinstance(node, ast.JoinedStr) and _uses_name(node, "table") else [None]
+            for table in tables:
+                names = {**constants, **FORMAT_VALUES}
+                if table:
+                    names["table"] = table
+                sql = _render(node, names)
+                if sql is None or not sql.strip().upper().startswith(STATEMENT_PREFIXES):
+                    continue
+                queries.append(Query(location=f"{filename}:{node.lineno}", sql=" ".join(sql.split())))
+    return queries
+
+
+def _uses_name(node: ast.JoinedStr, name: str) -> bool:
+    return any(
+        isinstance(value, ast.FormattedValue) and isinstance(value.value, ast.Name) and value.value.id == name
+        for value in node.values
+    )
+
+
+def bind_sample_params(sql: str) -> str:
+    """EXPLAINできるよう、プレースホルダーにサンプル値を埋め込む"""
+    sql = re.sub(r"LIMIT %s", f"LIMIT {SAMPLE_LIMIT}", sql, flags=re.IGNORECASE)
+    return sql.replace("%s", SAMPLE_PARAM)
+
+
+def needs_index(sql: str) -> bool:
+    """絞り込みや並び替えを伴うクエリだけを検査対象とする (find_allのような全件読み出しは除く)"""
+    upper = sql.upper()
+    return " WHERE " in upper or " ORDER BY " in upper
+
+
+def seed(db: SQL, rows_per_table: int) -> None:
+    """外部キーの関係を保ったまま、各テーブルに合成データを投入してANALYZE TABLEする"""
+    base = datetime(2024, 1, 1)
+
+    def ids(table_no: int) -> List[UUID]:
+        # テーブルごとに上位ビットを変えた、重複しない有効なUUIDを作る
+        return [UUID(value=str(uuid.UUID(int=(table_no << 64) | i))) for i in range(rows_per_table)]
+
+    scenario_ids, trs_ids, triplet_ids = ids(1), ids(2), ids(3)
+    dataset_ids, model_ids = ids(4), ids(5)
+    session_ids, result_ids = ids(6), ids(7)
+    created = [base + timedelta(seconds=i) for i in range(rows_per_table)]
+
+    insert_many(db, "scenarios", ("id", "state", "method_group", "target_method", "negative_method_group", "created_at"),
+                [(sid, "state", "a, b", "a", "b", c) for sid, c in zip(scenario_ids, created)])
+    insert_many(db, "training_ready_scenarios", ("id", "scenario_id", "state", "method_group", "negative_method_group", "created_at"),
+                [(tid, sid, "state", "a, b", "b", c) for tid, sid, c in zip(trs_ids, scenario_ids, created)])
+    insert_many(db, "triplets", ("id", "training_ready_scenario_id", "anchor", "positive", "negative", "created_at"),
+                [(tid, trs, "anchor", "a", "b", c) for tid, trs, c in zip(triplet_ids, trs_ids, created)])
+    insert_many(db, "datasets", ("id", "name", "description", "type", "triplet_count", "created_at"),
+                [(did, "seed", "", "training", 1, c) for did, c in zip(dataset_ids, created)])
+    insert_many(db, "dataset_triplets", ("dataset_id", "triplet_id", "position"),
+                [(did, tid, 0) for did, tid in zip(dataset_ids, triplet_ids)])
+    insert_many(db, "trained_models", ("id", "name", "dataset_id", "description", "file_path", "created_at"),
+                [(mid, "seed", did, "", "", c) for mid, did, c in zip(model_ids, dataset_ids, created)])
+    insert_many(db, "model_evaluation_sessions", ("id", "trained_model_id", "dataset_id", "summary_metrics", "created_at"),
+                [(sid, mid, did, "{}", c) for sid, mid, did, c in zip(session_ids, model_ids, dataset_ids, created)])
+    insert_many(db, "individual_evaluation_results", ("id", "model_evaluation_session_id", "test_data_id"),
+                [(rid, sid, tid) for rid, sid, tid in zip(result_ids, session_ids, triplet_ids)])
+
+    for table in ENTITY_TABLES + ["dataset_triplets", "scenario_lsh_bands", "model_evaluation_sessions", "individual_evaluation_results"]:
+        db.query(f"ANALYZE TABLE {table}")
+
+
+def explain_all(db: SQL, queries: List[Query]) -> List[str]:
+    """各クエリをEXPLAINし、フルスキャンが含まれていたものを失敗として返す"""
+    failures = []
+    for query in queries:
+        plan = list(db.query("EXPLAIN " + bind_sample_params(query.sql)))
+        scans = [row[EXPLAIN_TABLE_COLUMN] for row in plan if row[EXPLAIN_TYPE_COLUMN] == "ALL"]
+        checked = needs_index(query.sql)
+        status = "FULL SCAN" if scans and checked else "ok"
+        print(f"[{status:9}] {query.location}: {query.sql}")
+        for row in plan:
+            print(f"            table={row[EXPLAIN_TABLE_COLUMN]} type={row[EXPLAIN_TYPE_COLUMN]} key={row[6]} rows={row[9]}")
+        if scans and checked:
+            failures.append(f"{query.location}: full scan on {', '.join(str(t) for t in scans)}")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="adapter/repository のSQLをEXPLAINし、フルスキャンを検出する")
+    parser.add_argument("--seed", type=int, default=0, help="EXPLAIN前に各テーブルへ投入する合成データの行数")
+    args = parser.parse_args()
+
+    from infrastructure.database.config import NewMySQLConfigFromEnv
+    from infrastructure.database.mysql_handler import MySQLHandler
+
+    db = MySQLHandler(NewMySQLConfigFromEnv())
+    if args.seed > 0:
+        seed(db, args.seed)
+
+    failures = explain_all(db, extract_queries())
+    if failures:
+        print("\nfull table scans detected:")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+    print("\nno full table scans detected.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,28 @@
+import unittest
+
+from scripts.explain_queries import bind_sample_params, extract_queries, needs_index
+
+
+class TestExtractQueries(unittest.TestCase):
+    def setUp(self):
+        self.queries = extract_queries()
+
+    def test_expands_shared_helpers_for_every_table(self):
+        pagination = [q.sql for q in self.queries if q.location.startswith("pagination.py")]
+        self.assertTrue(any("FROM triplets WHERE (created_at, id) <" in sql for sql in pagination))
+        self.assertTrue(any("FROM datasets ORDER BY created_at DESC" in sql for sql in pagination))
+
+    def test_skips_docstrings_and_unrendered_fstrings(self):
+        for query in self.queries:
+            self.assertNotIn("...", query.sql, query.location)
+            self.assertNotIn("{", query.sql, query.location)
+
+    def test_binds_limit_and_params(self):
+        sql = bind_sample_params("SELECT * FROM scenarios WHERE id = %s LIMIT %s")
+        self.assertEqual(sql, "SELECT * FROM scenarios WHERE id = '2000-01-01 00:00:00' LIMIT 100")
+        self.assertTrue(needs_index(sql))
+        self.assertFalse(needs_index("SELECT * FROM scenarios"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import abc
+from dataclasses import dataclass
+from typing import List, Protocol
+from domain import DatasetRepository, UUID
+
+
+class BulkDeleteDatasetsUseCase(Protocol):
+    def execute(
+        self, input_data: "BulkDeleteDatasetsInput"
+    ) -> tuple["BulkDeleteDatasetsOutput", Exception | None]:
+        ...
+
+
+@dataclass
+class BulkDeleteDatasetsInput:
+    ids: List[UUID]
+
+
+@dataclass
+class BulkDeleteResultOutput:
+    ID: UUID
+    status: str  # "deleted" または "not_found"
+
+
+@dataclass
+class BulkDeleteDatasetsOutput:
+    results: List[BulkDeleteResultOutput]
+    deleted_count: int
+
+
+class BulkDeleteDatasetsPresenter(abc.ABC):
+    @abc.abstractmethod
+    def output(self, requested_ids: List[UUID], deleted_ids: List[UUID]) -> "BulkDeleteDatasetsOutput":
+        pass
+
+
+class BulkDeleteDatasetsInteractor:
+    def __init__(
+        self,
+        presenter: "BulkDeleteDatasetsPresenter",
+        repo: DatasetRepository,
+        timeout_sec: int = 10,
+    ):
+        self.presenter = presenter
+        self.repo = repo
+        self.timeout_sec = timeout_sec
+
+    def execute(
+        self, input_data: "BulkDeleteDatasetsInput"
+    ) -> tuple["BulkDeleteDatasetsOutput", Exception | None]:
+        try:
+            if not input_data.ids:
+                raise ValueError("ids must not be empty.")
+
+            # 1つのトランザクションでまとめて削除し、実際に削除できたIDだけを受け取る
+            deleted_ids = self.repo.delete_many(input_data.ids)
+            output = self.presenter.output(input_data.ids, deleted_ids)
+            return output, None
+
+        except Exception as e:
+            empty_output = BulkDeleteDatasetsOutput(results=[], deleted_count=0)
+            return empty_output, e
+
+
+def new_bulk_delete_datasets_interactor(
+    presenter: "BulkDeleteDatasetsPresenter",
+    repo: DatasetRepository,
+    timeout_sec: int,
+) -> "BulkDeleteDatasetsUseCase":
+    return BulkDeleteDatasetsInteractor(
+        presenter=presenter,
+        repo=repo,
+        timeout_sec=timeout_sec,
+    )
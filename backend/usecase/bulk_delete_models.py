@@ -0,0 +1,74 @@
+import abc
+from dataclasses import dataclass
+from typing import List, Protocol
+from domain import TrainedModelRepository, UUID
+
+
+class BulkDeleteModelsUseCase(Protocol):
+    def execute(
+        self, input_data: "BulkDeleteModelsInput"
+    ) -> tuple["BulkDeleteModelsOutput", Exception | None]:
+        ...
+
+
+@dataclass
+class BulkDeleteModelsInput:
+    ids: List[UUID]
+
+
+@dataclass
+class BulkDeleteResultOutput:
+    ID: UUID
+    status: str  # "deleted" または "not_found"
+
+
+@dataclass
+class BulkDeleteModelsOutput:
+    results: List[BulkDeleteResultOutput]
+    deleted_count: int
+
+
+class BulkDeleteModelsPresenter(abc.ABC):
+    @abc.abstractmethod
+    def output(self, requested_ids: List[UUID], deleted_ids: List[UUID]) -> "BulkDeleteModelsOutput":
+        pass
+
+
+class BulkDeleteModelsInteractor:
+    def __init__(
+        self,
+        presenter: "BulkDeleteModelsPresenter",
+        repo: TrainedModelRepository,
+        timeout_sec: int = 10,
+    ):
+        self.presenter = presenter
+        self.repo = repo
+        self.timeout_sec = timeout_sec
+
+    def execute(
+        self, input_data: "BulkDeleteModelsInput"
+    ) -> tuple["BulkDeleteModelsOutput", Exception | None]:
+        try:
+            if not input_data.ids:
+                raise ValueError("ids must not be empty.")
+
+            # 1つのトランザクションでまとめて削除し、実際に削除できたIDだけを受け取る
+            deleted_ids = self.repo.delete_many(input_data.ids)
+            output = self.presenter.output(input_data.ids, deleted_ids)
+            return output, None
+
+        except Exception as e:
+            empty_output = BulkDeleteModelsOutput(results=[], deleted_count=0)
+            return empty_output, e
+
+
+def new_bulk_delete_models_interactor(
+    presenter: "BulkDeleteModelsPresenter",
+    repo: TrainedModelRepository,
+    timeout_sec: int,
+) -> "BulkDeleteModelsUseCase":
+    return BulkDeleteModelsInteractor(
+        presenter=presenter,
+        repo=repo,
+        timeout_sec=timeout_sec,
+    )
@@ -0,0 +1,74 @@
+import abc
+from dataclasses import dataclass
+from typing import List, Protocol
+from domain import TrainingReadyScenarioRepository, UUID
+
+
+class BulkDeleteProcessedScenariosUseCase(Protocol):
+    def execute(
+        self, input_data: "BulkDeleteProcessedScenariosInput"
+    ) -> tuple["BulkDeleteProcessedScenariosOutput", Exception | None]:
+        ...
+
+
+@dataclass
+class BulkDeleteProcessedScenariosInput:
+    ids: List[UUID]
+
+
+@dataclass
+class BulkDeleteResultOutput:
+    ID: UUID
+    status: str  # "deleted" または "not_found"
+
+
+@dataclass
+class BulkDeleteProcessedScenariosOutput:
+    results: List[BulkDeleteResultOutput]
+    deleted_count: int
+
+
+class BulkDeleteProcessedScenariosPresenter(abc.ABC):
+    @abc.abstractmethod
+    def output(self, requested_ids: List[UUID], deleted_ids: List[UUID]) -> "BulkDeleteProcessedScenariosOutput":
+        pass
+
+
+class BulkDeleteProcessedScenariosInteractor:
+    def __init__(
+        self,
+        presenter: "BulkDeleteProcessedScenariosPresenter",
+        repo: TrainingReadyScenarioRepository,
+        timeout_sec: int = 10,
+    ):
+        self.presenter = presenter
+        self.repo = repo
+        self.timeout_sec = timeout_sec
+
+    def execute(
+        self, input_data: "BulkDeleteProcessedScenariosInput"
+    ) -> tuple["BulkDeleteProcessedScenariosOutput", Exception | None]:
+        try:
+            if not input_data.ids:
+                raise ValueError("ids must not be empty.")
+
+            # 1つのトランザクションでまとめて削除し、実際に削除できたIDだけを受け取る
+            deleted_ids = self.repo.delete_many(input_data.ids)
+            output = self.presenter.output(input_data.ids, deleted_ids)
+            return output, None
+
+        except Exception as e:
+            empty_output = BulkDeleteProcessedScenariosOutput(results=[], deleted_count=0)
+            return empty_output, e
+
+
+def new_bulk_delete_processed_scenarios_interactor(
+    presenter: "BulkDeleteProcessedScenariosPresenter",
+    repo: TrainingReadyScenarioRepository,
+    timeout_sec: int,
+) -> "BulkDeleteProcessedScenariosUseCase":
+    return BulkDeleteProcessedScenariosInteractor(
+        presenter=presenter,
+        repo=repo,
+        timeout_sec=timeout_sec,
+    )
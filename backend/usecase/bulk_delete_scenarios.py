@@ -0,0 +1,74 @@
+import abc
+from dataclasses import dataclass
+from typing import List, Protocol
+from domain import ScenarioRepository, UUID
+
+
+class BulkDeleteScenariosUseCase(Protocol):
+    def execute(
+        self, input_data: "BulkDeleteScenariosInput"
+    ) -> tuple["BulkDeleteScenariosOutput", Exception | None]:
+        ...
+
+
+@dataclass
+class BulkDeleteScenariosInput:
+    ids: List[UUID]
+
+
+@dataclass
+class BulkDeleteResultOutput:
+    ID: UUID
+    status: str  # "deleted" または "not_found"
+
+
+@dataclass
+class BulkDeleteScenariosOutput:
+    results: List[BulkDeleteResultOutput]
+    deleted_count: int
+
+
+class BulkDeleteScenariosPresenter(abc.ABC):
+    @abc.abstractmethod
+    def output(self, requested_ids: List[UUID], deleted_ids: List[UUID]) -> "BulkDeleteScenariosOutput":
+        pass
+
+
+class BulkDeleteScenariosInteractor:
+    def __init__(
+        self,
+        presenter: "BulkDeleteScenariosPresenter",
+        repo: ScenarioRepository,
+        timeout_sec: int = 10,
+    ):
+        self.presenter = presenter
+        self.repo = repo
+        self.timeout_sec = timeout_sec
+
+    def execute(
+        self, input_data: "BulkDeleteScenariosInput"
+    ) -> tuple["BulkDeleteScenariosOutput", Exception | None]:
+        try:
+            if not input_data.ids:
+                raise ValueError("ids must not be empty.")
+
+            # 1つのトランザクションでまとめて削除し、実際に削除できたIDだけを受け取る
+            deleted_ids = self.repo.delete_many(input_data.ids)
+            output = self.presenter.output(input_data.ids, deleted_ids)
+            return output, None
+
+        except Exception as e:
+            empty_output = BulkDeleteScenariosOutput(results=[], deleted_count=0)
+            return empty_output, e
+
+
+def new_bulk_delete_scenarios_interactor(
+    presenter: "BulkDeleteScenariosPresenter",
+    repo: ScenarioRepository,
+    timeout_sec: int,
+) -> "BulkDeleteScenariosUseCase":
+    return BulkDeleteScenariosInteractor(
+        presenter=presenter,
+        repo=repo,
+        timeout_sec=timeout_sec,
+    )
@@ -0,0 +1,74 @@
+import abc
+from dataclasses import dataclass
+from typing import List, Protocol
+from domain import TripletRepository, UUID
+
+
+class BulkDeleteTripletsUseCase(Protocol):
+    def execute(
+        self, input_data: "BulkDeleteTripletsInput"
+    ) -> tuple["BulkDeleteTripletsOutput", Exception | None]:
+        ...
+
+
+@dataclass
+class BulkDeleteTripletsInput:
+    ids: List[UUID]
+
+
+@dataclass
+class BulkDeleteResultOutput:
+    ID: UUID
+    status: str  # "deleted" または "not_found"
+
+
+@dataclass
+class BulkDeleteTripletsOutput:
+    results: List[BulkDeleteResultOutput]
+    deleted_count: int
+
+
+class BulkDeleteTripletsPresenter(abc.ABC):
+    @abc.abstractmethod
+    def output(self, requested_ids: List[UUID], deleted_ids: List[UUID]) -> "BulkDeleteTripletsOutput":
+        pass
+
+
+class BulkDeleteTripletsInteractor:
+    def __init__(
+        self,
+        presenter: "BulkDeleteTripletsPresenter",
+        repo: TripletRepository,
+        timeout_sec: int = 10,
+    ):
+        self.presenter = presenter
+        self.repo = repo
+        self.timeout_sec = timeout_sec
+
+    def execute(
+        self, input_data: "BulkDeleteTripletsInput"
+    ) -> tuple["BulkDeleteTripletsOutput", Exception | None]:
+        try:
+            if not input_data.ids:
+                raise ValueError("ids must not be empty.")
+
+            # 1つのトランザクションでまとめて削除し、実際に削除できたIDだけを受け取る
+            deleted_ids = self.repo.delete_many(input_data.ids)
+            output = self.presenter.output(input_data.ids, deleted_ids)
+            return output, None
+
+        except Exception as e:
+            empty_output = BulkDeleteTripletsOutput(results=[], deleted_count=0)
+            return empty_output, e
+
+
+def new_bulk_delete_triplets_interactor(
+    presenter: "BulkDeleteTripletsPresenter",
+    repo: TripletRepository,
+    timeout_sec: int,
+) -> "BulkDeleteTripletsUseCase":
+    return BulkDeleteTripletsInteractor(
+        presenter=presenter,
+        repo=repo,
+        timeout_sec=timeout_sec,
+    )
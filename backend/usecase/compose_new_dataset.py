@@ -27,6 +27,7 @@ class ComposeNewDatasetOutput:
     type: str
     Triplet_ids: List[UUID]
     created_at: str
+    triplet_count: int = 0
 
 
 class ComposeNewDatasetPresenter(abc.ABC):
@@ -1,17 +1,20 @@
 import abc
 from dataclasses import dataclass
-from typing import Protocol, List
-from domain import Dataset, DatasetRepository, UUID
+from typing import Protocol, List, Optional
+from domain import Dataset, Page, DatasetRepository, UUID
 
 # Usecaseのインターフェース定義
 class FindAllDatasetUseCase(Protocol):
-    def execute(self) -> tuple["FindAllDatasetOutput", Exception | None]:
+    def execute(
+        self, input_data: "FindAllDatasetInput"
+    ) -> tuple["FindAllDatasetOutput", Exception | None]:
         ...
 
-# UsecaseのInput (今回は不要)
+# UsecaseのInput (キーセットページネーションの条件)
 @dataclass
 class FindAllDatasetInput:
-    pass
+    limit: int
+    cursor: Optional[str] = None
 
 # Presenterが最終的に生成するOutputのデータ形式
 @dataclass
@@ -20,17 +23,18 @@ class DatasetOutputDTO:
     name: str
     description: str
     type: str
-    Triplet_ids: List[UUID]
+    triplet_count: int
     created_at: str
 
 @dataclass
 class FindAllDatasetOutput:
     datasets: List[DatasetOutputDTO]
+    next_cursor: Optional[str] = None
 
 # Presenterのインターフェース定義
 class FindAllDatasetPresenter(abc.ABC):
     @abc.abstractmethod
-    def output(self, datasets: List[Dataset]) -> "FindAllDatasetOutput":
+    def output(self, page: Page[Dataset]) -> "FindAllDatasetOutput":
         pass
 
 # Usecaseの具体的な実装
@@ -45,12 +49,14 @@ class FindAllDatasetInteractor:
         self.repo = repo
         self.timeout_sec = timeout_sec
 
-    def execute(self) -> tuple["FindAllDatasetOutput", Exception | None]:
+    def execute(
+        self, input_data: "FindAllDatasetInput"
+    ) -> tuple["FindAllDatasetOutput", Exception | None]:
         try:
-            # リポジトリから全てのデータセットを取得
-            datasets = self.repo.find_all()
+            # リポジトリからデータセットを1ページ分取得
+            page = self.repo.find_page(input_data.limit, input_data.cursor)
             # 取得したデータをPresenterに渡して整形
-            output = self.presenter.output(datasets)
+            output = self.presenter.output(page)
             return output, None
         except Exception as e:
             # エラー時は空のOutputを返す
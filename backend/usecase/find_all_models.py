@@ -1,15 +1,23 @@
 import abc
 from dataclasses import dataclass
-from typing import Protocol, List
+from typing import Protocol, List, Optional
 from datetime import datetime
-from domain import TrainedModel, TrainedModelRepository, UUID
+from domain import TrainedModel, Page, TrainedModelRepository, UUID
 
 
 class FindAllModelsUseCase(Protocol):
-    def execute(self) -> tuple[List["FindAllModelsOutput"], Exception | None]:
+    def execute(
+        self, input_data: "FindAllModelsInput"
+    ) -> tuple["FindAllModelsPageOutput", Exception | None]:
         ...
 
 
+@dataclass
+class FindAllModelsInput:
+    limit: int
+    cursor: Optional[str] = None
+
+
 @dataclass
 class FindAllModelsOutput:
     ID: UUID
@@ -20,9 +28,15 @@ class FindAllModelsOutput:
     created_at: str
 
 
+@dataclass
+class FindAllModelsPageOutput:
+    items: List[FindAllModelsOutput]
+    next_cursor: Optional[str]
+
+
 class FindAllModelsPresenter(abc.ABC):
     @abc.abstractmethod
-    def output(self, models: List[TrainedModel]) -> List["FindAllModelsOutput"]:
+    def output(self, page: Page[TrainedModel]) -> "FindAllModelsPageOutput":
         pass
 
 
@@ -37,14 +51,16 @@ class FindAllModelsInteractor:
         self.repo = repo
         self.timeout_sec = timeout_sec
 
-    def execute(self) -> tuple[List["FindAllModelsOutput"], Exception | None]:
+    def execute(
+        self, input_data: "FindAllModelsInput"
+    ) -> tuple["FindAllModelsPageOutput", Exception | None]:
         try:
-            models = self.repo.find_all()
-            output = self.presenter.output(models)
+            page = self.repo.find_page(input_data.limit, input_data.cursor)
+            output = self.presenter.output(page)
             return output, None
 
         except Exception as e:
-            return [], e
+            return FindAllModelsPageOutput(items=[], next_cursor=None), e
 
 
 def new_find_all_models_interactor(
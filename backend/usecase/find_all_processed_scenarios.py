@@ -1,15 +1,23 @@
 import abc
 from dataclasses import dataclass
-from typing import Protocol, List
-from domain import TrainingReadyScenario, TrainingReadyScenarioRepository, UUID
+from typing import Protocol, List, Optional
+from domain import TrainingReadyScenario, Page, TrainingReadyScenarioRepository, UUID
 from datetime import datetime  # datetimeをインポート
 
 
 class FindAllProcessedScenariosUseCase(Protocol):
-    def execute(self) -> tuple[List["FindAllProcessedScenariosOutput"], Exception | None]:
+    def execute(
+        self, input_data: "FindAllProcessedScenariosInput"
+    ) -> tuple["FindAllProcessedScenariosPageOutput", Exception | None]:
         ...
 
 
+@dataclass
+class FindAllProcessedScenariosInput:
+    limit: int
+    cursor: Optional[str] = None
+
+
 @dataclass
 class FindAllProcessedScenariosOutput:
     ID: UUID
@@ -20,9 +28,15 @@ class FindAllProcessedScenariosOutput:
     created_at: datetime  # created_atフィールドを追加
 
 
+@dataclass
+class FindAllProcessedScenariosPageOutput:
+    items: List[FindAllProcessedScenariosOutput]
+    next_cursor: Optional[str]
+
+
 class FindAllProcessedScenariosPresenter(abc.ABC):
     @abc.abstractmethod
-    def output(self, scenarios: List[TrainingReadyScenario]) -> List["FindAllProcessedScenariosOutput"]:
+    def output(self, page: Page[TrainingReadyScenario]) -> "FindAllProcessedScenariosPageOutput":
         pass
 
 
@@ -37,14 +51,16 @@ class FindAllProcessedScenariosInteractor:
         self.repo = repo
         self.timeout_sec = timeout_sec
 
-    def execute(self) -> tuple[List["FindAllProcessedScenariosOutput"], Exception | None]:
+    def execute(
+        self, input_data: "FindAllProcessedScenariosInput"
+    ) -> tuple["FindAllProcessedScenariosPageOutput", Exception | None]:
         try:
-            scenarios = self.repo.find_all()
-            output = self.presenter.output(scenarios)
+            page = self.repo.find_page(input_data.limit, input_data.cursor)
+            output = self.presenter.output(page)
             return output, None
 
         except Exception as e:
-            return [], e
+            return FindAllProcessedScenariosPageOutput(items=[], next_cursor=None), e
 
 
 def new_find_all_processed_scenarios_interactor(
@@ -1,15 +1,23 @@
 import abc
 from dataclasses import dataclass
-from typing import Protocol, List
-from domain import Scenario, ScenarioRepository, UUID
+from typing import Protocol, List, Optional
+from domain import Scenario, Page, ScenarioRepository, UUID
 from datetime import datetime  # datetimeをインポート
 
 
 class FindAllScenarioUseCase(Protocol):
-    def execute(self) -> tuple[List["FindAllScenarioOutput"], Exception | None]:
+    def execute(
+        self, input_data: "FindAllScenarioInput"
+    ) -> tuple["FindAllScenarioPageOutput", Exception | None]:
         ...
 
 
+@dataclass
+class FindAllScenarioInput:
+    limit: int
+    cursor: Optional[str] = None
+
+
 @dataclass
 class FindAllScenarioOutput:
     ID: UUID
@@ -18,11 +26,18 @@ class FindAllScenarioOutput:
     target_method: str
     negative_method_group: str
     created_at: datetime  # created_atフィールドを追加
+    near_duplicate_of: Optional[UUID] = None
+
+
+@dataclass
+class FindAllScenarioPageOutput:
+    items: List[FindAllScenarioOutput]
+    next_cursor: Optional[str]
 
 
 class FindAllScenarioPresenter(abc.ABC):
     @abc.abstractmethod
-    def output(self, scenarios: List[Scenario]) -> List[FindAllScenarioOutput]:
+    def output(self, page: Page[Scenario]) -> "FindAllScenarioPageOutput":
         pass
 
 
@@ -37,14 +52,16 @@ class FindAllScenarioInteractor:
         self.repo = repo
         self.timeout_sec = timeout_sec
 
-    def execute(self) -> tuple[List[FindAllScenarioOutput], Exception | None]:
+    def execute(
+        self, input_data: "FindAllScenarioInput"
+    ) -> tuple["FindAllScenarioPageOutput", Exception | None]:
         try:
-            scenarios = self.repo.find_all()
-            output = self.presenter.output(scenarios)
+            page = self.repo.find_page(input_data.limit, input_data.cursor)
+            output = self.presenter.output(page)
             return output, None
 
         except Exception as e:
-            return [], e
+            return FindAllScenarioPageOutput(items=[], next_cursor=None), e
 
 
 def new_find_all_scenario_interactor(
@@ -1,15 +1,23 @@
 import abc
 from dataclasses import dataclass
-from typing import Protocol, List
-from domain import Triplet, TripletRepository, UUID
+from typing import Protocol, List, Optional
+from domain import Triplet, Page, TripletRepository, UUID
 from datetime import datetime  # datetimeをインポート
 
 
 class FindAllTripletsUseCase(Protocol):
-    def execute(self) -> tuple[List["FindAllTripletsOutput"], Exception | None]:
+    def execute(
+        self, input_data: "FindAllTripletsInput"
+    ) -> tuple["FindAllTripletsPageOutput", Exception | None]:
         ...
 
 
+@dataclass
+class FindAllTripletsInput:
+    limit: int
+    cursor: Optional[str] = None
+
+
 @dataclass
 class FindAllTripletsOutput:
     ID: UUID
@@ -20,9 +28,15 @@ class FindAllTripletsOutput:
     created_at: datetime  # created_atフィールドを追加
 
 
+@dataclass
+class FindAllTripletsPageOutput:
+    items: List[FindAllTripletsOutput]
+    next_cursor: Optional[str]
+
+
 class FindAllTripletsPresenter(abc.ABC):
     @abc.abstractmethod
-    def output(self, triplets: List[Triplet]) -> List["FindAllTripletsOutput"]:
+    def output(self, page: Page[Triplet]) -> "FindAllTripletsPageOutput":
         pass
 
 
@@ -37,14 +51,16 @@ class FindAllTripletsInteractor:
         self.repo = repo
         self.timeout_sec = timeout_sec
 
-    def execute(self) -> tuple[List["FindAllTripletsOutput"], Exception | None]:
+    def execute(
+        self, input_data: "FindAllTripletsInput"
+    ) -> tuple["FindAllTripletsPageOutput", Exception | None]:
         try:
-            triplets = self.repo.find_all()
-            output = self.presenter.output(triplets)
+            page = self.repo.find_page(input_data.limit, input_data.cursor)
+            output = self.presenter.output(page)
             return output, None
 
         except Exception as e:
-            return [], e
+            return FindAllTripletsPageOutput(items=[], next_cursor=None), e
 
 
 def new_find_all_triplets_interactor(
@@ -0,0 +1,129 @@
+import abc
+from dataclasses import dataclass, field
+from typing import Iterator, List, Protocol
+from domain import TrainingReadyScenario, TrainingReadyScenarioRepository, Triplet, TripletRepository, TripletFormerDomainService, UUID
+from datetime import datetime
+
+
+class FormTripletsBatchUseCase(Protocol):
+    def execute(
+        self, input_data: "FormTripletsBatchInput"
+    ) -> tuple["FormTripletsBatchOutput", Exception | None]:
+        ...
+
+
+@dataclass
+class FormTripletsBatchInput:
+    training_ready_scenario_ids: List[UUID] = field(default_factory=list)
+    all_unformed: bool = False
+
+
+@dataclass
+class FormedTripletOutput:
+    ID: UUID
+    TrainingReadyScenario_ID: UUID
+    anchor: str
+    positive: str
+    negative: str
+    created_at: datetime
+
+
+@dataclass
+class FormTripletsBatchOutput:
+    triplets: List[FormedTripletOutput]
+    skipped_ids: List[UUID]
+
+
+class FormTripletsBatchPresenter(abc.ABC):
+    @abc.abstractmethod
+    def output(self, triplets: List[Triplet], skipped_ids: List[UUID]) -> "FormTripletsBatchOutput":
+        pass
+
+
+class FormTripletsBatchInteractor:
+    def __init__(
+        self,
+        trs_repo: TrainingReadyScenarioRepository,
+        triplet_repo: TripletRepository,
+        presenter: "FormTripletsBatchPresenter",
+        domain_service: TripletFormerDomainService,
+        timeout_sec: int = 10,
+        batch_size: int = 1000,
+    ):
+        self.trs_repo = trs_repo
+        self.triplet_repo = triplet_repo
+        self.presenter = presenter
+        self.domain_service = domain_service
+        self.timeout_sec = timeout_sec
+        self.batch_size = batch_size
+
+    def execute(
+        self, input_data: "FormTripletsBatchInput"
+    ) -> tuple["FormTripletsBatchOutput", Exception | None]:
+        try:
+            if not input_data.all_unformed and not input_data.training_ready_scenario_ids:
+                raise ValueError("training_ready_scenario_ids is empty and all_unformed is false.")
+
+            created_triplets: List[Triplet] = []
+            skipped_ids: List[UUID] = []
+
+            if input_data.all_unformed:
+                for scenarios in self._unformed_batches():
+                    self._form_batch(scenarios, created_triplets, skipped_ids)
+            else:
+                scenarios = self.trs_repo.find_by_ids(input_data.training_ready_scenario_ids)
+                self._form_batch(scenarios, created_triplets, skipped_ids)
+
+                # 見つからなかったIDもスキップとして報告する
+                found_ids = {s.ID.value for s in scenarios}
+                skipped_ids.extend(
+                    sid for sid in input_data.training_ready_scenario_ids if sid.value not in found_ids
+                )
+
+            output = self.presenter.output(created_triplets, skipped_ids)
+            return output, None
+
+        except Exception as e:
+            return FormTripletsBatchOutput(triplets=[], skipped_ids=[]), e
+
+    def _unformed_batches(self) -> Iterator[List[TrainingReadyScenario]]:
+        """
+        Tripletが未作成のTrainingReadyScenarioを、ID順にbatch_size件ずつ返す。
+        変換できずにスキップしたものも再取得しないよう、最後のIDから続きを読む。
+        """
+        after_id = None
+        while True:
+            scenarios = self.trs_repo.find_unformed(self.batch_size, after_id)
+            if not scenarios:
+                return
+            yield scenarios
+            after_id = scenarios[-1].ID
+
+    def _form_batch(
+        self,
+        scenarios: List[TrainingReadyScenario],
+        created_triplets: List[Triplet],
+        skipped_ids: List[UUID],
+    ) -> None:
+        # ドメインサービスでバッチ全体を一度に変換し、1回のバルク書き込みで保存する
+        triplets = self.domain_service.form_triplets_from_many(scenarios)
+        created_triplets.extend(self.triplet_repo.create_many(triplets))
+
+        formed_ids = {t.TrainingReadyScenario_ID.value for t in triplets}
+        skipped_ids.extend(s.ID for s in scenarios if s.ID.value not in formed_ids)
+
+
+def new_form_triplets_batch_interactor(
+    trs_repo: TrainingReadyScenarioRepository,
+    triplet_repo: TripletRepository,
+    presenter: "FormTripletsBatchPresenter",
+    domain_service: TripletFormerDomainService,
+    timeout_sec: int,
+) -> "FormTripletsBatchUseCase":
+    return FormTripletsBatchInteractor(
+        trs_repo=trs_repo,
+        triplet_repo=triplet_repo,
+        presenter=presenter,
+        domain_service=domain_service,
+        timeout_sec=timeout_sec,
+    )
@@ -0,0 +1,118 @@
+import unittest
+from datetime import datetime
+from typing import List, Optional
+
+from domain import TrainingReadyScenario, Triplet, UUID
+from .form_triplets_batch import (
+    FormTripletsBatchInput,
+    FormTripletsBatchOutput,
+    FormTripletsBatchPresenter,
+    FormTripletsBatchInteractor,
+)
+
+
+def make_trs(id_str: str) -> TrainingReadyScenario:
+    return TrainingReadyScenario(
+        ID=UUID(value=id_str),
+        Scenario_ID=UUID(value=f"scenario-{id_str}"),
+        state="state",
+        method_group="a, b",
+        negative_method_group="b",
+        created_at=datetime.now(),
+    )
+
+
+class MockTrainingReadyScenarioRepository:
+    def __init__(self, scenarios: List[TrainingReadyScenario]):
+        self.scenarios = scenarios
+        self.find_unformed_calls = []
+
+    def find_by_ids(self, ids: List[UUID]) -> List[TrainingReadyScenario]:
+        wanted = {i.value for i in ids}
+        return [s for s in self.scenarios if s.ID.value in wanted]
+
+    def find_unformed(self, limit: int, after_id: Optional[UUID] = None) -> List[TrainingReadyScenario]:
+        self.find_unformed_calls.append(after_id)
+        remaining = [s for s in self.scenarios if after_id is None or s.ID.value > after_id.value]
+        return remaining[:limit]
+
+
+class MockTripletRepository:
+    def __init__(self):
+        self.create_many_calls = []
+
+    def create_many(self, triplets: List[Triplet]) -> List[Triplet]:
+        self.create_many_calls.append(triplets)
+        return triplets
+
+
+class MockTripletFormerDomainService:
+    """IDが 'bad' で始まるシナリオは変換できないものとして扱う"""
+    def form_triplets_from_many(self, scenarios: List[TrainingReadyScenario]) -> List[Triplet]:
+        return [
+            Triplet(
+                ID=UUID(value=f"triplet-{s.ID.value}"),
+                TrainingReadyScenario_ID=s.ID,
+                anchor=s.state,
+                positive="a",
+                negative="b",
+                created_at=datetime.now(),
+            )
+            for s in scenarios
+            if not s.ID.value.startswith("bad")
+        ]
+
+
+class MockFormTripletsBatchPresenter(FormTripletsBatchPresenter):
+    def output(self, triplets: List[Triplet], skipped_ids: List[UUID]) -> FormTripletsBatchOutput:
+        return FormTripletsBatchOutput(triplets=triplets, skipped_ids=skipped_ids)
+
+
+class TestFormTripletsBatchInteractor(unittest.TestCase):
+    def make_interactor(self, scenarios, batch_size=1000):
+        self.trs_repo = MockTrainingReadyScenarioRepository(scenarios)
+        self.triplet_repo = MockTripletRepository()
+        return FormTripletsBatchInteractor(
+            trs_repo=self.trs_repo,
+            triplet_repo=self.triplet_repo,
+            presenter=MockFormTripletsBatchPresenter(),
+            domain_service=MockTripletFormerDomainService(),
+            timeout_sec=10,
+            batch_size=batch_size,
+        )
+
+    def test_explicit_ids_are_formed_with_one_bulk_write(self):
+        interactor = self.make_interactor([make_trs("a1"), make_trs("a2"), make_trs("bad1")])
+        input_data = FormTripletsBatchInput(
+            training_ready_scenario_ids=[UUID(value="a1"), UUID(value="a2"), UUID(value="bad1"), UUID(value="missing")],
+        )
+
+        output, error = interactor.execute(input_data)
+
+        self.assertIsNone(error)
+        self.assertEqual(len(output.triplets), 2)
+        self.assertEqual([s.value for s in output.skipped_ids], ["bad1", "missing"])
+        self.assertEqual(len(self.triplet_repo.create_many_calls), 1)
+
+    def test_all_unformed_walks_batches_without_refetching_skipped(self):
+        interactor = self.make_interactor([make_trs("a1"), make_trs("a2"), make_trs("bad1")], batch_size=2)
+
+        output, error = interactor.execute(FormTripletsBatchInput(all_unformed=True))
+
+        self.assertIsNone(error)
+        self.assertEqual(len(output.triplets), 2)
+        self.assertEqual([s.value for s in output.skipped_ids], ["bad1"])
+        self.assertEqual(len(self.triplet_repo.create_many_calls), 2)
+        self.assertEqual(self.trs_repo.find_unformed_calls[-1].value, "bad1")
+
+    def test_empty_request_returns_value_error(self):
+        interactor = self.make_interactor([])
+
+        output, error = interactor.execute(FormTripletsBatchInput())
+
+        self.assertIsInstance(error, ValueError)
+        self.assertEqual(output.triplets, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,9 @@
 import abc
 from dataclasses import dataclass
-from typing import List, Protocol
-from domain import Scenario, ScenarioRepository, MethodProfile, Situation, ScenarioGeneratorDomainService, LogGenerationConfig, UUID
+from itertools import islice
+from typing import List, Optional, Protocol
+from domain import Scenario, ScenarioRepository, MethodProfile, Situation, ScenarioGeneratorDomainService, NewLogGenerationConfig, UUID
+from domain.log_generation_config import DEFAULT_METHOD_GROUP_SIZE
 from datetime import datetime  # datetimeをインポート
 
 class GenerateScenariosUseCase(Protocol):
@@ -16,6 +18,12 @@ class GenerateScenariosInput:
     output_count: int
     method_pool: list[MethodProfile]
     situations: list[Situation]
+    seed: Optional[int] = None
+    method_group_size: int = DEFAULT_METHOD_GROUP_SIZE
+
+
+# 生成したシナリオをこの件数ずつ保存し、未保存のシナリオを溜め込まないようにする
+GENERATE_BATCH_SIZE = 1000
 
 
 @dataclass
@@ -26,6 +34,7 @@ class GenerateScenariosOutput:
     target_method: str
     negative_method_group: str
     created_at: datetime  # created_atフィールドを追加
+    near_duplicate_of: Optional[UUID] = None
 
 
 class GenerateScenariosPresenter(abc.ABC):
@@ -41,25 +50,34 @@ class GenerateScenariosInteractor:
         presenter: GenerateScenariosPresenter,
         domain_service: ScenarioGeneratorDomainService,
         timeout_sec: int = 10,
+        batch_size: int = GENERATE_BATCH_SIZE,
     ):
         self.repo = repo
         self.presenter = presenter
         self.domain_service = domain_service
         self.timeout_sec = timeout_sec
+        self.batch_size = batch_size
 
     def execute(self, input_data: GenerateScenariosInput) -> tuple[List[GenerateScenariosOutput], Exception | None]:
         try:
-            config = LogGenerationConfig(
+            config = NewLogGenerationConfig(
                 output_count=input_data.output_count,
                 method_pool=input_data.method_pool,
                 situations=input_data.situations,
+                seed=input_data.seed,
+                method_group_size=input_data.method_group_size,
             )
 
-            scenarios = self.domain_service.generate_scenarios(config)
-
-            created_scenarios = [self.repo.create(s) for s in scenarios]
+            scenarios = iter(self.domain_service.generate_scenarios(config))
 
-            outputs = [self.presenter.output(cs) for cs in created_scenarios]
+            outputs = []
+            # ドメインサービスはシナリオを遅延生成するので、batch_size件ずつ取り出して保存する
+            while True:
+                batch = list(islice(scenarios, self.batch_size))
+                if not batch:
+                    break
+                created_scenarios = self.repo.create_many(batch)
+                outputs.extend(self.presenter.output(cs) for cs in created_scenarios)
 
             return outputs, None
 
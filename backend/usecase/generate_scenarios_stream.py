@@ -0,0 +1,134 @@
+import abc
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Protocol
+from domain import Scenario, ScenarioRepository, MethodProfile, Situation, ScenarioGeneratorDomainService, NewLogGenerationConfig
+from domain.log_generation_config import DEFAULT_METHOD_GROUP_SIZE
+
+# ストリームに流す内容。recordsは保存したシナリオを1件ずつ、progressはバッチごとの進捗だけを返す
+STREAM_MODE_RECORDS = "records"
+STREAM_MODE_PROGRESS = "progress"
+STREAM_MODES = (STREAM_MODE_RECORDS, STREAM_MODE_PROGRESS)
+
+# 1トランザクションで保存するシナリオ数の既定値
+DEFAULT_STREAM_BATCH_SIZE = 1000
+MAX_STREAM_BATCH_SIZE = 10000
+
+
+class GenerateScenariosStreamUseCase(Protocol):
+    def execute(
+        self, input_data: "GenerateScenariosStreamInput"
+    ) -> tuple[Iterator[Dict[str, Any]], Exception | None]:
+        ...
+
+
+@dataclass
+class GenerateScenariosStreamInput:
+    output_count: int
+    method_pool: List[MethodProfile]
+    situations: List[Situation]
+    seed: Optional[int] = None
+    method_group_size: int = DEFAULT_METHOD_GROUP_SIZE
+    mode: str = STREAM_MODE_RECORDS
+    batch_size: int = DEFAULT_STREAM_BATCH_SIZE
+
+
+class GenerateScenariosStreamPresenter(abc.ABC):
+    @abc.abstractmethod
+    def scenario(self, scenario: Scenario) -> Dict[str, Any]:
+        pass
+
+    @abc.abstractmethod
+    def progress(self, batch: int, persisted: int, total: int) -> Dict[str, Any]:
+        pass
+
+    @abc.abstractmethod
+    def done(self, persisted: int) -> Dict[str, Any]:
+        pass
+
+    @abc.abstractmethod
+    def error(self, err: Exception, persisted: int) -> Dict[str, Any]:
+        pass
+
+
+class GenerateScenariosStreamInteractor:
+    """
+    ドメインサービスが遅延生成するシナリオをbatch_size件ずつ保存し、
+    バッチがコミットされるたびにレコード(または進捗)を返すイテレータを作る。
+    保持するのは常に1バッチ分だけなので、最初の応答までの時間とメモリはoutput_countに依存しない。
+    """
+    def __init__(
+        self,
+        repo: ScenarioRepository,
+        presenter: GenerateScenariosStreamPresenter,
+        domain_service: ScenarioGeneratorDomainService,
+        timeout_sec: int = 10,
+    ):
+        self.repo = repo
+        self.presenter = presenter
+        self.domain_service = domain_service
+        self.timeout_sec = timeout_sec
+
+    def execute(
+        self, input_data: GenerateScenariosStreamInput
+    ) -> tuple[Iterator[Dict[str, Any]], Exception | None]:
+        try:
+            if input_data.mode not in STREAM_MODES:
+                raise ValueError(f"mode must be one of {', '.join(STREAM_MODES)}")
+            if not 1 <= input_data.batch_size <= MAX_STREAM_BATCH_SIZE:
+                raise ValueError(f"batch_size must be between 1 and {MAX_STREAM_BATCH_SIZE}")
+
+            config = NewLogGenerationConfig(
+                output_count=input_data.output_count,
+                method_pool=input_data.method_pool,
+                situations=input_data.situations,
+                seed=input_data.seed,
+                method_group_size=input_data.method_group_size,
+            )
+            # 設定の誤りはストリームを開始する前にここで検出し、エラーとして返す
+            scenarios = iter(self.domain_service.generate_scenarios(config))
+
+            return self._stream(scenarios, input_data), None
+
+        except Exception as e:
+            return iter(()), e
+
+    def _stream(
+        self, scenarios: Iterator[Scenario], input_data: GenerateScenariosStreamInput
+    ) -> Iterator[Dict[str, Any]]:
+        persisted = 0
+        batch_no = 0
+        try:
+            while True:
+                batch = list(islice(scenarios, input_data.batch_size))
+                if not batch:
+                    break
+                # create_manyは1バッチを1つのトランザクションで保存する
+                created = self.repo.create_many(batch)
+                persisted += len(created)
+                batch_no += 1
+                if input_data.mode == STREAM_MODE_RECORDS:
+                    for scenario in created:
+                        yield self.presenter.scenario(scenario)
+                else:
+                    yield self.presenter.progress(batch_no, persisted, input_data.output_count)
+        except Exception as e:
+            # ヘッダー送信後はステータスコードを変えられないため、エラーを最後のレコードとして返す
+            yield self.presenter.error(e, persisted)
+            return
+
+        yield self.presenter.done(persisted)
+
+
+def new_generate_scenarios_stream_interactor(
+    repo: ScenarioRepository,
+    presenter: GenerateScenariosStreamPresenter,
+    domain_service: ScenarioGeneratorDomainService,
+    timeout_sec: int,
+) -> GenerateScenariosStreamUseCase:
+    return GenerateScenariosStreamInteractor(
+        repo=repo,
+        presenter=presenter,
+        domain_service=domain_service,
+        timeout_sec=timeout_sec,
+    )
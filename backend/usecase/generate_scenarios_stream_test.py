@@ -0,0 +1,109 @@
+import unittest
+from datetime import datetime
+from typing import Iterator, List
+
+from domain import Scenario, MethodProfile, Situation, LogGenerationConfig, NewUUID
+from adapter.presenter.generate_scenarios_stream_presenter import new_generate_scenarios_stream_presenter
+from .generate_scenarios_stream import (
+    GenerateScenariosStreamInput,
+    new_generate_scenarios_stream_interactor,
+    STREAM_MODE_PROGRESS,
+)
+
+
+class FakeScenarioRepository:
+    def __init__(self, fail_on_call: int = 0):
+        self.batches: List[List[Scenario]] = []
+        self.fail_on_call = fail_on_call
+
+    def create_many(self, scenarios: List[Scenario]) -> List[Scenario]:
+        if self.fail_on_call and len(self.batches) + 1 == self.fail_on_call:
+            raise RuntimeError("db error")
+        self.batches.append(list(scenarios))
+        return scenarios
+
+
+class LazyGeneratorService:
+    """生成済みの件数を記録し、ストリームが遅延して読まれることを確認するためのフェイク"""
+    def __init__(self):
+        self.generated = 0
+
+    def generate_scenarios(self, config: LogGenerationConfig) -> Iterator[Scenario]:
+        for i in range(config.output_count):
+            self.generated += 1
+            yield Scenario(
+                ID=NewUUID(),
+                state=f"state {i}",
+                method_group="a, b",
+                target_method="a",
+                negative_method_group="b",
+                created_at=datetime.now(),
+            )
+
+
+def _input(output_count: int, **kwargs) -> GenerateScenariosStreamInput:
+    return GenerateScenariosStreamInput(
+        output_count=output_count,
+        method_pool=[MethodProfile("a", []), MethodProfile("b", [])],
+        situations=[Situation("user", "env")],
+        **kwargs,
+    )
+
+
+class TestGenerateScenariosStreamInteractor(unittest.TestCase):
+    def setUp(self):
+        self.repo = FakeScenarioRepository()
+        self.service = LazyGeneratorService()
+        self.interactor = new_generate_scenarios_stream_interactor(
+            self.repo, new_generate_scenarios_stream_presenter(), self.service, 10
+        )
+
+    def test_streams_records_as_each_batch_is_persisted(self):
+        stream, err = self.interactor.execute(_input(1_000_000, batch_size=100))
+        self.assertIsNone(err)
+
+        first = next(stream)
+
+        # 最初のレコードは1バッチ分だけ生成・保存した時点で返る
+        self.assertEqual(first["type"], "scenario")
+        self.assertEqual(self.service.generated, 100)
+        self.assertEqual(len(self.repo.batches), 1)
+
+    def test_records_mode_ends_with_done(self):
+        stream, err = self.interactor.execute(_input(25, batch_size=10))
+        self.assertIsNone(err)
+        records = list(stream)
+
+        self.assertEqual([len(b) for b in self.repo.batches], [10, 10, 5])
+        self.assertEqual(sum(1 for r in records if r["type"] == "scenario"), 25)
+        self.assertEqual(records[-1], {"type": "done", "persisted": 25})
+
+    def test_progress_mode_yields_one_event_per_batch(self):
+        stream, err = self.interactor.execute(_input(25, batch_size=10, mode=STREAM_MODE_PROGRESS))
+        self.assertIsNone(err)
+        records = list(stream)
+
+        self.assertEqual([r["persisted"] for r in records if r["type"] == "progress"], [10, 20, 25])
+        self.assertEqual(records[-1]["type"], "done")
+
+    def test_persist_failure_is_reported_as_last_record(self):
+        repo = FakeScenarioRepository(fail_on_call=2)
+        interactor = new_generate_scenarios_stream_interactor(
+            repo, new_generate_scenarios_stream_presenter(), self.service, 10
+        )
+        stream, err = interactor.execute(_input(25, batch_size=10, mode=STREAM_MODE_PROGRESS))
+        self.assertIsNone(err)
+        records = list(stream)
+
+        self.assertEqual(records[-1]["type"], "error")
+        self.assertEqual(records[-1]["persisted"], 10)
+
+    def test_invalid_mode_is_rejected_before_streaming(self):
+        _, err = self.interactor.execute(_input(10, mode="unknown"))
+
+        self.assertIsInstance(err, ValueError)
+        self.assertEqual(self.service.generated, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
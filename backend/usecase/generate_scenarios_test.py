@@ -23,11 +23,17 @@ from .generate_scenarios import (
 class MockScenarioRepository:
     def __init__(self):
         self.created_scenarios = []
+        self.create_many_calls = 0
     
     def create(self, scenario: Scenario) -> Scenario:
         self.created_scenarios.append(scenario)
         return scenario
 
+    def create_many(self, scenarios: List[Scenario]) -> List[Scenario]:
+        self.create_many_calls += 1
+        self.created_scenarios.extend(scenarios)
+        return scenarios
+
 
 class MockGenerateScenariosPresenter(GenerateScenariosPresenter):
     def __init__(self):
@@ -218,6 +224,8 @@ class TestGenerateScenariosInteractor(unittest.TestCase):
         self.assertEqual(outputs[0].method_group, "group1")
         self.assertEqual(outputs[1].method_group, "group2")
         self.assertEqual(len(repo.created_scenarios), 2)
+        # 複数のシナリオは1回のバルク保存でまとめて永続化される
+        self.assertEqual(repo.create_many_calls, 1)
         self.assertEqual(len(presenter.output_calls), 2)
 
     def test_execute_with_exception(self):
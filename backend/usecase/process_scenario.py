@@ -52,18 +52,17 @@ class ProcessScenarioInteractor:
 
     def execute(self, input_data: ProcessScenarioInput) -> tuple[List[ProcessScenarioOutput], Exception | None]:
         try:
-            outputs = []
-            for scenario_id in input_data.scenario_ids:
-                scenario = self.scenario_repo.find_by_id(scenario_id)
-                if not scenario:
-                    continue
+            # 対象のシナリオはIN句でまとめて取得する（存在しないIDは結果に含まれない）
+            scenarios = self.scenario_repo.find_by_ids(input_data.scenario_ids)
 
-                training_ready_scenario = self.domain_service.process_scenario(scenario)
+            training_ready_scenarios = [
+                self.domain_service.process_scenario(scenario) for scenario in scenarios
+            ]
 
-                created_trs = self.trs_repo.create(training_ready_scenario)
+            # 生成したTrainingReadyScenarioは1つのトランザクションでまとめて保存する
+            created_trs_list = self.trs_repo.create_many(training_ready_scenarios)
 
-                output = self.presenter.output(created_trs)
-                outputs.append(output)
+            outputs = [self.presenter.output(trs) for trs in created_trs_list]
 
             return outputs, None
 
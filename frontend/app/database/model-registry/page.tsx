@@ -3,6 +3,8 @@
 import React, { useState, useEffect, useMemo } from 'react';
 import { Header } from "@/app/components/Header";
 import { Footer } from "@/app/components/Footer";
+import { fetchAllPages } from "@/app/lib/fetchAllPages";
+import { bulkDelete } from "@/app/lib/bulkDelete";
 import { 
     SearchIcon, 
     TrashIcon, 
@@ -50,10 +52,8 @@ export default function DatabaseModelsPage() {
     setLoading(true);
     setError(null);
     try {
-      const response = await fetch('http://localhost:8000/v1/models');
-      if (!response.ok) throw new Error(`HTTPエラー: ${response.status}`);
-      const data = await response.json();
-      setModels(Array.isArray(data) ? data : []);
+      const data = await fetchAllPages<Model>('http://localhost:8000/v1/models');
+      setModels(data);
     } catch (err) {
       setError(`モデルデータの取得に失敗しました: ${err instanceof Error ? err.message : String(err)}`);
       setModels([]);
@@ -80,21 +80,19 @@ export default function DatabaseModelsPage() {
 
   const confirmBulkDelete = async () => {
     setError(null);
-    const deletionPromises = selectedIds.map(id => 
-        fetch(`http://localhost:8000/v1/models/${id}`, { method: 'DELETE' })
-    );
     try {
-        const results = await Promise.allSettled(deletionPromises);
-        const successfulDeletes = results.filter(r => r.status === 'fulfilled' && r.value.ok).length;
-        
-        if (successfulDeletes > 0) {
-            setModels(prev => prev.filter(s => !selectedIds.includes(s.ID)));
-            setToast({ message: `${successfulDeletes}件のモデルを削除しました。`, type: 'success' });
+        const { deleted, notFound } = await bulkDelete('http://localhost:8000/v1/models/bulk-delete', selectedIds);
+
+        if (deleted.length > 0) {
+            setModels(prev => {
+                const deletedIds = new Set(deleted);
+                return prev.filter(s => !deletedIds.has(s.ID));
+            });
+            setToast({ message: `${deleted.length}件のモデルを削除しました。`, type: 'success' });
         }
 
-        const failedDeletes = results.length - successfulDeletes;
-        if (failedDeletes > 0) {
-            throw new Error(`${failedDeletes}件のモデル削除に失敗しました。`);
+        if (notFound.length > 0) {
+            throw new Error(`${notFound.length}件のモデルが見つかりませんでした。`);
         }
     } catch (err) {
         setError(err instanceof Error ? err.message : '一括削除中にエラーが発生しました。');
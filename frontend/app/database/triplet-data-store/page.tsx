@@ -3,6 +3,8 @@
 import React, { useState, useEffect, useMemo } from 'react';
 import { Header } from "@/app/components/Header";
 import { Footer } from "@/app/components/Footer";
+import { fetchAllPages } from "@/app/lib/fetchAllPages";
+import { bulkDelete } from "@/app/lib/bulkDelete";
 import { 
     SearchIcon, 
     TrashIcon, 
@@ -80,10 +82,8 @@ export default function DatabaseTripletsPage() {
     setLoading(true);
     setError(null);
     try {
-      const response = await fetch('http://localhost:8000/v1/triplets');
-      if (!response.ok) throw new Error(`HTTPエラー: ${response.status}`);
-      const data = await response.json();
-      setTriplets(Array.isArray(data) ? data : []);
+      const data = await fetchAllPages<Triplet>('http://localhost:8000/v1/triplets');
+      setTriplets(data);
     } catch (err) {
       setError(`Tripletデータの取得に失敗しました: ${err instanceof Error ? err.message : String(err)}`);
       setTriplets([]);
@@ -110,21 +110,19 @@ export default function DatabaseTripletsPage() {
 
   const confirmBulkDelete = async () => {
     setError(null);
-    const deletionPromises = selectedIds.map(id => 
-        fetch(`http://localhost:8000/v1/triplets/${id}`, { method: 'DELETE' })
-    );
     try {
-        const results = await Promise.allSettled(deletionPromises);
-        const successfulDeletes = results.filter(r => r.status === 'fulfilled' && r.value.ok).length;
-        
-        if (successfulDeletes > 0) {
-            setTriplets(prev => prev.filter(s => !selectedIds.includes(s.ID)));
-            setToast({ message: `${successfulDeletes}件のデータを削除しました。`, type: 'success' });
+        const { deleted, notFound } = await bulkDelete('http://localhost:8000/v1/triplets/bulk-delete', selectedIds);
+
+        if (deleted.length > 0) {
+            setTriplets(prev => {
+                const deletedIds = new Set(deleted);
+                return prev.filter(s => !deletedIds.has(s.ID));
+            });
+            setToast({ message: `${deleted.length}件のデータを削除しました。`, type: 'success' });
         }
 
-        const failedDeletes = results.length - successfulDeletes;
-        if (failedDeletes > 0) {
-            throw new Error(`${failedDeletes}件のデータ削除に失敗しました。`);
+        if (notFound.length > 0) {
+            throw new Error(`${notFound.length}件のデータが見つかりませんでした。`);
         }
     } catch (err) {
         setError(err instanceof Error ? err.message : '一括削除中にエラーが発生しました。');
@@ -0,0 +1,23 @@
+export type BulkDeleteResult = {
+  deleted: string[];
+  notFound: string[];
+};
+
+// 一括削除APIに選択したIDをまとめて送り、IDごとの削除結果を返すヘルパー
+export async function bulkDelete(url: string, ids: string[]): Promise<BulkDeleteResult> {
+  const response = await fetch(url, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ ids }),
+  });
+  if (!response.ok) {
+    const errorData = await response.json().catch(() => null);
+    throw new Error(errorData?.error || `HTTPエラー: ${response.status}`);
+  }
+  const data = await response.json();
+  const results: { ID: string; status: string }[] = data.results ?? [];
+  return {
+    deleted: results.filter(r => r.status === 'deleted').map(r => r.ID),
+    notFound: results.filter(r => r.status === 'not_found').map(r => r.ID),
+  };
+}
@@ -0,0 +1,15 @@
+// キーセットページネーションされた一覧APIを、next_cursorがなくなるまで順に取得するヘルパー
+export async function fetchAllPages<T>(url: string, limit: number = 500): Promise<T[]> {
+  const items: T[] = [];
+  let cursor: string | null = null;
+  do {
+    const params = new URLSearchParams({ limit: String(limit) });
+    if (cursor) params.set('cursor', cursor);
+    const response = await fetch(`${url}?${params.toString()}`);
+    if (!response.ok) throw new Error(`HTTPエラー: ${response.status}`);
+    const data = await response.json();
+    if (Array.isArray(data.items)) items.push(...data.items);
+    cursor = data.next_cursor ?? null;
+  } while (cursor);
+  return items;
+}
@@ -3,6 +3,7 @@
 import React, { useState, useEffect, useMemo } from 'react';
 import { Header } from "@/app/components/Header";
 import { Footer } from "@/app/components/Footer";
+import { fetchAllPages } from "@/app/lib/fetchAllPages";
 import { 
     SettingsIcon,
     PlayIcon,
@@ -17,7 +18,7 @@ interface Dataset {
   name: string;
   description: string;
   type: string;
-  Triplet_ids: string[];
+  triplet_count: number;
   created_at: string;
 }
 
@@ -54,10 +55,7 @@ export default function FinetunerPage() {
     setLoadingDatasets(true);
     setError(null);
     try {
-      const response = await fetch('http://localhost:8000/v1/datasets');
-      if (!response.ok) throw new Error(`HTTPエラー: ${response.status}`);
-      const data = await response.json();
-      const validDatasets = Array.isArray(data) ? data : [];
+      const validDatasets = await fetchAllPages<Dataset>('http://localhost:8000/v1/datasets');
       setDatasets(validDatasets);
       // 最初のデータセットをデフォルトで選択
       if (validDatasets.length > 0 && !config.dataset_id) {
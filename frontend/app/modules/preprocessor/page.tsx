@@ -2,6 +2,7 @@
 
 import { Header } from "@/app/components/Header";
 import { Footer } from "@/app/components/Footer";
+import { fetchAllPages } from "@/app/lib/fetchAllPages";
 import React, { useState, useEffect, useMemo } from 'react';
 // 外部ファイルからアイコンコンポーネントをインポート
 import {
@@ -50,11 +51,7 @@ export default function PreprocessorPage() {
     setLoading(true);
     setError(null);
     try {
-      const response = await fetch('http://localhost:8000/v1/scenarios');
-      if (!response.ok) {
-        throw new Error(`HTTPエラー: ${response.status}`);
-      }
-      const data = await response.json();
+      const data = await fetchAllPages<Scenario>('http://localhost:8000/v1/scenarios');
       setScenarios(data);
     } catch (err) {
       setError(`シナリオの取得に失敗しました: ${err instanceof Error ? err.message : String(err)}`);
@@ -3,6 +3,7 @@
 import React, { useState, useEffect, useMemo } from 'react';
 import { Header } from "@/app/components/Header";
 import { Footer } from "@/app/components/Footer";
+import { fetchAllPages } from "@/app/lib/fetchAllPages";
 import { 
     SearchIcon, 
     TrashIcon, 
@@ -74,10 +75,8 @@ export default function TripletConverterPage() {
     setLoading(true);
     setError(null);
     try {
-      const response = await fetch('http://localhost:8000/v1/processed-scenarios');
-      if (!response.ok) throw new Error(`HTTPエラー: ${response.status}`);
-      const data = await response.json();
-      setScenarios(Array.isArray(data) ? data : []);
+      const data = await fetchAllPages<ProcessedScenario>('http://localhost:8000/v1/processed-scenarios');
+      setScenarios(data);
     } catch (err) {
       setError(`ログの取得に失敗しました: ${err instanceof Error ? err.message : String(err)}`);
       setScenarios([]);
@@ -94,23 +93,22 @@ export default function TripletConverterPage() {
     setProcessing(true);
     setError(null);
     
-    const conversionPromises = selectedIds.map(id => 
-        fetch('http://localhost:8000/v1/triplets/form', {
+    try {
+        // 選択したシナリオをまとめて1回のリクエストで変換する
+        const response = await fetch('http://localhost:8000/v1/triplets/form-batch', {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({ training_ready_scenario_id: id })
-        })
-    );
-
-    try {
-        const results = await Promise.allSettled(conversionPromises);
-        const successfulConversions = results.filter(r => r.status === 'fulfilled' && r.value.ok).length;
+            body: JSON.stringify({ training_ready_scenario_ids: selectedIds })
+        });
+        if (!response.ok) throw new Error(`HTTPエラー: ${response.status}`);
+        const data = await response.json();
+        const successfulConversions = Array.isArray(data.triplets) ? data.triplets.length : 0;
         
         if (successfulConversions > 0) {
-            setToast({ message: `${successfulConversions}件の変換リクエストを送信しました。`, type: 'success' });
+            setToast({ message: `${successfulConversions}件のTripletを作成しました。`, type: 'success' });
         }
 
-        const failedConversions = results.length - successfulConversions;
+        const failedConversions = Array.isArray(data.skipped_ids) ? data.skipped_ids.length : 0;
         if (failedConversions > 0) {
             throw new Error(`${failedConversions}件の変換に失敗しました。`);
         }